@@ -1,57 +1,75 @@
 """Check Blender 5.x API for shader node compatibility."""
 import bpy
+from functools import lru_cache
 
-bpy.ops.mesh.primitive_cube_add()
-obj = bpy.context.active_object
-mat = bpy.data.materials.new('test')
-mat.use_nodes = True
-nodes = mat.node_tree.nodes
-
-# Check if Musgrave Texture node still exists
-try:
-    m = nodes.new('ShaderNodeTexMusgrave')
-    print(f'MUSGRAVE: EXISTS (type={m.bl_idname})')
-    nodes.remove(m)
-except Exception as e:
-    print(f'MUSGRAVE: REMOVED ({e})')
-
-# Check Noise Texture and noise_type options
-n = nodes.new('ShaderNodeTexNoise')
-print(f'NOISE: {n.bl_idname}')
-if hasattr(n, 'noise_type'):
-    items = [e.identifier for e in n.bl_rna.properties['noise_type'].enum_items]
-    print(f'NOISE_TYPE OPTIONS: {items}')
-else:
-    print('NOISE_TYPE: not found as attribute')
-    # Check all properties
-    props = [p.identifier for p in n.bl_rna.properties]
-    print(f'NOISE PROPS: {props}')
-
-nodes.remove(n)
-
-# Check Voronoi
-v = nodes.new('ShaderNodeTexVoronoi')
-print(f'VORONOI: {v.bl_idname}')
-nodes.remove(v)
-
-# Check Wave
-w = nodes.new('ShaderNodeTexWave')
-print(f'WAVE: {w.bl_idname}')
-nodes.remove(w)
-
-# Check Principled BSDF input names
-p = nodes.get('Principled BSDF')
-if p:
+
+@lru_cache(maxsize=None)
+def node_class(idname):
+    """Return the registered node class for idname, or None if it was removed."""
+    return bpy.types.Node.bl_rna_get_subclass_py(idname)
+
+
+def node_exists(idname):
+    """Check whether a node type is registered, without instantiating it."""
+    return node_class(idname) is not None
+
+
+@lru_cache(maxsize=None)
+def enum_options(idname, prop):
+    """Return the enum identifiers of a node property, or None if it is missing."""
+    rna_prop = node_class(idname).bl_rna.properties.get(prop)
+    if rna_prop is None:
+        return None
+    return tuple(e.identifier for e in rna_prop.enum_items)
+
+
+def run_checks():
+    """Print node, Principled and bake API availability."""
+    # Check if Musgrave Texture node still exists (removed in 4.1)
+    if node_exists('ShaderNodeTexMusgrave'):
+        print('MUSGRAVE: EXISTS (type=ShaderNodeTexMusgrave)')
+    else:
+        print('MUSGRAVE: REMOVED')
+
+    # Check Noise Texture and noise_type options
+    print(f'NOISE: {node_class("ShaderNodeTexNoise").bl_rna.identifier}')
+    items = enum_options('ShaderNodeTexNoise', 'noise_type')
+    if items is not None:
+        print(f'NOISE_TYPE OPTIONS: {list(items)}')
+    else:
+        print('NOISE_TYPE: not found as attribute')
+        # Check all properties
+        props = [p.identifier for p in node_class('ShaderNodeTexNoise').bl_rna.properties]
+        print(f'NOISE PROPS: {props}')
+
+    # Check Voronoi
+    print(f'VORONOI: {node_class("ShaderNodeTexVoronoi").bl_rna.identifier}')
+
+    # Check Wave
+    print(f'WAVE: {node_class("ShaderNodeTexWave").bl_rna.identifier}')
+
+    # Check Principled BSDF input names. Sockets only exist on node instances,
+    # so build one in a throwaway shader node group (cheaper than a material).
+    tree = bpy.data.node_groups.new('api_check', 'ShaderNodeTree')
+    p = tree.nodes.new('ShaderNodeBsdfPrincipled')
     names = [inp.name for inp in p.inputs]
     print(f'PRINCIPLED INPUTS: {names}')
-else:
-    print('PRINCIPLED BSDF: not found in default material')
 
-# Check bake API
-print(f'BAKE OPS: {hasattr(bpy.ops.object, "bake")}')
+    # Check bake API
+    print(f'BAKE OPS: {hasattr(bpy.ops.object, "bake")}')
+
+    # Cleanup
+    bpy.data.node_groups.remove(tree)
+
 
-# Cleanup
-bpy.data.objects.remove(obj)
-bpy.data.materials.remove(mat)
+# Run inside a scratch scene so the default scene is never tagged for update
+scratch = bpy.data.scenes.new('api_check_scratch')
+with bpy.context.temp_override(
+    scene=scratch,
+    view_layer=scratch.view_layers[0],
+    collection=scratch.collection,
+):
+    run_checks()
+bpy.data.scenes.remove(scratch)
 
 print('API CHECK COMPLETE')
@@ -0,0 +1,59 @@
+"""
+Run the standalone prop scripts in scripts/blender/props/ in parallel.
+
+Each script builds, bakes and exports one prop on its own, so they are
+independent: the batch launches one background Blender per script, up to
+-j at a time (by default lib.batch.default_jobs: one at a time on a GPU,
+half the cores on the CPU).
+
+Usage:
+  blender --background --factory-startup --python scripts/blender/bake_all.py
+  blender --background --factory-startup --python scripts/blender/bake_all.py -- -j 4
+  blender --background --factory-startup --python scripts/blender/bake_all.py -- ironwood_column
+"""
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from lib.batch import default_jobs, run_blender, run_parallel
+
+PROPS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'props')
+SCRIPT_NAMES = tuple(sorted(
+    f[:-3] for f in os.listdir(PROPS_DIR) if f.endswith('.py') and not f.startswith('_')
+))
+SCRIPT_NAMES_STR = ', '.join(SCRIPT_NAMES)
+
+
+def run_script(name, threads):
+    """Run one prop script in a background Blender; return its exit code."""
+    returncode, last_line = run_blender(os.path.join(PROPS_DIR, f'{name}.py'), threads=threads)
+    if returncode != 0:
+        print(f"[{name}] FAILED: exited with code {returncode}: {last_line or 'no output'}")
+    return returncode
+
+
+if __name__ == '__main__':
+    argv = sys.argv
+    args = argv[argv.index('--') + 1:] if '--' in argv else []
+
+    jobs = None
+    if args[:1] in (['-j'], ['--jobs']) and len(args) > 1:
+        jobs = max(1, int(args[1]))
+        args = args[2:]
+
+    names = args or list(SCRIPT_NAMES)
+    unknown = [name for name in names if name not in SCRIPT_NAMES]
+    if unknown:
+        print(f"ERROR: Unknown script(s) {', '.join(repr(n) for n in unknown)}")
+        print(f"Available: {SCRIPT_NAMES_STR}")
+        sys.exit(1)
+
+    start = time.time()
+    codes = run_parallel(run_script, names, jobs or default_jobs())
+    failed = sorted(name for name, code in codes.items() if code != 0)
+    print(f"\nRan {len(codes)} prop script(s) in {time.time() - start:.1f}s")
+    if failed:
+        print(f"ERRORS: {', '.join(failed)}")
+        sys.exit(1)
@@ -1,7 +1,12 @@
 import bpy
+import sys
 props = bpy.ops.export_scene.gltf.get_rna_type().properties
+rows = []
 for p in props:
-    print(f"{p.identifier}: {p.type}")
-    if hasattr(p, 'enum_items'):
-        for item in p.enum_items:
-            print(f"  - {item.identifier}: {item.name}")
+    rows.append(f"{p.identifier}: {p.type}")
+    enum_items = getattr(p, 'enum_items', None)
+    if enum_items:
+        rows.extend(f"  - {item.identifier}: {item.name}" for item in enum_items)
+rows.append('')
+sys.stdout.write('\n'.join(rows))
+sys.stdout.flush()
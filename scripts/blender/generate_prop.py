@@ -1,66 +1,76 @@
 """
-Generate a single prop by name.
+Generate props by name.
+
+Several props (or 'all') can be generated in one Blender process, which
+pays the Blender startup cost once instead of once per prop.
+
+Batches are split across parallel background Blender workers, each of
+which starts once and generates its share of the props in turn. Pass
+-j 1 to generate them sequentially in this process instead; that is also
+the default when bakes run on a GPU (see lib.batch.default_jobs).
 
 Usage:
-  blender --background --factory-startup --python scripts/blender/generate_prop.py -- <prop-name>
+  blender --background --factory-startup --python scripts/blender/generate_prop.py -- <prop-name> [<prop-name> ...]
+  blender --background --factory-startup --python scripts/blender/generate_prop.py -- all
+  blender --background --factory-startup --python scripts/blender/generate_prop.py -- -j 4 all
 
 Example:
   blender --background --factory-startup --python scripts/blender/generate_prop.py -- stone-hearth
+  blender --background --factory-startup --python scripts/blender/generate_prop.py -- goblet plate wine-jug
 """
 import bpy
 import sys
 import os
+import json
 import time
 
 # Add parent dir to path so we can import lib
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# lib modules only define functions and constants at import time; each
+# batch worker imports them once for its whole share of props
 from lib.mesh_ops import (
-    clean_scene, add_bevel, smooth_shade, smart_uv_unwrap,
-    remove_doubles, join_objects, set_origin_base_center,
-    create_cylinder_section, create_box,
+    clean_scene, add_bevel, smooth_shade, smart_uv_unwrap, box_uv_unwrap,
+)
+from lib.mesh_buffers import MeshBuffer, ring_offsets, unit_arc
+from lib.materials import (
+    create_northern_stone, create_ironwood, create_dark_iron, create_leather,
+    get_or_create_simple_pbr,
 )
-from lib.materials import create_northern_stone, create_ironwood, create_dark_iron, create_leather
+from lib import mesh_cache
 from lib.bake import bake_pbr, replace_material_with_baked
+from lib.batch import default_jobs, run_blender, run_parallel
 from lib.export import prepare_for_export, export_glb
-from lib.conventions import (
-    MODEL_OUTPUT_DIR, TEX_PROP_LARGE, TEX_PROP_SMALL,
-    BUDGET_SMALL, BUDGET_MEDIUM, BUDGET_LARGE,
-)
+from lib.conventions import MODEL_OUTPUT_DIR, TEX_PROP_LARGE, TEX_PROP_SMALL
 
-import bmesh
-import math
+import numpy as np
 
 
 # ═══════════════════════════════════════════════════════════════════════
-# PROP GENERATORS — each returns the final object ready for baking
+# PROP GENERATORS — each returns the final (unlinked) object ready for baking
 # ═══════════════════════════════════════════════════════════════════════
 
 def gen_stone_hearth():
     """Stone fireplace with carved opening, chimney breast detail."""
     mesh = bpy.data.meshes.new('hearth_mesh')
-    bm = bmesh.new()
+    buf = MeshBuffer()
 
     # Back wall slab
-    create_box(bm, 4.0, 3.0, 0.4, z=0, y=-0.2)
-    # Left pillar
-    create_box(bm, 0.5, 3.0, 0.8, x=-2.0, z=0)
-    # Right pillar
-    create_box(bm, 0.5, 3.0, 0.8, x=2.0, z=0)
+    buf.add_box(4.0, 3.0, 0.4, z=0, y=-0.2)
+    # Left/right pillars
+    buf.add_box_grid(0.5, 3.0, 0.8, xs=(-2.0, 2.0))
     # Mantel / lintel
-    create_box(bm, 5.0, 0.4, 1.0, z=3.0)
+    buf.add_box(5.0, 0.4, 1.0, z=3.0)
     # Hearth floor
-    create_box(bm, 3.5, 0.15, 0.8, z=0, y=0.1)
+    buf.add_box(3.5, 0.15, 0.8, z=0, y=0.1)
     # Chimney breast above mantel
-    create_box(bm, 3.0, 2.0, 0.5, z=3.4, y=-0.1)
+    buf.add_box(3.0, 2.0, 0.5, z=3.4, y=-0.1)
     # Firebox back (inner)
-    create_box(bm, 2.8, 2.0, 0.2, z=0.15, y=-0.05)
+    buf.add_box(2.8, 2.0, 0.2, z=0.15, y=-0.05)
 
-    bm.to_mesh(mesh)
-    bm.free()
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('stone_hearth', mesh)
-    bpy.context.collection.objects.link(obj)
     mat = create_northern_stone('HearthStone', scale=3.0)
     obj.data.materials.append(mat)
     return obj, TEX_PROP_LARGE
@@ -69,18 +79,16 @@ def gen_stone_hearth():
 def gen_raised_dais():
     """Two-tier stone platform with edge steps."""
     mesh = bpy.data.meshes.new('dais_mesh')
-    bm = bmesh.new()
+    buf = MeshBuffer()
 
     # Lower tier - wider
-    create_box(bm, 6.0, 0.15, 4.0, z=0)
+    buf.add_box(6.0, 0.15, 4.0, z=0)
     # Upper tier - narrower
-    create_box(bm, 5.0, 0.15, 3.5, z=0.15)
+    buf.add_box(5.0, 0.15, 3.5, z=0.15)
 
-    bm.to_mesh(mesh)
-    bm.free()
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('raised_dais', mesh)
-    bpy.context.collection.objects.link(obj)
     mat = create_northern_stone('DaisStone', scale=5.0)
     obj.data.materials.append(mat)
     return obj, TEX_PROP_LARGE
@@ -89,38 +97,32 @@ def gen_raised_dais():
 def gen_stone_arch():
     """Pointed arch for doorways and wall recesses."""
     mesh = bpy.data.meshes.new('arch_mesh')
-    bm = bmesh.new()
+    buf = MeshBuffer()
 
     # Two vertical columns
-    create_box(bm, 0.4, 3.0, 0.4, x=-1.2, z=0)
-    create_box(bm, 0.4, 3.0, 0.4, x=1.2, z=0)
+    buf.add_box_grid(0.4, 3.0, 0.4, xs=(-1.2, 1.2))
 
     # Arch top - approximated with angled segments
     arch_segments = 8
     arch_height = 1.0
     arch_width = 2.4
     arch_depth = 0.4
-    for i in range(arch_segments):
-        t0 = i / arch_segments
-        t1 = (i + 1) / arch_segments
-        angle0 = math.pi * t0
-        angle1 = math.pi * t1
-        x0 = -math.cos(angle0) * (arch_width / 2)
-        z0 = 3.0 + math.sin(angle0) * arch_height
-        x1 = -math.cos(angle1) * (arch_width / 2)
-        z1 = 3.0 + math.sin(angle1) * arch_height
-        # Each arch segment as a small box (approximate)
-        cx = (x0 + x1) / 2
-        cz = (z0 + z1) / 2
-        seg_width = max(abs(x1 - x0), 0.15)
-        seg_height = max(abs(z1 - z0), 0.15)
-        create_box(bm, seg_width + 0.2, seg_height + 0.1, arch_depth, x=cx, z=cz)
-
-    bm.to_mesh(mesh)
-    bm.free()
+    cos, sin = unit_arc(arch_segments).T
+    x = -cos * (arch_width / 2)
+    z = 3.0 + sin * arch_height
+    # Each arch segment as a small box (approximate)
+    cx = (x[:-1] + x[1:]) / 2
+    cz = (z[:-1] + z[1:]) / 2
+    seg_width = np.maximum(np.abs(np.diff(x)), 0.15)
+    seg_height = np.maximum(np.abs(np.diff(z)), 0.15)
+    buf.add_box_array(
+        seg_width + 0.2, seg_height + 0.1, arch_depth,
+        np.stack([cx, np.zeros(arch_segments), cz], axis=1),
+    )
+
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('stone_arch', mesh)
-    bpy.context.collection.objects.link(obj)
     mat = create_northern_stone('ArchStone', scale=4.0)
     obj.data.materials.append(mat)
     return obj, TEX_PROP_LARGE
@@ -129,41 +131,41 @@ def gen_stone_arch():
 def gen_stone_pilaster():
     """Wall-attached half-column for wall articulation."""
     mesh = bpy.data.meshes.new('pilaster_mesh')
-    bm = bmesh.new()
+    buf = MeshBuffer()
 
     # Half-cylinder shape (flat back against wall)
     segments = 8
     radius = 0.25
     height = 3.5
 
-    # Create half-cylinder verts
-    verts_b = []
-    verts_t = []
-    for i in range(segments + 1):
-        angle = math.pi * i / segments  # 0 to pi (half circle)
-        x = radius * math.cos(angle)
-        y = radius * math.sin(angle)
-        verts_b.append(bm.verts.new((x, y, 0)))
-        verts_t.append(bm.verts.new((x, y, height)))
+    # Create half-cylinder verts (bottom row, then top row)
+    verts_b = np.zeros((segments + 1, 3), dtype=np.float32)
+    verts_b[:, :2] = radius * unit_arc(segments)  # 0 to pi (half circle)
+    verts_t = verts_b + np.array((0, 0, height), dtype=np.float32)
 
     # Side faces
-    for i in range(segments):
-        bm.faces.new([verts_b[i], verts_b[i+1], verts_t[i+1], verts_t[i]])
+    i = np.arange(segments, dtype=np.int32)
+    top = segments + 1
+    sides = np.stack([i, i + 1, i + 1 + top, i + top], axis=1).ravel()
 
     # Flat back face
-    bm.faces.new(verts_b)
-    bm.faces.new(list(reversed(verts_t)))
+    bottom_cap = np.arange(segments + 1, dtype=np.int32)
+    top_cap = bottom_cap[::-1] + top
+
+    buf.add(
+        np.concatenate([verts_b, verts_t]),
+        np.concatenate([sides, bottom_cap, top_cap]),
+        np.array([4] * segments + [segments + 1, segments + 1], dtype=np.int32),
+    )
 
     # Base cap
-    create_box(bm, 0.6, 0.3, 0.3, z=0)
+    buf.add_box(0.6, 0.3, 0.3, z=0)
     # Capital
-    create_box(bm, 0.6, 0.3, 0.3, z=height)
+    buf.add_box(0.6, 0.3, 0.3, z=height)
 
-    bm.to_mesh(mesh)
-    bm.free()
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('stone_pilaster', mesh)
-    bpy.context.collection.objects.link(obj)
     mat = create_northern_stone('PilasterStone', scale=4.0)
     obj.data.materials.append(mat)
     return obj, TEX_PROP_LARGE
@@ -172,18 +174,16 @@ def gen_stone_pilaster():
 def gen_corbel_bracket():
     """Stone bracket supporting roof beams."""
     mesh = bpy.data.meshes.new('corbel_mesh')
-    bm = bmesh.new()
+    buf = MeshBuffer()
 
     # Simple stepped bracket shape
-    create_box(bm, 0.4, 0.3, 0.2, z=0)       # base
-    create_box(bm, 0.5, 0.4, 0.2, z=0.3, y=0.05)  # step out
-    create_box(bm, 0.6, 0.5, 0.15, z=0.7, y=0.1)   # wider support
+    buf.add_box(0.4, 0.3, 0.2, z=0)       # base
+    buf.add_box(0.5, 0.4, 0.2, z=0.3, y=0.05)  # step out
+    buf.add_box(0.6, 0.5, 0.15, z=0.7, y=0.1)   # wider support
 
-    bm.to_mesh(mesh)
-    bm.free()
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('corbel_bracket', mesh)
-    bpy.context.collection.objects.link(obj)
     mat = create_northern_stone('CorbelStone', scale=6.0)
     obj.data.materials.append(mat)
     return obj, TEX_PROP_SMALL
@@ -192,28 +192,24 @@ def gen_corbel_bracket():
 def gen_stone_window_frame():
     """Mullioned window frame with stone surround."""
     mesh = bpy.data.meshes.new('window_mesh')
-    bm = bmesh.new()
+    buf = MeshBuffer()
 
     # Outer frame
     frame_w, frame_h, frame_d = 2.0, 2.5, 0.3
-    # Left
-    create_box(bm, 0.2, frame_h, frame_d, x=-frame_w/2)
-    # Right
-    create_box(bm, 0.2, frame_h, frame_d, x=frame_w/2)
+    # Left/right jambs
+    buf.add_box_grid(0.2, frame_h, frame_d, xs=(-frame_w/2, frame_w/2))
     # Top
-    create_box(bm, frame_w + 0.2, 0.2, frame_d, z=frame_h)
+    buf.add_box(frame_w + 0.2, 0.2, frame_d, z=frame_h)
     # Sill
-    create_box(bm, frame_w + 0.4, 0.15, frame_d + 0.1, z=0)
+    buf.add_box(frame_w + 0.4, 0.15, frame_d + 0.1, z=0)
     # Center mullion
-    create_box(bm, 0.1, frame_h, 0.15, x=0)
+    buf.add_box(0.1, frame_h, 0.15, x=0)
     # Transom bar
-    create_box(bm, frame_w, 0.1, 0.15, z=frame_h * 0.6)
+    buf.add_box(frame_w, 0.1, 0.15, z=frame_h * 0.6)
 
-    bm.to_mesh(mesh)
-    bm.free()
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('stone_window_frame', mesh)
-    bpy.context.collection.objects.link(obj)
     mat = create_northern_stone('WindowStone', scale=3.0)
     obj.data.materials.append(mat)
     return obj, TEX_PROP_LARGE
@@ -222,28 +218,22 @@ def gen_stone_window_frame():
 def gen_door_frame():
     """Heavy oak door frame with iron studs feel."""
     mesh = bpy.data.meshes.new('door_mesh')
-    bm = bmesh.new()
+    buf = MeshBuffer()
 
     # Door frame in ironwood
     frame_w, frame_h = 2.0, 3.5
-    # Left post
-    create_box(bm, 0.25, frame_h, 0.3, x=-frame_w/2)
-    # Right post
-    create_box(bm, 0.25, frame_h, 0.3, x=frame_w/2)
+    # Left/right posts
+    buf.add_box_grid(0.25, frame_h, 0.3, xs=(-frame_w/2, frame_w/2))
     # Lintel
-    create_box(bm, frame_w + 0.3, 0.3, 0.35, z=frame_h)
+    buf.add_box(frame_w + 0.3, 0.3, 0.35, z=frame_h)
     # Door planks (two halves)
-    create_box(bm, 0.9, frame_h - 0.1, 0.08, x=-0.5, z=0.05)
-    create_box(bm, 0.9, frame_h - 0.1, 0.08, x=0.5, z=0.05)
+    buf.add_box_grid(0.9, frame_h - 0.1, 0.08, xs=(-0.5, 0.5), zs=0.05)
     # Cross braces
-    create_box(bm, 1.8, 0.15, 0.12, z=0.8)
-    create_box(bm, 1.8, 0.15, 0.12, z=2.2)
+    buf.add_box_grid(1.8, 0.15, 0.12, zs=(0.8, 2.2))
 
-    bm.to_mesh(mesh)
-    bm.free()
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('door_frame', mesh)
-    bpy.context.collection.objects.link(obj)
     mat = create_ironwood('DoorIronwood')
     obj.data.materials.append(mat)
     return obj, TEX_PROP_LARGE
@@ -252,29 +242,24 @@ def gen_door_frame():
 def gen_ironwood_throne():
     """Throne with dire wolf carving detail, ironwood grain, leather cushion."""
     mesh = bpy.data.meshes.new('throne_mesh')
-    bm = bmesh.new()
+    buf = MeshBuffer()
 
     # Seat
-    create_box(bm, 1.2, 0.15, 1.0, z=1.0)
+    buf.add_box(1.2, 0.15, 1.0, z=1.0)
     # Backrest (tall)
-    create_box(bm, 1.2, 2.0, 0.15, z=1.1, y=-0.425)
+    buf.add_box(1.2, 2.0, 0.15, z=1.1, y=-0.425)
     # Armrests
-    create_box(bm, 0.12, 0.6, 0.8, x=-0.54, z=1.1, y=0.05)
-    create_box(bm, 0.12, 0.6, 0.8, x=0.54, z=1.1, y=0.05)
+    buf.add_box_grid(0.12, 0.6, 0.8, xs=(-0.54, 0.54), ys=0.05, zs=1.1)
     # Front legs
-    create_box(bm, 0.12, 1.0, 0.12, x=-0.5, z=0, y=0.4)
-    create_box(bm, 0.12, 1.0, 0.12, x=0.5, z=0, y=0.4)
+    buf.add_box_grid(0.12, 1.0, 0.12, xs=(-0.5, 0.5), ys=0.4)
     # Back legs (taller)
-    create_box(bm, 0.12, 3.0, 0.12, x=-0.5, z=0, y=-0.4)
-    create_box(bm, 0.12, 3.0, 0.12, x=0.5, z=0, y=-0.4)
+    buf.add_box_grid(0.12, 3.0, 0.12, xs=(-0.5, 0.5), ys=-0.4)
     # Crown detail on backrest
-    create_box(bm, 0.8, 0.3, 0.18, z=2.9, y=-0.425)
+    buf.add_box(0.8, 0.3, 0.18, z=2.9, y=-0.425)
 
-    bm.to_mesh(mesh)
-    bm.free()
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('ironwood_throne', mesh)
-    bpy.context.collection.objects.link(obj)
     mat = create_ironwood('ThroneIronwood')
     obj.data.materials.append(mat)
     return obj, TEX_PROP_LARGE
@@ -283,32 +268,26 @@ def gen_ironwood_throne():
 def gen_long_table():
     """Trestle table with cross-beams and worn surface."""
     mesh = bpy.data.meshes.new('table_mesh')
-    bm = bmesh.new()
+    buf = MeshBuffer()
 
     table_w, table_h, table_d = 6.0, 0.12, 1.4
     leg_h = 0.9
 
     # Table top
-    create_box(bm, table_w, table_h, table_d, z=leg_h)
+    buf.add_box(table_w, table_h, table_d, z=leg_h)
     # Trestle legs (A-frame pairs at each end and middle)
-    for x_pos in [-2.5, 0, 2.5]:
-        # Legs
-        create_box(bm, 0.1, leg_h, 0.1, x=x_pos - 0.5, z=0, y=-0.4)
-        create_box(bm, 0.1, leg_h, 0.1, x=x_pos + 0.5, z=0, y=-0.4)
-        create_box(bm, 0.1, leg_h, 0.1, x=x_pos - 0.5, z=0, y=0.4)
-        create_box(bm, 0.1, leg_h, 0.1, x=x_pos + 0.5, z=0, y=0.4)
-        # Cross beam
-        create_box(bm, 1.2, 0.1, 0.1, x=x_pos, z=0.3)
+    trestle_xs = [-2.5, 0, 2.5]
+    leg_xs = np.add.outer(trestle_xs, (-0.5, 0.5)).ravel()
+    buf.add_box_grid(0.1, leg_h, 0.1, xs=leg_xs, ys=(-0.4, 0.4))
+    # Cross beams
+    buf.add_boxes(1.2, 0.1, 0.1, [(x_pos, 0, 0.3) for x_pos in trestle_xs])
 
     # Stretcher rails along length
-    create_box(bm, table_w - 0.5, 0.08, 0.08, z=0.2, y=-0.4)
-    create_box(bm, table_w - 0.5, 0.08, 0.08, z=0.2, y=0.4)
+    buf.add_box_grid(table_w - 0.5, 0.08, 0.08, ys=(-0.4, 0.4), zs=0.2)
 
-    bm.to_mesh(mesh)
-    bm.free()
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('long_table', mesh)
-    bpy.context.collection.objects.link(obj)
     mat = create_ironwood('TableIronwood', grain_density=2.0)
     obj.data.materials.append(mat)
     return obj, TEX_PROP_LARGE
@@ -317,23 +296,18 @@ def gen_long_table():
 def gen_bench():
     """Simple bench with aged wood."""
     mesh = bpy.data.meshes.new('bench_mesh')
-    bm = bmesh.new()
+    buf = MeshBuffer()
 
     # Seat plank
-    create_box(bm, 2.0, 0.08, 0.4, z=0.45)
+    buf.add_box(2.0, 0.08, 0.4, z=0.45)
     # Legs (4x)
-    create_box(bm, 0.08, 0.45, 0.08, x=-0.85, z=0, y=-0.12)
-    create_box(bm, 0.08, 0.45, 0.08, x=0.85, z=0, y=-0.12)
-    create_box(bm, 0.08, 0.45, 0.08, x=-0.85, z=0, y=0.12)
-    create_box(bm, 0.08, 0.45, 0.08, x=0.85, z=0, y=0.12)
+    buf.add_box_grid(0.08, 0.45, 0.08, xs=(-0.85, 0.85), ys=(-0.12, 0.12))
     # Stretcher
-    create_box(bm, 1.7, 0.06, 0.06, z=0.15)
+    buf.add_box(1.7, 0.06, 0.06, z=0.15)
 
-    bm.to_mesh(mesh)
-    bm.free()
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('bench', mesh)
-    bpy.context.collection.objects.link(obj)
     mat = create_ironwood('BenchWood', grain_density=2.5)
     obj.data.materials.append(mat)
     return obj, TEX_PROP_LARGE
@@ -342,27 +316,22 @@ def gen_bench():
 def gen_high_seat():
     """Wider chair with armrests."""
     mesh = bpy.data.meshes.new('seat_mesh')
-    bm = bmesh.new()
+    buf = MeshBuffer()
 
     # Seat
-    create_box(bm, 0.8, 0.1, 0.7, z=0.8)
+    buf.add_box(0.8, 0.1, 0.7, z=0.8)
     # Backrest
-    create_box(bm, 0.8, 1.2, 0.1, z=0.85, y=-0.3)
+    buf.add_box(0.8, 1.2, 0.1, z=0.85, y=-0.3)
     # Armrests
-    create_box(bm, 0.08, 0.4, 0.5, x=-0.36, z=0.85, y=0.05)
-    create_box(bm, 0.08, 0.4, 0.5, x=0.36, z=0.85, y=0.05)
+    buf.add_box_grid(0.08, 0.4, 0.5, xs=(-0.36, 0.36), ys=0.05, zs=0.85)
     # Front legs
-    create_box(bm, 0.08, 0.8, 0.08, x=-0.32, z=0, y=0.25)
-    create_box(bm, 0.08, 0.8, 0.08, x=0.32, z=0, y=0.25)
+    buf.add_box_grid(0.08, 0.8, 0.08, xs=(-0.32, 0.32), ys=0.25)
     # Back legs
-    create_box(bm, 0.08, 2.0, 0.08, x=-0.32, z=0, y=-0.25)
-    create_box(bm, 0.08, 2.0, 0.08, x=0.32, z=0, y=-0.25)
+    buf.add_box_grid(0.08, 2.0, 0.08, xs=(-0.32, 0.32), ys=-0.25)
 
-    bm.to_mesh(mesh)
-    bm.free()
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('high_seat', mesh)
-    bpy.context.collection.objects.link(obj)
     mat = create_ironwood('SeatIronwood')
     obj.data.materials.append(mat)
     return obj, TEX_PROP_LARGE
@@ -371,20 +340,16 @@ def gen_high_seat():
 def gen_chair():
     """Small chair."""
     mesh = bpy.data.meshes.new('chair_mesh')
-    bm = bmesh.new()
+    buf = MeshBuffer()
 
-    create_box(bm, 0.5, 0.08, 0.5, z=0.55)
-    create_box(bm, 0.5, 0.9, 0.08, z=0.6, y=-0.21)
-    create_box(bm, 0.06, 0.55, 0.06, x=-0.2, z=0, y=0.18)
-    create_box(bm, 0.06, 0.55, 0.06, x=0.2, z=0, y=0.18)
-    create_box(bm, 0.06, 1.5, 0.06, x=-0.2, z=0, y=-0.18)
-    create_box(bm, 0.06, 1.5, 0.06, x=0.2, z=0, y=-0.18)
+    buf.add_box(0.5, 0.08, 0.5, z=0.55)
+    buf.add_box(0.5, 0.9, 0.08, z=0.6, y=-0.21)
+    buf.add_box_grid(0.06, 0.55, 0.06, xs=(-0.2, 0.2), ys=0.18)
+    buf.add_box_grid(0.06, 1.5, 0.06, xs=(-0.2, 0.2), ys=-0.18)
 
-    bm.to_mesh(mesh)
-    bm.free()
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('chair', mesh)
-    bpy.context.collection.objects.link(obj)
     mat = create_ironwood('ChairWood', grain_density=2.5)
     obj.data.materials.append(mat)
     return obj, TEX_PROP_SMALL
@@ -393,19 +358,16 @@ def gen_chair():
 def gen_sideboard():
     """Wall-side serving table."""
     mesh = bpy.data.meshes.new('sideboard_mesh')
-    bm = bmesh.new()
+    buf = MeshBuffer()
 
-    create_box(bm, 2.0, 0.1, 0.6, z=0.85)
-    create_box(bm, 1.9, 0.85, 0.05, z=0, y=-0.275)  # back panel
-    create_box(bm, 0.08, 0.85, 0.55, x=-0.9, z=0)     # left side
-    create_box(bm, 0.08, 0.85, 0.55, x=0.9, z=0)      # right side
-    create_box(bm, 1.8, 0.08, 0.5, z=0.4)              # shelf
+    buf.add_box(2.0, 0.1, 0.6, z=0.85)
+    buf.add_box(1.9, 0.85, 0.05, z=0, y=-0.275)  # back panel
+    buf.add_box_grid(0.08, 0.85, 0.55, xs=(-0.9, 0.9))  # left/right sides
+    buf.add_box(1.8, 0.08, 0.5, z=0.4)              # shelf
 
-    bm.to_mesh(mesh)
-    bm.free()
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('sideboard', mesh)
-    bpy.context.collection.objects.link(obj)
     mat = create_ironwood('SideboardWood')
     obj.data.materials.append(mat)
     return obj, TEX_PROP_LARGE
@@ -414,21 +376,18 @@ def gen_sideboard():
 def gen_wooden_chest_large():
     """Large iron-banded storage chest."""
     mesh = bpy.data.meshes.new('chest_mesh')
-    bm = bmesh.new()
+    buf = MeshBuffer()
 
     # Body
-    create_box(bm, 1.2, 0.6, 0.6, z=0)
+    buf.add_box(1.2, 0.6, 0.6, z=0)
     # Lid (slightly raised)
-    create_box(bm, 1.25, 0.1, 0.65, z=0.6)
+    buf.add_box(1.25, 0.1, 0.65, z=0.6)
     # Iron bands
-    create_box(bm, 1.22, 0.05, 0.62, z=0.15)
-    create_box(bm, 1.22, 0.05, 0.62, z=0.4)
+    buf.add_box_grid(1.22, 0.05, 0.62, zs=(0.15, 0.4))
 
-    bm.to_mesh(mesh)
-    bm.free()
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('wooden_chest_large', mesh)
-    bpy.context.collection.objects.link(obj)
     mat = create_ironwood('ChestWood')
     obj.data.materials.append(mat)
     return obj, TEX_PROP_LARGE
@@ -437,22 +396,16 @@ def gen_wooden_chest_large():
 def gen_stool():
     """Three-legged stool."""
     mesh = bpy.data.meshes.new('stool_mesh')
-    bm = bmesh.new()
+    buf = MeshBuffer()
 
     # Seat (cylinder)
-    create_cylinder_section(bm, 0.2, 0.22, 0.06, 8, 0.45)
+    buf.add_cylinder(0.2, 0.22, 0.06, 8, 0.45)
     # Three legs
-    for i in range(3):
-        angle = 2 * math.pi * i / 3
-        x = 0.15 * math.cos(angle)
-        y = 0.15 * math.sin(angle)
-        create_box(bm, 0.04, 0.45, 0.04, x=x, y=y, z=0)
+    buf.add_boxes(0.04, 0.45, 0.04, ring_offsets(0.15, 3))
 
-    bm.to_mesh(mesh)
-    bm.free()
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('stool', mesh)
-    bpy.context.collection.objects.link(obj)
     mat = create_ironwood('StoolWood', grain_density=3.0)
     obj.data.materials.append(mat)
     return obj, TEX_PROP_SMALL
@@ -461,15 +414,13 @@ def gen_stool():
 def gen_roof_beam():
     """Massive ironwood beam spanning the hall width."""
     mesh = bpy.data.meshes.new('beam_mesh')
-    bm = bmesh.new()
+    buf = MeshBuffer()
 
-    create_box(bm, 12.0, 0.5, 0.4, z=0)
+    buf.add_box(12.0, 0.5, 0.4, z=0)
 
-    bm.to_mesh(mesh)
-    bm.free()
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('roof_beam', mesh)
-    bpy.context.collection.objects.link(obj)
     mat = create_ironwood('BeamIronwood', scale=1.0, grain_density=2.0)
     obj.data.materials.append(mat)
     return obj, TEX_PROP_LARGE
@@ -478,15 +429,13 @@ def gen_roof_beam():
 def gen_roof_joist():
     """Smaller cross-beam between main beams."""
     mesh = bpy.data.meshes.new('joist_mesh')
-    bm = bmesh.new()
+    buf = MeshBuffer()
 
-    create_box(bm, 4.0, 0.25, 0.2, z=0)
+    buf.add_box(4.0, 0.25, 0.2, z=0)
 
-    bm.to_mesh(mesh)
-    bm.free()
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('roof_joist', mesh)
-    bpy.context.collection.objects.link(obj)
     mat = create_ironwood('JoistWood', grain_density=3.0)
     obj.data.materials.append(mat)
     return obj, TEX_PROP_LARGE
@@ -495,21 +444,18 @@ def gen_roof_joist():
 def gen_rafter_set():
     """Angled roof structure visible from below."""
     mesh = bpy.data.meshes.new('rafter_mesh')
-    bm = bmesh.new()
+    buf = MeshBuffer()
 
     # Two angled rafters meeting at a peak
-    create_box(bm, 0.15, 3.0, 0.12, x=-1.0, z=0)
-    create_box(bm, 0.15, 3.0, 0.12, x=1.0, z=0)
+    buf.add_box_grid(0.15, 3.0, 0.12, xs=(-1.0, 1.0))
     # Ridge beam at top
-    create_box(bm, 0.15, 0.15, 3.0, z=2.8)
+    buf.add_box(0.15, 0.15, 3.0, z=2.8)
     # Collar tie
-    create_box(bm, 2.0, 0.12, 0.12, z=1.5)
+    buf.add_box(2.0, 0.12, 0.12, z=1.5)
 
-    bm.to_mesh(mesh)
-    bm.free()
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('rafter_set', mesh)
-    bpy.context.collection.objects.link(obj)
     mat = create_ironwood('RafterWood')
     obj.data.materials.append(mat)
     return obj, TEX_PROP_LARGE
@@ -518,29 +464,19 @@ def gen_rafter_set():
 def gen_banner():
     """Cloth banner with drape folds."""
     mesh = bpy.data.meshes.new('banner_mesh')
-    bm = bmesh.new()
+    buf = MeshBuffer()
 
     # Banner hanging rod
-    create_box(bm, 1.2, 0.06, 0.06, z=2.5)
+    buf.add_box(1.2, 0.06, 0.06, z=2.5)
     # Banner cloth (flat quad with slight wave)
-    create_box(bm, 1.0, 2.0, 0.02, z=0.5)
+    buf.add_box(1.0, 2.0, 0.02, z=0.5)
 
-    bm.to_mesh(mesh)
-    bm.free()
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('banner', mesh)
-    bpy.context.collection.objects.link(obj)
 
     # Red/grey Forrester colors
-    mat = bpy.data.materials.new('BannerFabric')
-    mat.use_nodes = True
-    nodes = mat.node_tree.nodes
-    links = mat.node_tree.links
-    principled = nodes.get('Principled BSDF')
-    principled.inputs['Base Color'].default_value = (0.5, 0.12, 0.08, 1.0)  # Deep red
-    principled.inputs['Roughness'].default_value = 0.9
-    principled.inputs['Metallic'].default_value = 0.0
-
+    mat = get_or_create_simple_pbr('BannerFabric', (0.5, 0.12, 0.08), 0.9)  # Deep red
     obj.data.materials.append(mat)
     return obj, TEX_PROP_LARGE
 
@@ -548,25 +484,17 @@ def gen_banner():
 def gen_tapestry():
     """Larger woven hanging with geometric border."""
     mesh = bpy.data.meshes.new('tapestry_mesh')
-    bm = bmesh.new()
+    buf = MeshBuffer()
 
-    create_box(bm, 2.0, 2.5, 0.02, z=0.5)
+    buf.add_box(2.0, 2.5, 0.02, z=0.5)
     # Rod
-    create_box(bm, 2.2, 0.06, 0.06, z=3.0)
+    buf.add_box(2.2, 0.06, 0.06, z=3.0)
 
-    bm.to_mesh(mesh)
-    bm.free()
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('tapestry', mesh)
-    bpy.context.collection.objects.link(obj)
-
-    mat = bpy.data.materials.new('TapestryFabric')
-    mat.use_nodes = True
-    nodes = mat.node_tree.nodes
-    principled = nodes.get('Principled BSDF')
-    principled.inputs['Base Color'].default_value = (0.35, 0.25, 0.15, 1.0)
-    principled.inputs['Roughness'].default_value = 0.95
 
+    mat = get_or_create_simple_pbr('TapestryFabric', (0.35, 0.25, 0.15), 0.95)
     obj.data.materials.append(mat)
     return obj, TEX_PROP_LARGE
 
@@ -574,23 +502,19 @@ def gen_tapestry():
 def gen_weapon_rack():
     """Wall-mounted rack with sword/axe silhouettes."""
     mesh = bpy.data.meshes.new('rack_mesh')
-    bm = bmesh.new()
+    buf = MeshBuffer()
 
     # Backboard
-    create_box(bm, 1.5, 1.2, 0.06, z=0.8)
+    buf.add_box(1.5, 1.2, 0.06, z=0.8)
     # Pegs
-    for x in [-0.5, 0, 0.5]:
-        create_box(bm, 0.06, 0.06, 0.15, x=x, z=1.6)
-        create_box(bm, 0.06, 0.06, 0.15, x=x, z=1.0)
+    buf.add_box_grid(0.06, 0.06, 0.15, xs=(-0.5, 0, 0.5), zs=(1.0, 1.6))
     # Sword silhouettes (flat)
-    create_box(bm, 0.06, 1.0, 0.02, x=-0.5, z=1.1, y=0.1)
-    create_box(bm, 0.06, 0.8, 0.02, x=0.5, z=1.15, y=0.1)
+    buf.add_box(0.06, 1.0, 0.02, x=-0.5, z=1.1, y=0.1)
+    buf.add_box(0.06, 0.8, 0.02, x=0.5, z=1.15, y=0.1)
 
-    bm.to_mesh(mesh)
-    bm.free()
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('weapon_rack', mesh)
-    bpy.context.collection.objects.link(obj)
     mat = create_ironwood('RackWood')
     obj.data.materials.append(mat)
     return obj, TEX_PROP_LARGE
@@ -599,18 +523,16 @@ def gen_weapon_rack():
 def gen_dire_wolf_shield():
     """Forrester house shield."""
     mesh = bpy.data.meshes.new('shield_mesh')
-    bm = bmesh.new()
+    buf = MeshBuffer()
 
     # Shield body (octagonal flat)
-    create_cylinder_section(bm, 0.4, 0.4, 0.06, 8, 0)
+    buf.add_cylinder(0.4, 0.4, 0.06, 8, 0)
     # Boss in center
-    create_cylinder_section(bm, 0.08, 0.06, 0.04, 8, 0.06)
+    buf.add_cylinder(0.08, 0.06, 0.04, 8, 0.06)
 
-    bm.to_mesh(mesh)
-    bm.free()
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('dire_wolf_shield', mesh)
-    bpy.context.collection.objects.link(obj)
     mat = create_dark_iron('ShieldIron')
     obj.data.materials.append(mat)
     return obj, TEX_PROP_SMALL
@@ -619,21 +541,17 @@ def gen_dire_wolf_shield():
 def gen_mounted_antlers():
     """Trophy antlers on wall plaque."""
     mesh = bpy.data.meshes.new('antlers_mesh')
-    bm = bmesh.new()
+    buf = MeshBuffer()
 
     # Plaque
-    create_cylinder_section(bm, 0.2, 0.2, 0.04, 8, 0)
+    buf.add_cylinder(0.2, 0.2, 0.04, 8, 0)
     # Antler tines (simplified as boxes)
-    create_box(bm, 0.04, 0.5, 0.04, x=-0.15, z=0.04)
-    create_box(bm, 0.04, 0.5, 0.04, x=0.15, z=0.04)
-    create_box(bm, 0.04, 0.3, 0.04, x=-0.25, z=0.3)
-    create_box(bm, 0.04, 0.3, 0.04, x=0.25, z=0.3)
+    buf.add_box_grid(0.04, 0.5, 0.04, xs=(-0.15, 0.15), zs=0.04)
+    buf.add_box_grid(0.04, 0.3, 0.04, xs=(-0.25, 0.25), zs=0.3)
 
-    bm.to_mesh(mesh)
-    bm.free()
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('mounted_antlers', mesh)
-    bpy.context.collection.objects.link(obj)
     mat = create_ironwood('AntlerWood')
     obj.data.materials.append(mat)
     return obj, TEX_PROP_SMALL
@@ -642,26 +560,20 @@ def gen_mounted_antlers():
 def gen_iron_candle_tree():
     """Floor-standing candelabra."""
     mesh = bpy.data.meshes.new('candle_tree_mesh')
-    bm = bmesh.new()
+    buf = MeshBuffer()
 
     # Base plate
-    create_cylinder_section(bm, 0.2, 0.18, 0.05, 8, 0)
+    buf.add_cylinder(0.2, 0.18, 0.05, 8, 0)
     # Shaft
-    create_cylinder_section(bm, 0.03, 0.03, 1.5, 8, 0.05)
-    # Arms (3 branches)
-    for i in range(3):
-        angle = 2 * math.pi * i / 3
-        x = 0.15 * math.cos(angle)
-        y = 0.15 * math.sin(angle)
-        create_box(bm, 0.03, 0.25, 0.03, x=x, y=y, z=1.3)
-        # Candle cup
-        create_cylinder_section(bm, 0.04, 0.04, 0.05, 6, 1.55)
-
-    bm.to_mesh(mesh)
-    bm.free()
+    buf.add_cylinder(0.03, 0.03, 1.5, 8, 0.05)
+    # Arms (3 branches) with a candle cup on each
+    arms = ring_offsets(0.15, 3)
+    buf.add_boxes(0.03, 0.25, 0.03, arms + np.array((0, 0, 1.3), dtype=np.float32))
+    buf.add_cylinders(0.04, 0.04, 0.05, 6, 1.55, arms)
+
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('iron_candle_tree', mesh)
-    bpy.context.collection.objects.link(obj)
     mat = create_dark_iron('CandleTreeIron')
     obj.data.materials.append(mat)
     return obj, TEX_PROP_SMALL
@@ -670,17 +582,15 @@ def gen_iron_candle_tree():
 def gen_heraldic_crest():
     """Carved stone crest above hearth."""
     mesh = bpy.data.meshes.new('crest_mesh')
-    bm = bmesh.new()
+    buf = MeshBuffer()
 
     # Shield shape (wider at top)
-    create_box(bm, 0.8, 0.8, 0.1, z=0)
-    create_box(bm, 0.5, 0.4, 0.12, z=0.1)  # raised center
+    buf.add_box(0.8, 0.8, 0.1, z=0)
+    buf.add_box(0.5, 0.4, 0.12, z=0.1)  # raised center
 
-    bm.to_mesh(mesh)
-    bm.free()
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('heraldic_crest', mesh)
-    bpy.context.collection.objects.link(obj)
     mat = create_northern_stone('CrestStone', scale=8.0)
     obj.data.materials.append(mat)
     return obj, TEX_PROP_SMALL
@@ -689,20 +599,18 @@ def gen_heraldic_crest():
 def gen_iron_torch_holder():
     """Wall-mounted iron torch bracket."""
     mesh = bpy.data.meshes.new('torch_holder_mesh')
-    bm = bmesh.new()
+    buf = MeshBuffer()
 
     # Back plate
-    create_box(bm, 0.08, 0.2, 0.02, z=0)
+    buf.add_box(0.08, 0.2, 0.02, z=0)
     # Arm
-    create_box(bm, 0.04, 0.04, 0.25, z=0.1, y=0.125)
+    buf.add_box(0.04, 0.04, 0.25, z=0.1, y=0.125)
     # Cup
-    create_cylinder_section(bm, 0.06, 0.07, 0.1, 6, 0.1)
+    buf.add_cylinder(0.06, 0.07, 0.1, 6, 0.1)
 
-    bm.to_mesh(mesh)
-    bm.free()
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('iron_torch_holder', mesh)
-    bpy.context.collection.objects.link(obj)
     mat = create_dark_iron('TorchIron')
     obj.data.materials.append(mat)
     return obj, TEX_PROP_SMALL
@@ -711,36 +619,22 @@ def gen_iron_torch_holder():
 def gen_iron_chandelier():
     """Ring chandelier with chain and candle cups."""
     mesh = bpy.data.meshes.new('chandelier_mesh')
-    bm = bmesh.new()
+    buf = MeshBuffer()
 
     # Main ring
     ring_r = 0.6
     ring_segments = 16
-    for i in range(ring_segments):
-        angle = 2 * math.pi * i / ring_segments
-        x = ring_r * math.cos(angle)
-        y = ring_r * math.sin(angle)
-        create_box(bm, 0.04, 0.08, 0.04, x=x, y=y, z=0)
-
-    # Candle cups (6 evenly spaced)
-    for i in range(6):
-        angle = 2 * math.pi * i / 6
-        x = ring_r * math.cos(angle)
-        y = ring_r * math.sin(angle)
-        create_cylinder_section(bm, 0.04, 0.04, 0.06, 6, 0.08)
+    buf.add_boxes(0.04, 0.08, 0.04, ring_offsets(ring_r, ring_segments))
+
+    # Candle cups (6 evenly spaced on the ring)
+    buf.add_cylinders(0.04, 0.04, 0.06, 6, 0.08, ring_offsets(ring_r, 6))
 
     # Chain to ceiling (3 chains)
-    for i in range(3):
-        angle = 2 * math.pi * i / 3
-        x = (ring_r * 0.5) * math.cos(angle)
-        y = (ring_r * 0.5) * math.sin(angle)
-        create_box(bm, 0.02, 0.5, 0.02, x=x, y=y, z=0.08)
+    buf.add_boxes(0.02, 0.5, 0.02, ring_offsets(ring_r * 0.5, 3, z=0.08))
 
-    bm.to_mesh(mesh)
-    bm.free()
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('iron_chandelier', mesh)
-    bpy.context.collection.objects.link(obj)
     mat = create_dark_iron('ChandelierIron')
     obj.data.materials.append(mat)
     return obj, TEX_PROP_LARGE
@@ -749,17 +643,15 @@ def gen_iron_chandelier():
 def gen_wall_sconce():
     """Wall-mounted sconce with iron bracket."""
     mesh = bpy.data.meshes.new('sconce_mesh')
-    bm = bmesh.new()
+    buf = MeshBuffer()
 
-    create_box(bm, 0.06, 0.15, 0.02, z=0)
-    create_box(bm, 0.03, 0.03, 0.12, z=0.08, y=0.06)
-    create_cylinder_section(bm, 0.05, 0.06, 0.08, 6, 0.08)
+    buf.add_box(0.06, 0.15, 0.02, z=0)
+    buf.add_box(0.03, 0.03, 0.12, z=0.08, y=0.06)
+    buf.add_cylinder(0.05, 0.06, 0.08, 6, 0.08)
 
-    bm.to_mesh(mesh)
-    bm.free()
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('wall_sconce', mesh)
-    bpy.context.collection.objects.link(obj)
     mat = create_dark_iron('SconceIron')
     obj.data.materials.append(mat)
     return obj, TEX_PROP_SMALL
@@ -768,21 +660,16 @@ def gen_wall_sconce():
 def gen_candelabra():
     """Table candelabra."""
     mesh = bpy.data.meshes.new('candelabra_mesh')
-    bm = bmesh.new()
+    buf = MeshBuffer()
 
-    create_cylinder_section(bm, 0.06, 0.05, 0.02, 8, 0)
-    create_cylinder_section(bm, 0.02, 0.02, 0.3, 6, 0.02)
-    for i in range(3):
-        angle = 2 * math.pi * i / 3
-        x = 0.06 * math.cos(angle)
-        y = 0.06 * math.sin(angle)
-        create_cylinder_section(bm, 0.02, 0.02, 0.15, 6, 0.25)
+    buf.add_cylinder(0.06, 0.05, 0.02, 8, 0)
+    buf.add_cylinder(0.02, 0.02, 0.3, 6, 0.02)
+    # Three candle arms
+    buf.add_cylinders(0.02, 0.02, 0.15, 6, 0.25, ring_offsets(0.06, 3))
 
-    bm.to_mesh(mesh)
-    bm.free()
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('candelabra', mesh)
-    bpy.context.collection.objects.link(obj)
     mat = create_dark_iron('CandelabraIron')
     obj.data.materials.append(mat)
     return obj, TEX_PROP_SMALL
@@ -791,20 +678,18 @@ def gen_candelabra():
 def gen_iron_brazier():
     """Standing fire brazier."""
     mesh = bpy.data.meshes.new('brazier_mesh')
-    bm = bmesh.new()
+    buf = MeshBuffer()
 
     # Base
-    create_cylinder_section(bm, 0.2, 0.15, 0.05, 8, 0)
+    buf.add_cylinder(0.2, 0.15, 0.05, 8, 0)
     # Shaft
-    create_cylinder_section(bm, 0.04, 0.04, 0.6, 8, 0.05)
+    buf.add_cylinder(0.04, 0.04, 0.6, 8, 0.05)
     # Bowl
-    create_cylinder_section(bm, 0.15, 0.25, 0.2, 8, 0.65)
+    buf.add_cylinder(0.15, 0.25, 0.2, 8, 0.65)
 
-    bm.to_mesh(mesh)
-    bm.free()
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('iron_brazier', mesh)
-    bpy.context.collection.objects.link(obj)
     mat = create_dark_iron('BrazierIron')
     obj.data.materials.append(mat)
     return obj, TEX_PROP_SMALL
@@ -813,17 +698,15 @@ def gen_iron_brazier():
 def gen_goblet():
     """Drinking goblet."""
     mesh = bpy.data.meshes.new('goblet_mesh')
-    bm = bmesh.new()
+    buf = MeshBuffer()
 
-    create_cylinder_section(bm, 0.04, 0.03, 0.01, 8, 0)
-    create_cylinder_section(bm, 0.015, 0.015, 0.06, 6, 0.01)
-    create_cylinder_section(bm, 0.03, 0.035, 0.05, 8, 0.07)
+    buf.add_cylinder(0.04, 0.03, 0.01, 8, 0)
+    buf.add_cylinder(0.015, 0.015, 0.06, 6, 0.01)
+    buf.add_cylinder(0.03, 0.035, 0.05, 8, 0.07)
 
-    bm.to_mesh(mesh)
-    bm.free()
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('goblet', mesh)
-    bpy.context.collection.objects.link(obj)
     mat = create_dark_iron('GobletMetal')
     obj.data.materials.append(mat)
     return obj, TEX_PROP_SMALL
@@ -832,22 +715,15 @@ def gen_goblet():
 def gen_plate():
     """Ceramic plate."""
     mesh = bpy.data.meshes.new('plate_mesh')
-    bm = bmesh.new()
+    buf = MeshBuffer()
 
-    create_cylinder_section(bm, 0.15, 0.15, 0.02, 12, 0)
+    buf.add_cylinder(0.15, 0.15, 0.02, 12, 0)
 
-    bm.to_mesh(mesh)
-    bm.free()
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('plate', mesh)
-    bpy.context.collection.objects.link(obj)
 
-    mat = bpy.data.materials.new('Ceramic')
-    mat.use_nodes = True
-    nodes = mat.node_tree.nodes
-    principled = nodes.get('Principled BSDF')
-    principled.inputs['Base Color'].default_value = (0.55, 0.48, 0.40, 1.0)
-    principled.inputs['Roughness'].default_value = 0.4
+    mat = get_or_create_simple_pbr('Ceramic', (0.55, 0.48, 0.40), 0.4)
     obj.data.materials.append(mat)
     return obj, TEX_PROP_SMALL
 
@@ -855,26 +731,19 @@ def gen_plate():
 def gen_food_platter():
     """Serving platter with food."""
     mesh = bpy.data.meshes.new('platter_mesh')
-    bm = bmesh.new()
+    buf = MeshBuffer()
 
     # Platter
-    create_cylinder_section(bm, 0.25, 0.25, 0.02, 12, 0)
+    buf.add_cylinder(0.25, 0.25, 0.02, 12, 0)
     # Food mounds
-    create_cylinder_section(bm, 0.08, 0.04, 0.06, 6, 0.02)
-    create_cylinder_section(bm, 0.06, 0.03, 0.05, 6, 0.02)
+    buf.add_cylinder(0.08, 0.04, 0.06, 6, 0.02)
+    buf.add_cylinder(0.06, 0.03, 0.05, 6, 0.02)
 
-    bm.to_mesh(mesh)
-    bm.free()
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('food_platter', mesh)
-    bpy.context.collection.objects.link(obj)
 
-    mat = bpy.data.materials.new('PlatterCeramic')
-    mat.use_nodes = True
-    nodes = mat.node_tree.nodes
-    principled = nodes.get('Principled BSDF')
-    principled.inputs['Base Color'].default_value = (0.50, 0.42, 0.33, 1.0)
-    principled.inputs['Roughness'].default_value = 0.45
+    mat = get_or_create_simple_pbr('PlatterCeramic', (0.50, 0.42, 0.33), 0.45)
     obj.data.materials.append(mat)
     return obj, TEX_PROP_SMALL
 
@@ -882,25 +751,18 @@ def gen_food_platter():
 def gen_wine_jug():
     """Ceramic wine jug."""
     mesh = bpy.data.meshes.new('jug_mesh')
-    bm = bmesh.new()
+    buf = MeshBuffer()
 
-    create_cylinder_section(bm, 0.06, 0.08, 0.12, 8, 0)
-    create_cylinder_section(bm, 0.08, 0.05, 0.08, 8, 0.12)
+    buf.add_cylinder(0.06, 0.08, 0.12, 8, 0)
+    buf.add_cylinder(0.08, 0.05, 0.08, 8, 0.12)
     # Spout
-    create_box(bm, 0.03, 0.04, 0.03, x=0.06, z=0.18)
+    buf.add_box(0.03, 0.04, 0.03, x=0.06, z=0.18)
 
-    bm.to_mesh(mesh)
-    bm.free()
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('wine_jug', mesh)
-    bpy.context.collection.objects.link(obj)
 
-    mat = bpy.data.materials.new('JugCeramic')
-    mat.use_nodes = True
-    nodes = mat.node_tree.nodes
-    principled = nodes.get('Principled BSDF')
-    principled.inputs['Base Color'].default_value = (0.45, 0.35, 0.25, 1.0)
-    principled.inputs['Roughness'].default_value = 0.5
+    mat = get_or_create_simple_pbr('JugCeramic', (0.45, 0.35, 0.25), 0.5)
     obj.data.materials.append(mat)
     return obj, TEX_PROP_SMALL
 
@@ -908,25 +770,17 @@ def gen_wine_jug():
 def gen_candle_stub():
     """Melted candle for tables."""
     mesh = bpy.data.meshes.new('candle_mesh')
-    bm = bmesh.new()
+    buf = MeshBuffer()
 
-    create_cylinder_section(bm, 0.02, 0.015, 0.06, 6, 0)
+    buf.add_cylinder(0.02, 0.015, 0.06, 6, 0)
     # Wax drip base
-    create_cylinder_section(bm, 0.03, 0.025, 0.01, 8, 0)
+    buf.add_cylinder(0.03, 0.025, 0.01, 8, 0)
 
-    bm.to_mesh(mesh)
-    bm.free()
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('candle_stub', mesh)
-    bpy.context.collection.objects.link(obj)
 
-    mat = bpy.data.materials.new('Wax')
-    mat.use_nodes = True
-    nodes = mat.node_tree.nodes
-    principled = nodes.get('Principled BSDF')
-    principled.inputs['Base Color'].default_value = (0.8, 0.75, 0.6, 1.0)
-    principled.inputs['Roughness'].default_value = 0.7
-    principled.inputs['Subsurface Weight'].default_value = 0.3
+    mat = get_or_create_simple_pbr('Wax', (0.8, 0.75, 0.6), 0.7, subsurface=0.3)
     obj.data.materials.append(mat)
     return obj, TEX_PROP_SMALL
 
@@ -934,13 +788,11 @@ def gen_candle_stub():
 def gen_floor_crack():
     """Stone floor crack detail (decal quad)."""
     mesh = bpy.data.meshes.new('crack_mesh')
-    bm = bmesh.new()
-    create_box(bm, 1.0, 0.005, 1.0, z=0)
-    bm.to_mesh(mesh)
-    bm.free()
+    buf = MeshBuffer()
+    buf.add_box(1.0, 0.005, 1.0, z=0)
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('floor_crack', mesh)
-    bpy.context.collection.objects.link(obj)
     mat = create_northern_stone('CrackStone', scale=8.0)
     obj.data.materials.append(mat)
     return obj, TEX_PROP_SMALL, True  # skip_ao=True
@@ -949,20 +801,13 @@ def gen_floor_crack():
 def gen_wall_moss():
     """Moss growth on wall surface."""
     mesh = bpy.data.meshes.new('moss_mesh')
-    bm = bmesh.new()
-    create_box(bm, 0.8, 0.6, 0.005, z=0)
-    bm.to_mesh(mesh)
-    bm.free()
+    buf = MeshBuffer()
+    buf.add_box(0.8, 0.6, 0.005, z=0)
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('wall_moss', mesh)
-    bpy.context.collection.objects.link(obj)
 
-    mat = bpy.data.materials.new('Moss')
-    mat.use_nodes = True
-    nodes = mat.node_tree.nodes
-    principled = nodes.get('Principled BSDF')
-    principled.inputs['Base Color'].default_value = (0.15, 0.25, 0.1, 1.0)
-    principled.inputs['Roughness'].default_value = 0.95
+    mat = get_or_create_simple_pbr('Moss', (0.15, 0.25, 0.1), 0.95)
     obj.data.materials.append(mat)
     return obj, TEX_PROP_SMALL, True
 
@@ -970,20 +815,13 @@ def gen_wall_moss():
 def gen_hearth_scorch():
     """Scorch marks near fireplace."""
     mesh = bpy.data.meshes.new('scorch_mesh')
-    bm = bmesh.new()
-    create_box(bm, 1.2, 0.005, 0.8, z=0)
-    bm.to_mesh(mesh)
-    bm.free()
+    buf = MeshBuffer()
+    buf.add_box(1.2, 0.005, 0.8, z=0)
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('hearth_scorch', mesh)
-    bpy.context.collection.objects.link(obj)
 
-    mat = bpy.data.materials.new('Scorch')
-    mat.use_nodes = True
-    nodes = mat.node_tree.nodes
-    principled = nodes.get('Principled BSDF')
-    principled.inputs['Base Color'].default_value = (0.08, 0.06, 0.05, 1.0)
-    principled.inputs['Roughness'].default_value = 0.9
+    mat = get_or_create_simple_pbr('Scorch', (0.08, 0.06, 0.05), 0.9)
     obj.data.materials.append(mat)
     return obj, TEX_PROP_SMALL, True
 
@@ -991,20 +829,13 @@ def gen_hearth_scorch():
 def gen_table_stain():
     """Drink stain on table."""
     mesh = bpy.data.meshes.new('stain_mesh')
-    bm = bmesh.new()
-    create_cylinder_section(bm, 0.1, 0.1, 0.002, 8, 0)
-    bm.to_mesh(mesh)
-    bm.free()
+    buf = MeshBuffer()
+    buf.add_cylinder(0.1, 0.1, 0.002, 8, 0)
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('table_stain', mesh)
-    bpy.context.collection.objects.link(obj)
 
-    mat = bpy.data.materials.new('Stain')
-    mat.use_nodes = True
-    nodes = mat.node_tree.nodes
-    principled = nodes.get('Principled BSDF')
-    principled.inputs['Base Color'].default_value = (0.2, 0.12, 0.08, 1.0)
-    principled.inputs['Roughness'].default_value = 0.4
+    mat = get_or_create_simple_pbr('Stain', (0.2, 0.12, 0.08), 0.4)
     obj.data.materials.append(mat)
     return obj, TEX_PROP_SMALL, True
 
@@ -1012,13 +843,11 @@ def gen_table_stain():
 def gen_fur_rug():
     """Animal pelt rug."""
     mesh = bpy.data.meshes.new('rug_mesh')
-    bm = bmesh.new()
-    create_box(bm, 2.0, 0.03, 1.5, z=0)
-    bm.to_mesh(mesh)
-    bm.free()
+    buf = MeshBuffer()
+    buf.add_box(2.0, 0.03, 1.5, z=0)
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('fur_rug', mesh)
-    bpy.context.collection.objects.link(obj)
     mat = create_leather('RugLeather', base_color=(0.35, 0.28, 0.20))
     obj.data.materials.append(mat)
     return obj, TEX_PROP_LARGE
@@ -1027,20 +856,13 @@ def gen_fur_rug():
 def gen_rushes():
     """Floor rushes scatter."""
     mesh = bpy.data.meshes.new('rushes_mesh')
-    bm = bmesh.new()
-    create_box(bm, 1.5, 0.02, 1.0, z=0)
-    bm.to_mesh(mesh)
-    bm.free()
+    buf = MeshBuffer()
+    buf.add_box(1.5, 0.02, 1.0, z=0)
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('rushes', mesh)
-    bpy.context.collection.objects.link(obj)
 
-    mat = bpy.data.materials.new('Rushes')
-    mat.use_nodes = True
-    nodes = mat.node_tree.nodes
-    principled = nodes.get('Principled BSDF')
-    principled.inputs['Base Color'].default_value = (0.35, 0.32, 0.18, 1.0)
-    principled.inputs['Roughness'].default_value = 0.95
+    mat = get_or_create_simple_pbr('Rushes', (0.35, 0.32, 0.18), 0.95)
     obj.data.materials.append(mat)
     return obj, TEX_PROP_LARGE
 
@@ -1048,18 +870,16 @@ def gen_rushes():
 def gen_hound_sleeping():
     """Sleeping hound (simplified shape)."""
     mesh = bpy.data.meshes.new('hound_mesh')
-    bm = bmesh.new()
+    buf = MeshBuffer()
 
     # Body
-    create_box(bm, 0.8, 0.25, 0.35, z=0)
+    buf.add_box(0.8, 0.25, 0.35, z=0)
     # Head
-    create_box(bm, 0.2, 0.2, 0.18, x=0.45, z=0.05)
+    buf.add_box(0.2, 0.2, 0.18, x=0.45, z=0.05)
 
-    bm.to_mesh(mesh)
-    bm.free()
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('hound_sleeping', mesh)
-    bpy.context.collection.objects.link(obj)
     mat = create_leather('HoundFur', base_color=(0.25, 0.18, 0.12))
     obj.data.materials.append(mat)
     return obj, TEX_PROP_SMALL
@@ -1068,13 +888,11 @@ def gen_hound_sleeping():
 def gen_worn_path():
     """Floor wear pattern at high-traffic areas."""
     mesh = bpy.data.meshes.new('path_mesh')
-    bm = bmesh.new()
-    create_box(bm, 2.0, 0.003, 1.5, z=0)
-    bm.to_mesh(mesh)
-    bm.free()
+    buf = MeshBuffer()
+    buf.add_box(2.0, 0.003, 1.5, z=0)
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('worn_path', mesh)
-    bpy.context.collection.objects.link(obj)
     mat = create_northern_stone('WornStone', scale=6.0)
     obj.data.materials.append(mat)
     return obj, TEX_PROP_LARGE, True
@@ -1083,23 +901,13 @@ def gen_worn_path():
 def gen_cobweb():
     """Corner cobwebs (flat quad)."""
     mesh = bpy.data.meshes.new('cobweb_mesh')
-    bm = bmesh.new()
-    create_box(bm, 0.5, 0.5, 0.001, z=0)
-    bm.to_mesh(mesh)
-    bm.free()
+    buf = MeshBuffer()
+    buf.add_box(0.5, 0.5, 0.001, z=0)
+    buf.to_mesh(mesh)
 
     obj = bpy.data.objects.new('cobweb', mesh)
-    bpy.context.collection.objects.link(obj)
 
-    mat = bpy.data.materials.new('Cobweb')
-    mat.use_nodes = True
-    nodes = mat.node_tree.nodes
-    principled = nodes.get('Principled BSDF')
-    principled.inputs['Base Color'].default_value = (0.8, 0.8, 0.8, 1.0)
-    principled.inputs['Roughness'].default_value = 0.9
-    principled.inputs['Alpha'].default_value = 0.3
-    if hasattr(mat, 'blend_method'):
-        mat.blend_method = 'CLIP'
+    mat = get_or_create_simple_pbr('Cobweb', (0.8, 0.8, 0.8), 0.9, alpha=0.3)
     obj.data.materials.append(mat)
     return obj, TEX_PROP_SMALL
 
@@ -1156,11 +964,30 @@ PROP_REGISTRY = {
 }
 
 
+# Registry names for 'all' batches and error messages
+PROP_NAMES = tuple(sorted(PROP_REGISTRY))
+PROP_NAMES_STR = ', '.join(PROP_NAMES)
+
+
+# Props with curved or angled surfaces keep Smart UV Project so adjacent
+# faces share islands; everything else gets per-face box-projected UVs.
+SMART_UV_PROPS = {'stone-arch', 'stone-pilaster'}
+
+# Decal-style props are near-flat slabs: a bevel wider than their thickness
+# only adds clamped slivers, and smooth shading bends the top face normals,
+# so they skip both and go straight to UV unwrapping.
+FLAT_PROPS = {
+    'floor-crack', 'wall-moss', 'hearth-scorch', 'table-stain',
+    'fur-rug', 'rushes', 'worn-path', 'cobweb',
+}
+
+
 def generate_single_prop(prop_name):
     """Generate a single prop by name."""
-    if prop_name not in PROP_REGISTRY:
+    generator = PROP_REGISTRY.get(prop_name)
+    if generator is None:
         print(f"ERROR: Unknown prop '{prop_name}'")
-        print(f"Available props: {', '.join(sorted(PROP_REGISTRY.keys()))}")
+        print(f"Available props: {PROP_NAMES_STR}")
         sys.exit(1)
 
     start = time.time()
@@ -1168,22 +995,34 @@ def generate_single_prop(prop_name):
 
     clean_scene()
 
-    # Call generator
-    result = PROP_REGISTRY[prop_name]()
-    skip_ao = False
-    if len(result) == 3:
-        obj, tex_size, skip_ao = result
-    else:
-        obj, tex_size = result
+    # Call generator (decal-style props return a trailing skip_ao flag)
+    obj, tex_size, *extras = generator()
+    skip_ao = extras[0] if extras else False
 
+    # Link only now that the object is fully built (one scene update)
+    bpy.context.collection.objects.link(obj)
     bpy.context.view_layer.objects.active = obj
     obj.select_set(True)
 
     # Process: bevel → smooth → UV → bake → replace material → export
-    add_bevel(obj, width=0.015, segments=1)
-    smooth_shade(obj)
-    remove_doubles(obj)
-    smart_uv_unwrap(obj)
+    # (coincident vertices are already welded when the mesh is built).
+    # The processed mesh is cached on disk until this code or the
+    # generator changes.
+    mesh_key = mesh_cache.cache_key(
+        (generator, generate_single_prop),
+        extra=(prop_name in FLAT_PROPS, prop_name in SMART_UV_PROPS),
+    )
+    if mesh_cache.load(mesh_key, obj.data):
+        print(f"[{prop_name}] Loaded processed mesh from cache")
+    else:
+        if prop_name not in FLAT_PROPS:
+            add_bevel(obj, width=0.015, segments=1)
+            smooth_shade(obj)
+        if prop_name in SMART_UV_PROPS:
+            smart_uv_unwrap(obj)
+        else:
+            box_uv_unwrap(obj)
+        mesh_cache.store(mesh_key, obj.data)
 
     print(f"[{prop_name}] Baking PBR textures ({tex_size}px)...")
     images = bake_pbr(obj, tex_size, skip_ao=skip_ao)
@@ -1199,6 +1038,69 @@ def generate_single_prop(prop_name):
     return meta
 
 
+# ═══════════════════════════════════════════════════════════════════════
+# PARALLEL BATCH
+# ═══════════════════════════════════════════════════════════════════════
+
+# Prefix of the stdout line a worker uses to report each prop's metadata
+META_PREFIX = 'PROP_META '
+
+
+def run_worker(prop_names, threads):
+    """Generate props in one long-lived background Blender; return their metadata.
+
+    The worker pays Blender startup and module import once for its whole
+    share of the batch, resetting the scene between props.
+    """
+    results = {}
+
+    def collect(line):
+        if not line.startswith(META_PREFIX):
+            return False
+        report = json.loads(line[len(META_PREFIX):])
+        results[report['prop']] = report['meta']
+        return True
+
+    returncode, last_line = run_blender(
+        os.path.abspath(__file__), ['--worker', *prop_names], threads, on_line=collect,
+    )
+    for name in prop_names:
+        if name not in results:
+            reason = f"worker exited with code {returncode}: {last_line or 'no output'}"
+            print(f"[{name}] FAILED: {reason}")
+            results[name] = {'error': reason}
+    return results
+
+
+def generate_parallel(prop_names, jobs):
+    """Generate props across up to `jobs` concurrent Blender workers."""
+    jobs = min(jobs, len(prop_names))
+    # Round-robin keeps neighbouring (often similar-cost) props on different workers
+    shares = [tuple(prop_names[i::jobs]) for i in range(jobs)]
+    results = {}
+    for share_results in run_parallel(run_worker, shares, jobs).values():
+        results.update(share_results)
+    return {name: results[name] for name in prop_names}
+
+
+def generate_sequential(prop_names, report=False):
+    """Generate props one after another in this Blender process.
+
+    With report=True each result is also printed as a META_PREFIX line
+    for the parent process of a parallel batch.
+    """
+    results = {}
+    for name in prop_names:
+        try:
+            results[name] = generate_single_prop(name)
+        except Exception as e:
+            print(f"[{name}] FAILED: {e}")
+            results[name] = {'error': str(e)}
+        if report:
+            print(META_PREFIX + json.dumps({'prop': name, 'meta': results[name]}), flush=True)
+    return results
+
+
 # ═══════════════════════════════════════════════════════════════════════
 # CLI ENTRY POINT
 # ═══════════════════════════════════════════════════════════════════════
@@ -1211,23 +1113,42 @@ if __name__ == '__main__':
     else:
         args = []
 
+    # Internal: run as a worker of a parallel batch
+    worker = args[:1] == ['--worker']
+    if worker:
+        args = args[1:]
+
+    jobs = default_jobs()
+    if args[:1] in (['-j'], ['--jobs']) and len(args) > 1:
+        jobs = max(1, int(args[1]))
+        args = args[2:]
+
     if not args:
-        print("Usage: blender --background --factory-startup --python generate_prop.py -- <prop-name>")
-        print(f"Available props: {', '.join(sorted(PROP_REGISTRY.keys()))}")
+        print("Usage: blender --background --factory-startup --python generate_prop.py -- [-j N] <prop-name> [<prop-name> ...]")
+        print(f"Available props: {PROP_NAMES_STR}")
         sys.exit(1)
 
-    prop_name = args[0]
+    if args == ['all']:
+        prop_names = list(PROP_NAMES)
+    else:
+        prop_names = args
 
-    if prop_name == 'all':
-        # Generate all props
+    unknown = [name for name in prop_names if name not in PROP_REGISTRY]
+    if unknown:
+        print(f"ERROR: Unknown prop(s) {', '.join(repr(n) for n in unknown)}")
+        print(f"Available props: {PROP_NAMES_STR}")
+        sys.exit(1)
+
+    if worker:
+        generate_sequential(prop_names, report=True)
+    elif len(prop_names) == 1:
+        generate_single_prop(prop_names[0])
+    else:
         total_start = time.time()
-        results = {}
-        for name in sorted(PROP_REGISTRY.keys()):
-            try:
-                results[name] = generate_single_prop(name)
-            except Exception as e:
-                print(f"[{name}] FAILED: {e}")
-                results[name] = {'error': str(e)}
+        if jobs > 1:
+            results = generate_parallel(prop_names, jobs)
+        else:
+            results = generate_sequential(prop_names)
 
         total_time = time.time() - total_start
         print(f"\n{'='*60}")
@@ -1238,5 +1159,3 @@ if __name__ == '__main__':
         print(f"Total tris: {total_tris}, Total size: {total_kb:.1f}KB")
         if errors:
             print(f"ERRORS: {', '.join(errors)}")
-    else:
-        generate_single_prop(prop_name)
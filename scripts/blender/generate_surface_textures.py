@@ -15,9 +15,13 @@ import time
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from lib.mesh_ops import clean_scene
+from lib import bake_cache
+from lib.mesh_ops import clean_scene, object_context
+from lib.mesh_buffers import grid_plane, write_mesh
 from lib.materials import create_northern_stone, create_ironwood
-from lib.bake import setup_cycles_bake
+from lib.bake import (
+    setup_cycles_bake, denoise_ao, persistent_data, pass_inputs_only, save_jpeg,
+)
 from lib.conventions import (
     TEXTURE_OUTPUT_DIR, TEX_SURFACE,
     BAKE_SAMPLES_FAST, BAKE_SAMPLES_AO,
@@ -26,29 +30,32 @@ from lib.conventions import (
 
 def create_bake_plane(size=2.0):
     """Create a subdivided plane for texture baking."""
-    bpy.ops.mesh.primitive_plane_add(size=size, location=(0, 0, 0))
-    obj = bpy.context.active_object
-    obj.name = 'bake_plane'
+    mesh = bpy.data.meshes.new('bake_plane')
+    # 4 cuts per side (5x5 quads) for better bake quality
+    verts, loops, sizes = grid_plane(size, cuts=4)
+    write_mesh(mesh, verts, loops, sizes)
 
-    # Subdivide for better bake quality
-    bpy.ops.object.mode_set(mode='EDIT')
-    bpy.ops.mesh.subdivide(number_cuts=4)
-    bpy.ops.object.mode_set(mode='OBJECT')
+    # UVs span 0-1 across the plane, perfect for tiling
+    uv_layer = mesh.uv_layers.new(name='UVMap')
+    uv_layer.data.foreach_set('uv', (verts[loops, :2] / size + 0.5).ravel())
 
-    # UV unwrap — the default plane UV is already 0-1, perfect for tiling
+    obj = bpy.data.objects.new('bake_plane', mesh)
+    bpy.context.collection.objects.link(obj)
+    bpy.context.view_layer.objects.active = obj
     return obj
 
 
 def bake_surface_set(obj, tex_size, output_dir, name):
-    """Bake PBR maps and save as individual JPEG files."""
+    """Bake PBR maps and save as individual JPEG files.
+
+    Passes come from the bake cache when the plane and material are
+    unchanged, so re-running a set only re-encodes its JPEGs.
+    """
     setup_cycles_bake()
     scene = bpy.context.scene
     mat = obj.data.materials[0]
     nodes = mat.node_tree.nodes
 
-    bpy.context.view_layer.objects.active = obj
-    obj.select_set(True)
-
     os.makedirs(output_dir, exist_ok=True)
 
     passes = [
@@ -58,33 +65,42 @@ def bake_surface_set(obj, tex_size, output_dir, name):
         ('ao', 'AO', 'Non-Color', BAKE_SAMPLES_AO, None),
     ]
 
-    for filename, pass_type, colorspace, samples, pass_filter in passes:
-        img = bpy.data.images.new(f"bake_{filename}", tex_size, tex_size)
-        img.colorspace_settings.name = colorspace
-
-        # Create temp image texture node
+    # Tileable AO is denoised with wrapping, unlike prop bakes
+    key = bake_cache.bake_key(obj, tex_size, skip_ao=False, extra=('tileable',))
+    images = bake_cache.load(key, [(pass_type, colorspace) for _, pass_type, colorspace, _, _ in passes])
+    if images is not None:
+        print(f"  [{name}] Loaded passes from bake cache")
+    else:
+        images = {}
+        # Temp bake target node, shared by all passes (only its image changes)
         img_node = nodes.new('ShaderNodeTexImage')
-        img_node.image = img
         img_node.location = (800, 0)
         nodes.active = img_node
 
-        scene.cycles.samples = samples
+        with persistent_data(scene):
+            for filename, pass_type, colorspace, samples, pass_filter in passes:
+                img = bpy.data.images.new(f"bake_{filename}", tex_size, tex_size)
+                img.colorspace_settings.name = colorspace
+                img_node.image = img
+
+                scene.cycles.samples = samples
 
-        if pass_filter:
-            bpy.ops.object.bake(type=pass_type, pass_filter=pass_filter)
-        else:
-            bpy.ops.object.bake(type=pass_type)
+                with pass_inputs_only(mat, pass_type), object_context(obj):
+                    if pass_filter:
+                        bpy.ops.object.bake(type=pass_type, pass_filter=pass_filter)
+                    else:
+                        bpy.ops.object.bake(type=pass_type)
+                if pass_type == 'AO':
+                    denoise_ao(img, wrap=True)
+                images[pass_type] = img
 
         nodes.remove(img_node)
+        bake_cache.store(key, images)
 
+    for filename, pass_type, _, _, _ in passes:
         # Save as JPEG
-        filepath = os.path.join(output_dir, f'{filename}.jpg')
-        img.filepath_raw = filepath
-        img.file_format = 'JPEG'
-        scene.render.image_settings.quality = 90
-        img.save_render(filepath)
-        bpy.data.images.remove(img)
-
+        save_jpeg(images[pass_type], os.path.join(output_dir, f'{filename}.jpg'), quality=90)
+        bpy.data.images.remove(images[pass_type])
         print(f"  [{name}] Saved {filename}.jpg ({tex_size}px)")
 
 
@@ -92,51 +108,59 @@ def bake_surface_set(obj, tex_size, output_dir, name):
 # SURFACE TEXTURE DEFINITIONS
 # ═══════════════════════════════════════════════════════════════════════
 
-def gen_floor_stone():
+def make_floor_stone():
     """Northern stone floor — grey flagstones with worn surface."""
-    obj = create_bake_plane()
     mat = create_northern_stone('FloorStone', scale=3.0, seed=42)
-    obj.data.materials.append(mat)
-    return obj, os.path.join(TEXTURE_OUTPUT_DIR, 'stone', 'northern-floor')
+    return mat, os.path.join(TEXTURE_OUTPUT_DIR, 'stone', 'northern-floor')
 
 
-def gen_wall_stone():
+def make_wall_stone():
     """Castle wall stone — slightly different scale and color from floor."""
-    obj = create_bake_plane()
     mat = create_northern_stone('WallStone', scale=4.0, seed=7)
-    obj.data.materials.append(mat)
-    return obj, os.path.join(TEXTURE_OUTPUT_DIR, 'stone', 'northern-wall')
+    return mat, os.path.join(TEXTURE_OUTPUT_DIR, 'stone', 'northern-wall')
 
 
-def gen_ceiling_wood():
+def make_ceiling_wood():
     """Dark ironwood ceiling planks."""
-    obj = create_bake_plane()
     mat = create_ironwood('CeilingWood', scale=1.5, grain_density=4.0, seed=13)
-    obj.data.materials.append(mat)
-    return obj, os.path.join(TEXTURE_OUTPUT_DIR, 'wood', 'ironwood-ceiling')
+    return mat, os.path.join(TEXTURE_OUTPUT_DIR, 'wood', 'ironwood-ceiling')
 
 
+# Each entry returns (material, output_dir); all sets bake onto the same plane
 SURFACE_REGISTRY = {
-    'floor-stone': gen_floor_stone,
-    'wall-stone': gen_wall_stone,
-    'ceiling-wood': gen_ceiling_wood,
+    'floor-stone': make_floor_stone,
+    'wall-stone': make_wall_stone,
+    'ceiling-wood': make_ceiling_wood,
 }
 
 
-def generate_surface(name):
-    """Generate a single surface texture set."""
+SURFACE_NAMES = tuple(sorted(SURFACE_REGISTRY))
+SURFACE_NAMES_STR = ', '.join(SURFACE_NAMES)
+
+
+def generate_surface(name, plane=None):
+    """Generate a single surface texture set.
+
+    Args:
+        name: Surface set name from SURFACE_REGISTRY.
+        plane: Bake plane to reuse; a fresh scene and plane are created if None.
+    """
     if name not in SURFACE_REGISTRY:
         print(f"ERROR: Unknown surface '{name}'")
-        print(f"Available: {', '.join(sorted(SURFACE_REGISTRY.keys()))}")
+        print(f"Available: {SURFACE_NAMES_STR}")
         sys.exit(1)
 
     start = time.time()
     print(f"[{name}] Generating surface textures...")
-    clean_scene()
+    if plane is None:
+        clean_scene()
+        plane = create_bake_plane()
 
-    obj, output_dir = SURFACE_REGISTRY[name]()
+    mat, output_dir = SURFACE_REGISTRY[name]()
+    plane.data.materials.clear()
+    plane.data.materials.append(mat)
 
-    bake_surface_set(obj, TEX_SURFACE, output_dir, name)
+    bake_surface_set(plane, TEX_SURFACE, output_dir, name)
 
     elapsed = time.time() - start
     print(f"[{name}] Done in {elapsed:.1f}s → {output_dir}")
@@ -156,16 +180,19 @@ if __name__ == '__main__':
 
     if not args:
         print("Usage: blender --background --factory-startup --python generate_surface_textures.py -- <set-name>")
-        print(f"Available: {', '.join(sorted(SURFACE_REGISTRY.keys()))}")
+        print(f"Available: {SURFACE_NAMES_STR}")
         sys.exit(1)
 
     name = args[0]
 
     if name == 'all':
         total_start = time.time()
-        for sname in sorted(SURFACE_REGISTRY.keys()):
+        # The plane geometry is identical for every set; only the material changes
+        clean_scene()
+        plane = create_bake_plane()
+        for sname in SURFACE_NAMES:
             try:
-                generate_surface(sname)
+                generate_surface(sname, plane)
             except Exception as e:
                 print(f"[{sname}] FAILED: {e}")
         total_time = time.time() - total_start
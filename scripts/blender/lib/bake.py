@@ -5,24 +5,251 @@ to image textures. The baked images are used for GLB export since
 procedural shader nodes are silently dropped in glTF format.
 """
 import bpy
-from .conventions import BAKE_SAMPLES_FAST, BAKE_SAMPLES_AO
+import numpy as np
+from contextlib import contextmanager
+from functools import lru_cache
+from . import bake_cache
+from .mesh_ops import object_context
+from .conventions import BAKE_DEVICE, BAKE_SAMPLES_FAST, BAKE_SAMPLES_AO
+
+# Tangent-space normal of an unbumped surface
+FLAT_NORMAL = (0.5, 0.5, 1.0, 1.0)
+
+# GPU compute backends in order of preference
+GPU_BACKENDS = ('OPTIX', 'CUDA', 'HIP', 'ONEAPI', 'METAL')
+
+
+@lru_cache(maxsize=None)
+def _enable_gpu_backend():
+    """Enable all devices of the first available GPU backend, or return None.
+
+    Cycles preferences persist for the whole Blender session, so the probe
+    runs once per process.
+    """
+    addon = bpy.context.preferences.addons.get('cycles')
+    if addon is None:
+        return None
+    prefs = addon.preferences
+    for backend in GPU_BACKENDS:
+        try:
+            prefs.compute_device_type = backend
+        except TypeError:
+            continue  # Backend not compiled into this build
+        devices = prefs.get_devices_for_type(backend)
+        gpus = [d for d in devices if d.type != 'CPU']
+        if gpus:
+            for device in devices:
+                device.use = True
+            return backend
+    prefs.compute_device_type = 'NONE'
+    return None
+
+
+@contextmanager
+def persistent_data(scene):
+    """Keep Cycles scene data alive across consecutive bakes of one object.
+
+    Restores the previous setting afterwards so it cannot leak into the
+    next prop's (different) scene contents.
+    """
+    previous = scene.render.use_persistent_data
+    scene.render.use_persistent_data = True
+    try:
+        yield
+    finally:
+        scene.render.use_persistent_data = previous
+
+
+def bake_backend():
+    """Return the GPU backend bakes run on, or None when baking on the CPU."""
+    return _enable_gpu_backend() if BAKE_DEVICE != 'CPU' else None
 
 
 def setup_cycles_bake():
     """Configure Cycles renderer for baking."""
     scene = bpy.context.scene
     scene.render.engine = 'CYCLES'
-    scene.cycles.device = 'CPU'
+    scene.cycles.device = 'GPU' if bake_backend() else 'CPU'
     scene.cycles.samples = BAKE_SAMPLES_FAST
 
+    # The baked passes read material values (and AO rays), never light
+    # paths, so path tracing and reconstruction are stripped to the minimum
+    cycles = scene.cycles
+    cycles.use_denoising = False
+    cycles.max_bounces = 0
+    cycles.diffuse_bounces = 0
+    cycles.glossy_bounces = 0
+    cycles.transmission_bounces = 0
+    cycles.transparent_max_bounces = 0
+    cycles.caustics_reflective = False
+    cycles.caustics_refractive = False
+    cycles.pixel_filter_type = 'BOX'
+    cycles.filter_width = 1.0
+
+
+def _linear_to_srgb(value):
+    """Encode a scene-linear channel value as sRGB."""
+    if value <= 0.0031308:
+        return value * 12.92
+    return 1.055 * value ** (1 / 2.4) - 0.055
+
+
+def premultiply_ao(diffuse, ao):
+    """Multiply a baked AO pass into a baked sRGB diffuse pass, in place.
+
+    This does at bake time what a Multiply node would do in the shader, so
+    the exported GLB carries one texture (and one sampler) fewer. The
+    product is taken in linear space, as the node would.
+    """
+    width, height = diffuse.size
+    if tuple(ao.size) != (width, height):
+        raise ValueError(f"AO size {tuple(ao.size)} does not match diffuse {(width, height)}")
+    color = np.empty(width * height * 4, dtype=np.float32)
+    diffuse.pixels.foreach_get(color)
+    occlusion = np.empty_like(color)
+    ao.pixels.foreach_get(occlusion)
+
+    rgb = color.reshape(-1, 4)[:, :3]
+    linear = np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+    linear *= occlusion.reshape(-1, 4)[:, :1]
+    rgb[:] = np.where(linear <= 0.0031308, linear * 12.92, 1.055 * linear ** (1 / 2.4) - 0.055)
+    diffuse.pixels.foreach_set(color)
+
+
+def flat_pass_colors(mat):
+    """Return solid RGBA values for the passes that need no bake.
+
+    A pass whose Principled input has nothing linked bakes to a uniform
+    map regardless of the mesh or its UV layout, so it is filled directly:
+    an unlinked Normal bakes flat and an unlinked Roughness to its value.
+    An unlinked Base Color bakes to its value only on non-metallic
+    materials, since Cycles scales the diffuse color by 1 - metallic.
+    """
+    principled = next((n for n in mat.node_tree.nodes if n.type == 'BSDF_PRINCIPLED'), None)
+    if principled is None:
+        return {}
+    inputs = principled.inputs
+    colors = {}
+
+    metallic = inputs['Metallic']
+    if not inputs['Base Color'].is_linked and not metallic.is_linked and metallic.default_value == 0.0:
+        r, g, b, _ = inputs['Base Color'].default_value
+        colors['DIFFUSE'] = (_linear_to_srgb(r), _linear_to_srgb(g), _linear_to_srgb(b), 1.0)
+    if not inputs['Roughness'].is_linked:
+        rough = inputs['Roughness'].default_value
+        colors['ROUGHNESS'] = (rough, rough, rough, 1.0)
+    if not inputs['Normal'].is_linked:
+        colors['NORMAL'] = FLAT_NORMAL
+    return colors
+
+
+# Principled inputs each pass reads; links into the other prunable inputs
+# are cut while the pass bakes, so Cycles compiles the subgraphs feeding
+# them out of the shader instead of evaluating them for every sample
+_PASS_INPUTS = {
+    'DIFFUSE': ('Base Color',),
+    'NORMAL': ('Normal',),
+    'ROUGHNESS': ('Roughness',),
+    'AO': ('Normal',),  # Occlusion is traced from the bumped normal
+}
+_PRUNABLE_INPUTS = ('Base Color', 'Roughness', 'Normal')
+
+
+@contextmanager
+def pass_inputs_only(mat, pass_type):
+    """Temporarily unlink the Principled inputs that pass_type does not read."""
+    principled = next((n for n in mat.node_tree.nodes if n.type == 'BSDF_PRINCIPLED'), None)
+    links = mat.node_tree.links
+    removed = []
+    if principled is not None:
+        keep = _PASS_INPUTS.get(pass_type, _PRUNABLE_INPUTS)
+        for name in _PRUNABLE_INPUTS:
+            if name in keep:
+                continue
+            for link in principled.inputs[name].links:
+                removed.append((link.from_socket, link.to_socket))
+                links.remove(link)
+    try:
+        yield
+    finally:
+        for from_socket, to_socket in removed:
+            links.new(from_socket, to_socket)
+
+
+@lru_cache(maxsize=None)
+def _solid_pixels(rgba, tex_size):
+    """Flat pixel buffer for a solid-color image, shared across props."""
+    return np.tile(np.array(rgba, dtype=np.float32), tex_size * tex_size)
+
+
+# 5-tap binomial kernel: separable approximation of a Gaussian (sigma ~1px)
+_DENOISE_KERNEL = np.array((1, 4, 6, 4, 1), dtype=np.float32) / 16
+
+
+def denoise_ao(img, wrap=False):
+    """Smooth sampling noise out of a baked AO image in place.
+
+    AO is low-frequency, so a small Gaussian blur removes most of the
+    variance of a low-sample bake at a fraction of the path-tracing cost.
+    Use wrap=True for tileable textures so the filter wraps at the edges.
+    """
+    width, height = img.size
+    pixels = np.empty(width * height * 4, dtype=np.float32)
+    img.pixels.foreach_get(pixels)
+    rgba = pixels.reshape(height, width, 4)
+
+    radius = len(_DENOISE_KERNEL) // 2
+    padded = np.pad(rgba[:, :, 0], radius, mode='wrap' if wrap else 'edge')
+
+    # Separable pass over padded views, accumulating in place (no shifted copies)
+    rows = np.zeros((height, width + 2 * radius), dtype=np.float32)
+    for i, w in enumerate(_DENOISE_KERNEL):
+        rows += w * padded[i:i + height]
+    ao = np.zeros((height, width), dtype=np.float32)
+    for i, w in enumerate(_DENOISE_KERNEL):
+        ao += w * rows[:, i:i + width]
+
+    rgba[:, :, :3] = ao[:, :, None]
+    img.pixels.foreach_set(pixels)
+
+
+def save_jpeg(img, filepath, quality):
+    """Write an image's pixels to a JPEG file.
 
-def bake_pbr(obj, tex_size, skip_ao=False):
+    Uses Pillow when it is importable, writing the stored pixel values
+    directly; otherwise falls back to Blender's own image writer.
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        img.filepath_raw = filepath
+        img.file_format = 'JPEG'
+        bpy.context.scene.render.image_settings.quality = quality
+        img.save_render(filepath)
+        return
+
+    width, height = img.size
+    pixels = np.empty(width * height * 4, dtype=np.float32)
+    img.pixels.foreach_get(pixels)
+    # Blender stores rows bottom-up
+    rgb = pixels.reshape(height, width, 4)[::-1, :, :3]
+    data = (rgb.clip(0.0, 1.0) * 255 + 0.5).astype(np.uint8)
+    Image.fromarray(data, 'RGB').save(filepath, 'JPEG', quality=quality, optimize=True)
+
+
+def bake_pbr(obj, tex_size, skip_ao=False, use_cache=True):
     """Bake all PBR passes for an object.
 
+    Each prop bakes into its own images rather than a shared atlas: props
+    ship as standalone GLBs with embedded textures, so an atlas would be
+    embedded whole in every file and blow the per-GLB size budget.
+
     Args:
         obj: The Blender object to bake.
         tex_size: Resolution (e.g., 512 for 512x512).
         skip_ao: If True, skip AO bake (for wall-hugging decals).
+        use_cache: If True, reuse passes from the on-disk bake cache when
+            the mesh, UVs and material are unchanged (see lib.bake_cache).
 
     Returns:
         dict mapping pass name to bpy.types.Image.
@@ -32,9 +259,7 @@ def bake_pbr(obj, tex_size, skip_ao=False):
     mat = obj.data.materials[0]
     nodes = mat.node_tree.nodes
 
-    bpy.context.view_layer.objects.active = obj
-    obj.select_set(True)
-
+    flat_colors = flat_pass_colors(mat)
     images = {}
     passes = [
         ('DIFFUSE', 'sRGB', BAKE_SAMPLES_FAST, {'COLOR'}),
@@ -44,41 +269,82 @@ def bake_pbr(obj, tex_size, skip_ao=False):
     if not skip_ao:
         passes.append(('AO', 'Non-Color', BAKE_SAMPLES_AO, None))
 
-    for pass_type, colorspace, samples, pass_filter in passes:
-        img = bpy.data.images.new(f"bake_{pass_type.lower()}", tex_size, tex_size)
-        img.colorspace_settings.name = colorspace
+    key = bake_cache.bake_key(obj, tex_size, skip_ao) if use_cache else None
+    if key is not None:
+        cached = bake_cache.load(key, [(p[0], p[1]) for p in passes])
+        if cached is not None:
+            print(f"  Loaded {', '.join(cached)} from bake cache")
+            return cached
+
+    # One bake target node for all passes: Cycles bakes a single pass per
+    # call, and swapping the target image avoids adding and removing a node
+    # per pass. Active node is the bake target (CRITICAL).
+    img_node = None
+
+    with persistent_data(scene):
+        for pass_type, colorspace, samples, pass_filter in passes:
+            # Fresh images per prop: they are embedded at export, and
+            # clean_scene frees them before the next prop, so memory stays
+            # flat across a batch without pooling datablocks.
+            img = bpy.data.images.new(f"bake_{pass_type.lower()}", tex_size, tex_size)
+            img.colorspace_settings.name = colorspace
+
+            if pass_type in flat_colors:
+                img.pixels.foreach_set(_solid_pixels(flat_colors[pass_type], tex_size))
+                images[pass_type] = img
+                print(f"  Filled {pass_type} (unlinked input)")
+                continue
+
+            if img_node is None:
+                img_node = nodes.new('ShaderNodeTexImage')
+                img_node.location = (800, 0)
+            img_node.image = img
+            nodes.active = img_node
 
-        # Create temp image texture node and make it active (CRITICAL)
-        img_node = nodes.new('ShaderNodeTexImage')
-        img_node.image = img
-        img_node.location = (800, 0)
-        nodes.active = img_node
+            scene.cycles.samples = samples
 
-        scene.cycles.samples = samples
+            with pass_inputs_only(mat, pass_type), object_context(obj):
+                if pass_filter:
+                    bpy.ops.object.bake(type=pass_type, pass_filter=pass_filter)
+                else:
+                    bpy.ops.object.bake(type=pass_type)
 
-        if pass_filter:
-            bpy.ops.object.bake(type=pass_type, pass_filter=pass_filter)
-        else:
-            bpy.ops.object.bake(type=pass_type)
+            if pass_type == 'AO':
+                denoise_ao(img)
+            images[pass_type] = img
+            print(f"  Baked {pass_type}")
 
+    if img_node is not None:
         nodes.remove(img_node)
-        images[pass_type] = img
-        print(f"  Baked {pass_type}")
 
+    if key is not None:
+        bake_cache.store(key, images)
     return images
 
 
-def replace_material_with_baked(obj, images):
-    """Replace procedural material with baked image textures for GLB export.
+# Image node names in the baked material templates, by bake pass
+_BAKED_IMAGE_NODES = {
+    'DIFFUSE': 'Diffuse',
+    'NORMAL': 'Normal',
+    'ROUGHNESS': 'Roughness',
+}
 
-    This is necessary because procedural Blender nodes are silently dropped
-    when exporting to glTF/GLB format.
-    """
-    mat = obj.data.materials[0]
+
+def _build_baked_template(name):
+    """Build the image-textured Principled material that baked props use."""
+    mat = bpy.data.materials.new(name)
+    mat.use_nodes = True
+    mat.use_fake_user = True  # Survives clean_scene; see _baked_template
     nodes = mat.node_tree.nodes
     links = mat.node_tree.links
     nodes.clear()
 
+    def image_node(pass_type, location):
+        node = nodes.new('ShaderNodeTexImage')
+        node.name = node.label = _BAKED_IMAGE_NODES[pass_type]
+        node.location = location
+        return node
+
     output = nodes.new('ShaderNodeOutputMaterial')
     output.location = (400, 0)
 
@@ -87,34 +353,12 @@ def replace_material_with_baked(obj, images):
     principled.inputs['Metallic'].default_value = 0.0
     links.new(principled.outputs['BSDF'], output.inputs['Surface'])
 
-    # Diffuse
-    diff_node = nodes.new('ShaderNodeTexImage')
-    diff_node.location = (-300, 200)
-    diff_node.image = images['DIFFUSE']
-
-    if 'AO' in images:
-        # AO multiply into diffuse
-        ao_node = nodes.new('ShaderNodeTexImage')
-        ao_node.location = (-500, 100)
-        ao_node.image = images['AO']
-        ao_node.image.colorspace_settings.name = 'Non-Color'
-
-        ao_mix = nodes.new('ShaderNodeMix')
-        ao_mix.location = (-100, 200)
-        ao_mix.data_type = 'RGBA'
-        ao_mix.blend_type = 'MULTIPLY'
-        ao_mix.inputs['Factor'].default_value = 1.0
-        links.new(diff_node.outputs['Color'], ao_mix.inputs[6])
-        links.new(ao_node.outputs['Color'], ao_mix.inputs[7])
-        links.new(ao_mix.outputs[2], principled.inputs['Base Color'])
-    else:
-        links.new(diff_node.outputs['Color'], principled.inputs['Base Color'])
+    # Diffuse (AO is premultiplied into it)
+    diff_node = image_node('DIFFUSE', (-300, 200))
+    links.new(diff_node.outputs['Color'], principled.inputs['Base Color'])
 
     # Normal map
-    norm_node = nodes.new('ShaderNodeTexImage')
-    norm_node.location = (-500, -200)
-    norm_node.image = images['NORMAL']
-    norm_node.image.colorspace_settings.name = 'Non-Color'
+    norm_node = image_node('NORMAL', (-500, -200))
 
     normal_map = nodes.new('ShaderNodeNormalMap')
     normal_map.location = (-200, -200)
@@ -123,8 +367,44 @@ def replace_material_with_baked(obj, images):
     links.new(normal_map.outputs['Normal'], principled.inputs['Normal'])
 
     # Roughness
-    rough_node = nodes.new('ShaderNodeTexImage')
-    rough_node.location = (-300, -50)
-    rough_node.image = images['ROUGHNESS']
-    rough_node.image.colorspace_settings.name = 'Non-Color'
+    rough_node = image_node('ROUGHNESS', (-300, -50))
     links.new(rough_node.outputs['Color'], principled.inputs['Roughness'])
+    return mat
+
+
+def _baked_template():
+    """Return the baked material template, building it once per Blender session.
+
+    The template carries a fake user, which clean_scene leaves in place, so
+    a batch worker builds its node graph once rather than once per prop.
+    """
+    name = '_BakedTemplate'
+    return bpy.data.materials.get(name) or _build_baked_template(name)
+
+
+def replace_material_with_baked(obj, images):
+    """Replace procedural material with baked image textures for GLB export.
+
+    This is necessary because procedural Blender nodes are silently dropped
+    when exporting to glTF/GLB format. The baked material is a copy of a
+    prebuilt template with its image slots pointed at the baked passes; it
+    takes over the procedural material's name. An AO pass is premultiplied
+    into the diffuse image rather than exported as its own texture.
+    """
+    images = dict(images)
+    ao = images.pop('AO', None)
+    if ao is not None:
+        premultiply_ao(images['DIFFUSE'], ao)
+
+    mat = obj.data.materials[0]
+    baked = _baked_template().copy()
+    baked.use_fake_user = False
+
+    name = mat.name
+    obj.data.materials[0] = baked
+    bpy.data.materials.remove(mat)
+    baked.name = name
+
+    nodes = baked.node_tree.nodes
+    for pass_type, img in images.items():
+        nodes[_BAKED_IMAGE_NODES[pass_type]].image = img
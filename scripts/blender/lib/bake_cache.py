@@ -0,0 +1,156 @@
+"""Content-addressed disk cache for baked PBR passes.
+
+A bake depends on the mesh, its UV layout and the material's node graph,
+so the cache key hashes all three (plus texture size and bake settings).
+Re-running an unchanged prop loads its passes from disk instead of
+invoking Cycles; any edit to geometry, shading, UVs or material misses
+the cache.
+"""
+import bpy
+import hashlib
+import os
+import numpy as np
+from .conventions import BAKE_CACHE_DIR, BAKE_SAMPLES_FAST, BAKE_SAMPLES_AO
+
+# Bump when bake output changes for reasons the key cannot see
+CACHE_VERSION = 4
+
+# Node RNA properties that do not affect shading
+_IGNORED_PROPS = {
+    'name', 'label', 'location', 'width', 'width_hidden', 'height',
+    'hide', 'mute', 'select', 'show_options', 'show_preview',
+    'show_texture', 'use_custom_color', 'color',
+}
+_VALUE_TYPES = {'BOOLEAN', 'INT', 'FLOAT', 'ENUM', 'STRING'}
+
+
+def _plain(value):
+    """Convert an RNA value to a plain value with a stable repr."""
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(value))  # Enum flags; set order varies per process
+    if isinstance(value, str):
+        return value
+    try:
+        return tuple(value)
+    except TypeError:
+        return value
+
+
+def material_signature(mat):
+    """Describe a material's node graph as a deterministic string."""
+    return _tree_signature(mat.node_tree)
+
+
+def _tree_signature(tree):
+    """Describe a node tree, including any node groups it uses."""
+    parts = []
+    for node in sorted(tree.nodes, key=lambda n: n.name):
+        props = tuple(
+            (p.identifier, _plain(getattr(node, p.identifier)))
+            for p in node.bl_rna.properties
+            if p.type in _VALUE_TYPES and not p.is_readonly
+            and p.identifier not in _IGNORED_PROPS
+        )
+        inputs = tuple(
+            (s.identifier, _plain(getattr(s, 'default_value', None)))
+            for s in node.inputs if not s.is_linked
+        )
+        ramp = getattr(node, 'color_ramp', None)
+        stops = tuple(
+            (e.position, tuple(e.color)) for e in ramp.elements
+        ) if ramp is not None else ()
+        group = getattr(node, 'node_tree', None)
+        group_sig = _tree_signature(group) if group is not None else None
+        parts.append(repr((node.bl_idname, node.name, props, inputs, stops, group_sig)))
+    links = sorted(
+        (l.from_node.name, l.from_socket.identifier, l.to_node.name, l.to_socket.identifier)
+        for l in tree.links
+    )
+    parts.append(repr(links))
+    return '\n'.join(parts)
+
+
+def _mesh_arrays(mesh):
+    """Yield the mesh arrays a bake depends on, read with foreach_get."""
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', co)
+    yield co
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get('vertex_index', loop_verts)
+    yield loop_verts
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get('loop_total', loop_totals)
+    yield loop_totals
+    # Smooth/flat shading, sharp edges and custom normals change the baked normals and AO
+    smooth = np.empty(len(mesh.polygons), dtype=bool)
+    mesh.polygons.foreach_get('use_smooth', smooth)
+    yield smooth
+    sharp_edge = mesh.attributes.get('sharp_edge')
+    if sharp_edge is not None:
+        sharp = np.empty(len(mesh.edges), dtype=bool)
+        sharp_edge.data.foreach_get('value', sharp)
+        yield sharp
+    if mesh.has_custom_normals:
+        normals = np.empty(len(mesh.loops) * 3, dtype=np.float32)
+        if hasattr(mesh, 'corner_normals'):  # Blender 4.1+
+            mesh.corner_normals.foreach_get('vector', normals)
+        else:
+            mesh.calc_normals_split()
+            mesh.loops.foreach_get('normal', normals)
+        yield normals
+    uv_layer = mesh.uv_layers.active
+    if uv_layer is not None:
+        uv = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+        uv_layer.data.foreach_get('uv', uv)
+        yield uv
+
+
+def bake_key(obj, tex_size, skip_ao, extra=()):
+    """Return the cache key for baking obj's first material at tex_size.
+
+    Args:
+        extra: Additional settings that change the stored result (for
+            example post-processing), kept apart from the defaults.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    settings = (CACHE_VERSION, tex_size, skip_ao, BAKE_SAMPLES_FAST, BAKE_SAMPLES_AO) + tuple(extra)
+    h.update(repr(settings).encode())
+    for array in _mesh_arrays(obj.data):
+        h.update(array.tobytes())
+    h.update(material_signature(obj.data.materials[0]).encode())
+    return h.hexdigest()
+
+
+def _pass_path(key, pass_type):
+    return os.path.join(BAKE_CACHE_DIR, f'{key}_{pass_type.lower()}.png')
+
+
+def load(key, passes):
+    """Return {pass: Image} loaded from the cache, or None on any miss.
+
+    Args:
+        key: Cache key from bake_key().
+        passes: Iterable of (pass_type, colorspace) pairs.
+    """
+    if BAKE_CACHE_DIR is None:
+        return None
+    passes = list(passes)
+    if not all(os.path.exists(_pass_path(key, p)) for p, _ in passes):
+        return None
+    images = {}
+    for pass_type, colorspace in passes:
+        img = bpy.data.images.load(_pass_path(key, pass_type))
+        img.colorspace_settings.name = colorspace
+        images[pass_type] = img
+    return images
+
+
+def store(key, images):
+    """Write baked images to the cache as PNG."""
+    if BAKE_CACHE_DIR is None:
+        return
+    os.makedirs(BAKE_CACHE_DIR, exist_ok=True)
+    for pass_type, img in images.items():
+        img.filepath_raw = _pass_path(key, pass_type)
+        img.file_format = 'PNG'
+        img.save()
@@ -0,0 +1,70 @@
+"""Run pipeline scripts in parallel background Blender processes."""
+import bpy
+import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from .bake import bake_backend
+
+
+def default_jobs():
+    """Concurrent Blender processes for a batch.
+
+    On a GPU every process would bake on the same device and only queue
+    behind the others, so batches run one at a time. On the CPU each
+    process already spreads its bake across threads, so half the cores
+    are used as processes.
+    """
+    if bake_backend():
+        return 1
+    return max(1, (os.cpu_count() or 2) // 2)
+
+
+def run_blender(script, args=(), threads=1, on_line=None):
+    """Run a Python script in a background Blender and wait for it to exit.
+
+    A script that raises exits with code 1 (Blender returns 0 by default).
+    Output lines in the pipeline's log format (starting with '[' or two
+    spaces) are echoed. on_line, if given, sees every line first and can
+    return True to consume it instead.
+
+    Returns:
+        (returncode, last non-empty output line).
+    """
+    cmd = [
+        bpy.app.binary_path, '--background', '--factory-startup',
+        '--threads', str(threads), '--python-exit-code', '1', '--python', script,
+    ]
+    if args:
+        cmd += ['--', *args]
+    proc = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+    )
+    last_line = ''
+    for line in proc.stdout:
+        line = line.rstrip('\n')
+        consumed = on_line is not None and on_line(line)
+        if not consumed and (line.startswith('[') or line.startswith('  ')):
+            print(line)
+        if line.strip():
+            last_line = line
+    proc.wait()
+    return proc.returncode, last_line
+
+
+def run_parallel(fn, items, jobs):
+    """Call fn(item, threads) for every item on up to `jobs` threads.
+
+    The CPU cores are split evenly between the concurrent calls, for fn to
+    pass on to its Blender process.
+
+    Returns:
+        dict mapping each item to its result.
+    """
+    if not items:
+        return {}
+    jobs = min(jobs, len(items))
+    threads = max(1, (os.cpu_count() or 1) // jobs)
+    # Threads are enough here: each one just waits on its Blender process
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(fn, item, threads): item for item in items}
+        return {futures[f]: f.result() for f in as_completed(futures)}
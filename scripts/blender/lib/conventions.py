@@ -25,10 +25,26 @@ MAX_GLB_KB = 100
 JPEG_QUALITY = 85
 JPEG_QUALITY_NORMAL = 90  # Higher quality for normal maps
 
+# Embedded GLB textures: WebP (EXT_texture_webp, decoded natively by
+# three.js GLTFLoader) where the Blender exporter supports it, else JPEG
+WEBP_QUALITY = 80
+
+# Cycles bake device: 'AUTO' uses the first available GPU backend and
+# falls back to CPU; 'CPU' forces CPU (e.g. for CI)
+BAKE_DEVICE = os.environ.get('BAKE_DEVICE', 'AUTO').upper()
+
+# On-disk cache of baked passes (set BAKE_CACHE_DIR=off to disable)
+_bake_cache_env = os.environ.get('BAKE_CACHE_DIR', os.path.join('~', '.cache', '2dhd_bakes'))
+BAKE_CACHE_DIR = None if _bake_cache_env.lower() in ('', 'off', '0') else os.path.expanduser(_bake_cache_env)
+
+# On-disk cache of processed prop meshes (set MESH_CACHE_DIR=off to disable)
+_mesh_cache_env = os.environ.get('MESH_CACHE_DIR', os.path.join('~', '.cache', '2dhd_meshes'))
+MESH_CACHE_DIR = None if _mesh_cache_env.lower() in ('', 'off', '0') else os.path.expanduser(_mesh_cache_env)
+
 # Bake samples
 BAKE_SAMPLES_FAST = 1      # diffuse, roughness
 BAKE_SAMPLES_NORMAL = 1    # normal maps
-BAKE_SAMPLES_AO = 64       # ambient occlusion needs more
+BAKE_SAMPLES_AO = 8        # ambient occlusion; denoised after baking
 
 # PBR Material parameter ranges (for reference / validation)
 MATERIAL_RANGES = {
@@ -1,7 +1,12 @@
 """GLB export utilities for the Blender asset pipeline."""
 import bpy
+import bmesh
 import os
-from .conventions import MAX_GLB_KB, JPEG_QUALITY
+import shutil
+import subprocess
+from functools import lru_cache
+from .mesh_ops import object_bmesh
+from .conventions import MAX_GLB_KB, JPEG_QUALITY, WEBP_QUALITY
 
 
 def prepare_for_export(obj):
@@ -9,21 +14,61 @@ def prepare_for_export(obj):
     bpy.context.view_layer.objects.active = obj
     obj.select_set(True)
 
-    # Triangulate (required for tangent export)
-    tri_mod = obj.modifiers.new('Triangulate', 'TRIANGULATE')
-    bpy.ops.object.modifier_apply(modifier='Triangulate')
+    # Triangulate the mesh data in place: tangent export fails on n-gons
+    # (cylinder caps), and the exporter then only reads loop triangles
+    with object_bmesh(obj) as bm:
+        bmesh.ops.triangulate(
+            bm, faces=bm.faces, quad_method='SHORT_EDGE', ngon_method='BEAUTY',
+        )
 
     # Apply transforms
     bpy.ops.object.transform_apply(location=False, rotation=True, scale=True)
 
 
-def export_glb(obj, output_path, jpeg_quality=JPEG_QUALITY):
-    """Export the active object as a GLB with JPEG-compressed embedded textures.
+def optimize_glb(path):
+    """Reorder GLB index/vertex buffers for GPU cache efficiency with gltfpack.
+
+    Runs gltfpack's vertex-cache, overdraw and vertex-fetch optimization in
+    place. Quantization and meshopt compression are disabled (-noq, no -c)
+    so the output stays loadable without extensions the runtime does not
+    decode; DRACO compression is applied later by compress-models.mjs.
+
+    Returns:
+        True if the file was optimized, False if gltfpack is not installed.
+    """
+    gltfpack = shutil.which('gltfpack')
+    if gltfpack is None:
+        return False
+
+    tmp_path = path + '.tmp.glb'
+    subprocess.run(
+        [gltfpack, '-i', path, '-o', tmp_path, '-kn', '-km', '-noq'],
+        check=True, stdout=subprocess.DEVNULL,
+    )
+    os.replace(tmp_path, path)
+    return True
+
+
+@lru_cache(maxsize=None)
+def embedded_image_format():
+    """Return ('WEBP', WEBP_QUALITY) if the glTF exporter supports WebP, else JPEG."""
+    props = bpy.ops.export_scene.gltf.get_rna_type().properties
+    if 'WEBP' in props['export_image_format'].enum_items.keys():
+        return 'WEBP', WEBP_QUALITY
+    return 'JPEG', JPEG_QUALITY
+
+
+def export_glb(obj, output_path, image_quality=None):
+    """Export the active object as a GLB with compressed embedded textures.
+
+    Textures are WebP where the exporter supports it (about half the
+    size of JPEG at similar quality), otherwise JPEG.
 
     Args:
         obj: The object to export.
         output_path: Absolute path for the .glb file.
-        jpeg_quality: JPEG quality (0-100) for embedded textures.
+        image_quality: Quality (0-100) for embedded textures; defaults to
+            the format's quality from conventions.
 
     Returns:
         dict with metadata: file_size_kb, tri_count, height.
@@ -33,27 +78,29 @@ def export_glb(obj, output_path, jpeg_quality=JPEG_QUALITY):
     bpy.context.view_layer.objects.active = obj
     obj.select_set(True)
 
+    image_format, default_quality = embedded_image_format()
+
     bpy.ops.export_scene.gltf(
         filepath=output_path,
         export_format='GLB',
         use_selection=True,
-        export_apply=True,
+        # Modifiers are already applied and the mesh triangulated by
+        # prepare_for_export, so export the mesh as-is (no evaluated copy)
+        export_apply=False,
         export_tangents=True,
         export_yup=True,
-        export_image_format='JPEG',
-        export_image_quality=jpeg_quality,
+        export_image_format=image_format,
+        export_image_quality=image_quality or default_quality,
     )
+    optimize_glb(output_path)
 
     file_size_kb = os.path.getsize(output_path) / 1024
-    tri_count = sum(len(p.vertices) - 2 for p in obj.data.polygons)
-
-    # Get bounding box height
-    if obj.data.vertices:
-        min_z = min(v.co.z for v in obj.data.vertices)
-        max_z = max(v.co.z for v in obj.data.vertices)
-        height = max_z - min_z
-    else:
-        height = 0
+    # prepare_for_export triangulated the mesh, so every polygon is a triangle
+    tri_count = len(obj.data.polygons)
+
+    # Bounding box height from the 8 cached corners (zeros for an empty mesh)
+    zs = [corner[2] for corner in obj.bound_box]
+    height = max(zs) - min(zs)
 
     if file_size_kb > MAX_GLB_KB:
         print(f"  WARNING: GLB {file_size_kb:.1f}KB exceeds {MAX_GLB_KB}KB budget!")
@@ -3,273 +3,285 @@
 Each factory creates a Blender material with procedural shader nodes.
 Materials must be BAKED to image textures before GLB export (procedural
 nodes are silently dropped in glTF).
-"""
-import bpy
-
-
-def create_northern_stone(name='NorthernStone', scale=4.0, seed=0):
-    """Create a grey stone material with Voronoi block pattern and FBM grain."""
-    mat = bpy.data.materials.new(name)
-    mat.use_nodes = True
-    nodes = mat.node_tree.nodes
-    links = mat.node_tree.links
-    nodes.clear()
 
-    output = nodes.new('ShaderNodeOutputMaterial')
-    output.location = (600, 0)
-
-    principled = nodes.new('ShaderNodeBsdfPrincipled')
-    principled.location = (300, 0)
-    principled.inputs['Roughness'].default_value = 0.85
-    principled.inputs['Specular IOR Level'].default_value = 0.3
-    principled.inputs['Metallic'].default_value = 0.0
-    links.new(principled.outputs['BSDF'], output.inputs['Surface'])
+The textures are driven by Object coordinates, so they vary over the 3D
+surface rather than over UV space. Evaluating them outside Cycles would
+need the surface position of every texel (which is what a bake computes)
+and a reimplementation of Blender's noise functions to match, so baking
+stays the way to turn them into images.
 
+Factories are memoized per parameter set: the node graph is built once
+into a fake-user template and each call returns a copy of it.
+"""
+import bpy
+import functools
+import inspect
+
+# (factory, params) -> template material name
+_TEMPLATES = {}
+
+
+def _cached_factory(factory):
+    """Build each distinct parameter set once and hand out copies.
+
+    Templates carry a fake user, which clean_scene leaves in place, so a
+    batch run builds every node graph at most once per Blender session.
+    Copying a material duplicates its node tree in C, which is much cheaper
+    than recreating the nodes and links from Python.
+    """
+    signature = inspect.signature(factory)
+
+    @functools.wraps(factory)
+    def wrapper(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        params = dict(bound.arguments)
+        name = params.pop('name')
+        key = (factory.__name__, tuple(sorted(params.items())))
+        template_name = _TEMPLATES.setdefault(key, f'_Template{len(_TEMPLATES)}_{factory.__name__}')
+
+        template = bpy.data.materials.get(template_name)
+        if template is None:
+            template = factory(template_name, **params)
+            template.use_fake_user = True
+        mat = template.copy()
+        mat.use_fake_user = False
+        mat.name = name
+        return mat
+
+    return wrapper
+
+
+def _object_mapping_group(scale):
+    """Return the shared node group that maps Object coordinates by `scale`.
+
+    Materials reference one group per scale instead of each carrying its
+    own Texture Coordinate and Mapping pair. Node groups are not cleared
+    by clean_scene, so a batch builds each one once.
+    """
+    name = '_ObjectMapping({:g}, {:g}, {:g})'.format(*scale)
+    group = bpy.data.node_groups.get(name)
+    if group is not None:
+        return group
+
+    group = bpy.data.node_groups.new(name, 'ShaderNodeTree')
+    group.interface.new_socket('Vector', in_out='OUTPUT', socket_type='NodeSocketVector')
+    nodes, links = group.nodes, group.links
     tex_coord = nodes.new('ShaderNodeTexCoord')
-    tex_coord.location = (-1000, 0)
+    tex_coord.location = (-400, 0)
     mapping = nodes.new('ShaderNodeMapping')
-    mapping.location = (-800, 0)
-    mapping.inputs['Scale'].default_value = (scale, scale, scale)
+    mapping.location = (-200, 0)
+    mapping.inputs['Scale'].default_value = scale
+    output = nodes.new('NodeGroupOutput')
     links.new(tex_coord.outputs['Object'], mapping.inputs['Vector'])
-
-    # FBM noise for stone grain
-    noise = nodes.new('ShaderNodeTexNoise')
-    noise.location = (-500, 100)
-    noise.noise_type = 'FBM'
-    noise.inputs['Scale'].default_value = 6.0
-    noise.inputs['Detail'].default_value = 8.0
-    noise.inputs['Roughness'].default_value = 0.6
-    links.new(mapping.outputs['Vector'], noise.inputs['Vector'])
-
-    # Voronoi for block pattern
-    voronoi = nodes.new('ShaderNodeTexVoronoi')
-    voronoi.location = (-500, -200)
-    voronoi.inputs['Scale'].default_value = 3.0
-    voronoi.feature = 'F1'
-    links.new(mapping.outputs['Vector'], voronoi.inputs['Vector'])
-
-    # Mix patterns
-    mix_pat = nodes.new('ShaderNodeMix')
-    mix_pat.location = (-250, 0)
-    mix_pat.data_type = 'FLOAT'
-    mix_pat.inputs['Factor'].default_value = 0.3
-    links.new(noise.outputs['Fac'], mix_pat.inputs[2])
-    links.new(voronoi.outputs['Distance'], mix_pat.inputs[3])
-
-    # Color ramp: grey stone palette
-    ramp = nodes.new('ShaderNodeValToRGB')
-    ramp.location = (0, 100)
-    ramp.color_ramp.elements[0].position = 0.3
-    ramp.color_ramp.elements[0].color = (0.29, 0.27, 0.25, 1.0)
-    ramp.color_ramp.elements[1].position = 0.7
-    ramp.color_ramp.elements[1].color = (0.42, 0.40, 0.37, 1.0)
-    links.new(mix_pat.outputs[0], ramp.inputs['Fac'])
-    links.new(ramp.outputs['Color'], principled.inputs['Base Color'])
-
-    # Bump
-    bump = nodes.new('ShaderNodeBump')
-    bump.location = (100, -200)
-    bump.inputs['Strength'].default_value = 0.3
-    links.new(noise.outputs['Fac'], bump.inputs['Height'])
-    links.new(bump.outputs['Normal'], principled.inputs['Normal'])
-
+    links.new(mapping.outputs['Vector'], output.inputs['Vector'])
+    return group
+
+
+def _build_graph(mat, node_specs, link_specs):
+    """Replace a material's node graph with one described by spec tables.
+
+    Args:
+        mat: Material to (re)build.
+        node_specs: (key, bl_idname, location, properties, input_defaults)
+            tuples. Properties are set before inputs, since some (Mix
+            data_type) change which sockets exist. A 'color_ramp' property
+            is a sequence of (position, color) stops.
+        link_specs: (from_key, output, to_key, input) tuples; sockets are
+            names or indices.
+    """
+    mat.use_nodes = True
+    tree = mat.node_tree
+    new_node, new_link = tree.nodes.new, tree.links.new
+    tree.nodes.clear()
+
+    built = {}
+    for key, bl_idname, location, props, defaults in node_specs:
+        node = new_node(bl_idname)
+        node.location = location
+        for attr, value in props.items():
+            if attr == 'color_ramp':
+                for element, (position, color) in zip(node.color_ramp.elements, value):
+                    element.position = position
+                    element.color = color
+            else:
+                setattr(node, attr, value)
+        inputs = node.inputs
+        for socket, value in defaults.items():
+            inputs[socket].default_value = value
+        built[key] = node
+
+    for from_key, output, to_key, socket in link_specs:
+        new_link(built[from_key].outputs[output], built[to_key].inputs[socket])
+    return built
+
+
+@_cached_factory
+def create_northern_stone(name='NorthernStone', scale=4.0, seed=0):
+    """Create a grey stone material with Voronoi block pattern and FBM grain."""
+    mat = bpy.data.materials.new(name)
+    _build_graph(mat, (
+        ('output', 'ShaderNodeOutputMaterial', (600, 0), {}, {}),
+        ('principled', 'ShaderNodeBsdfPrincipled', (300, 0), {}, {
+            'Roughness': 0.85, 'Specular IOR Level': 0.3, 'Metallic': 0.0,
+        }),
+        ('mapping', 'ShaderNodeGroup', (-800, 0), {'node_tree': _object_mapping_group((scale, scale, scale))}, {}),
+        # FBM noise for stone grain
+        ('noise', 'ShaderNodeTexNoise', (-500, 100), {'noise_type': 'FBM'}, {
+            'Scale': 6.0, 'Detail': 8.0, 'Roughness': 0.6,
+        }),
+        # Voronoi for block pattern
+        ('voronoi', 'ShaderNodeTexVoronoi', (-500, -200), {'feature': 'F1'}, {'Scale': 3.0}),
+        # Mix patterns
+        ('mix_pat', 'ShaderNodeMix', (-250, 0), {'data_type': 'FLOAT'}, {'Factor': 0.3}),
+        # Color ramp: grey stone palette
+        ('ramp', 'ShaderNodeValToRGB', (0, 100), {'color_ramp': (
+            (0.3, (0.29, 0.27, 0.25, 1.0)),
+            (0.7, (0.42, 0.40, 0.37, 1.0)),
+        )}, {}),
+        ('bump', 'ShaderNodeBump', (100, -200), {}, {'Strength': 0.3}),
+    ), (
+        ('principled', 'BSDF', 'output', 'Surface'),
+        ('mapping', 'Vector', 'noise', 'Vector'),
+        ('mapping', 'Vector', 'voronoi', 'Vector'),
+        ('noise', 'Fac', 'mix_pat', 2),
+        ('voronoi', 'Distance', 'mix_pat', 3),
+        ('mix_pat', 0, 'ramp', 'Fac'),
+        ('ramp', 'Color', 'principled', 'Base Color'),
+        ('noise', 'Fac', 'bump', 'Height'),
+        ('bump', 'Normal', 'principled', 'Normal'),
+    ))
     return mat
 
 
+@_cached_factory
 def create_ironwood(name='Ironwood', scale=2.0, grain_density=3.0, seed=0):
     """Create dark ironwood material with vertical grain and knots."""
     mat = bpy.data.materials.new(name)
-    mat.use_nodes = True
-    nodes = mat.node_tree.nodes
-    links = mat.node_tree.links
-    nodes.clear()
-
-    output = nodes.new('ShaderNodeOutputMaterial')
-    output.location = (600, 0)
-
-    principled = nodes.new('ShaderNodeBsdfPrincipled')
-    principled.location = (300, 0)
-    principled.inputs['Roughness'].default_value = 0.65
-    principled.inputs['Specular IOR Level'].default_value = 0.35
-    principled.inputs['Metallic'].default_value = 0.0
-    links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-
-    tex_coord = nodes.new('ShaderNodeTexCoord')
-    tex_coord.location = (-1000, 0)
-    mapping = nodes.new('ShaderNodeMapping')
-    mapping.location = (-800, 0)
-    mapping.inputs['Scale'].default_value = (scale, scale, scale * 4)
-    links.new(tex_coord.outputs['Object'], mapping.inputs['Vector'])
-
-    # Wave for grain
-    wave = nodes.new('ShaderNodeTexWave')
-    wave.location = (-600, 200)
-    wave.wave_type = 'BANDS'
-    wave.bands_direction = 'Z'
-    wave.inputs['Scale'].default_value = grain_density
-    wave.inputs['Distortion'].default_value = 4.0
-    wave.inputs['Detail'].default_value = 4.0
-    links.new(mapping.outputs['Vector'], wave.inputs['Vector'])
-
-    # Noise for variation
-    noise = nodes.new('ShaderNodeTexNoise')
-    noise.location = (-600, -100)
-    noise.noise_type = 'FBM'
-    noise.inputs['Scale'].default_value = 12.0
-    noise.inputs['Detail'].default_value = 6.0
-    links.new(mapping.outputs['Vector'], noise.inputs['Vector'])
-
-    # Voronoi for knots
-    voronoi = nodes.new('ShaderNodeTexVoronoi')
-    voronoi.location = (-600, -350)
-    voronoi.inputs['Scale'].default_value = 2.0
-    voronoi.feature = 'F1'
-    links.new(mapping.outputs['Vector'], voronoi.inputs['Vector'])
-
-    # Mix grain patterns
-    mix1 = nodes.new('ShaderNodeMix')
-    mix1.location = (-350, 100)
-    mix1.data_type = 'FLOAT'
-    mix1.inputs['Factor'].default_value = 0.3
-    links.new(wave.outputs['Fac'], mix1.inputs[2])
-    links.new(noise.outputs['Fac'], mix1.inputs[3])
-
-    mix2 = nodes.new('ShaderNodeMix')
-    mix2.location = (-200, 50)
-    mix2.data_type = 'FLOAT'
-    mix2.inputs['Factor'].default_value = 0.15
-    links.new(mix1.outputs[0], mix2.inputs[2])
-    links.new(voronoi.outputs['Distance'], mix2.inputs[3])
-
-    # Color ramp: dark ironwood
-    ramp = nodes.new('ShaderNodeValToRGB')
-    ramp.location = (0, 100)
-    ramp.color_ramp.elements[0].position = 0.3
-    ramp.color_ramp.elements[0].color = (0.176, 0.133, 0.094, 1.0)
-    ramp.color_ramp.elements[1].position = 0.7
-    ramp.color_ramp.elements[1].color = (0.290, 0.208, 0.145, 1.0)
-    links.new(mix2.outputs[0], ramp.inputs['Fac'])
-    links.new(ramp.outputs['Color'], principled.inputs['Base Color'])
-
-    # Roughness variation
-    rough_ramp = nodes.new('ShaderNodeValToRGB')
-    rough_ramp.location = (0, -150)
-    rough_ramp.color_ramp.elements[0].position = 0.3
-    rough_ramp.color_ramp.elements[0].color = (0.55, 0.55, 0.55, 1.0)
-    rough_ramp.color_ramp.elements[1].position = 0.7
-    rough_ramp.color_ramp.elements[1].color = (0.75, 0.75, 0.75, 1.0)
-    links.new(mix1.outputs[0], rough_ramp.inputs['Fac'])
-    links.new(rough_ramp.outputs['Color'], principled.inputs['Roughness'])
-
-    # Bump
-    bump = nodes.new('ShaderNodeBump')
-    bump.location = (100, -300)
-    bump.inputs['Strength'].default_value = 0.2
-    links.new(mix2.outputs[0], bump.inputs['Height'])
-    links.new(bump.outputs['Normal'], principled.inputs['Normal'])
-
+    _build_graph(mat, (
+        ('output', 'ShaderNodeOutputMaterial', (600, 0), {}, {}),
+        ('principled', 'ShaderNodeBsdfPrincipled', (300, 0), {}, {
+            'Roughness': 0.65, 'Specular IOR Level': 0.35, 'Metallic': 0.0,
+        }),
+        ('mapping', 'ShaderNodeGroup', (-800, 0), {'node_tree': _object_mapping_group((scale, scale, scale * 4))}, {}),
+        # Wave for grain
+        ('wave', 'ShaderNodeTexWave', (-600, 200), {'wave_type': 'BANDS', 'bands_direction': 'Z'}, {
+            'Scale': grain_density, 'Distortion': 4.0, 'Detail': 4.0,
+        }),
+        # Noise for variation
+        ('noise', 'ShaderNodeTexNoise', (-600, -100), {'noise_type': 'FBM'}, {
+            'Scale': 12.0, 'Detail': 6.0,
+        }),
+        # Voronoi for knots
+        ('voronoi', 'ShaderNodeTexVoronoi', (-600, -350), {'feature': 'F1'}, {'Scale': 2.0}),
+        # Mix grain patterns
+        ('mix1', 'ShaderNodeMix', (-350, 100), {'data_type': 'FLOAT'}, {'Factor': 0.3}),
+        ('mix2', 'ShaderNodeMix', (-200, 50), {'data_type': 'FLOAT'}, {'Factor': 0.15}),
+        # Color ramp: dark ironwood
+        ('ramp', 'ShaderNodeValToRGB', (0, 100), {'color_ramp': (
+            (0.3, (0.176, 0.133, 0.094, 1.0)),
+            (0.7, (0.290, 0.208, 0.145, 1.0)),
+        )}, {}),
+        # Roughness variation
+        ('rough_ramp', 'ShaderNodeValToRGB', (0, -150), {'color_ramp': (
+            (0.3, (0.55, 0.55, 0.55, 1.0)),
+            (0.7, (0.75, 0.75, 0.75, 1.0)),
+        )}, {}),
+        ('bump', 'ShaderNodeBump', (100, -300), {}, {'Strength': 0.2}),
+    ), (
+        ('principled', 'BSDF', 'output', 'Surface'),
+        ('mapping', 'Vector', 'wave', 'Vector'),
+        ('mapping', 'Vector', 'noise', 'Vector'),
+        ('mapping', 'Vector', 'voronoi', 'Vector'),
+        ('wave', 'Fac', 'mix1', 2),
+        ('noise', 'Fac', 'mix1', 3),
+        ('mix1', 0, 'mix2', 2),
+        ('voronoi', 'Distance', 'mix2', 3),
+        ('mix2', 0, 'ramp', 'Fac'),
+        ('ramp', 'Color', 'principled', 'Base Color'),
+        ('mix1', 0, 'rough_ramp', 'Fac'),
+        ('rough_ramp', 'Color', 'principled', 'Roughness'),
+        ('mix2', 0, 'bump', 'Height'),
+        ('bump', 'Normal', 'principled', 'Normal'),
+    ))
     return mat
 
 
+@_cached_factory
 def create_dark_iron(name='DarkIron', scale=8.0, seed=0):
     """Create aged dark iron/metal material with scratches."""
     mat = bpy.data.materials.new(name)
-    mat.use_nodes = True
-    nodes = mat.node_tree.nodes
-    links = mat.node_tree.links
-    nodes.clear()
-
-    output = nodes.new('ShaderNodeOutputMaterial')
-    output.location = (600, 0)
-
-    principled = nodes.new('ShaderNodeBsdfPrincipled')
-    principled.location = (300, 0)
-    principled.inputs['Roughness'].default_value = 0.45
-    principled.inputs['Metallic'].default_value = 0.9
-    principled.inputs['Specular IOR Level'].default_value = 0.5
-    principled.inputs['Base Color'].default_value = (0.18, 0.18, 0.18, 1.0)
-    links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-
-    tex_coord = nodes.new('ShaderNodeTexCoord')
-    tex_coord.location = (-800, 0)
-    mapping = nodes.new('ShaderNodeMapping')
-    mapping.location = (-600, 0)
-    mapping.inputs['Scale'].default_value = (scale, scale, scale)
-    links.new(tex_coord.outputs['Object'], mapping.inputs['Vector'])
-
-    # Noise for surface variation
-    noise = nodes.new('ShaderNodeTexNoise')
-    noise.location = (-400, 100)
-    noise.noise_type = 'FBM'
-    noise.inputs['Scale'].default_value = 20.0
-    noise.inputs['Detail'].default_value = 4.0
-    links.new(mapping.outputs['Vector'], noise.inputs['Vector'])
-
-    # Scratches via wave
-    wave = nodes.new('ShaderNodeTexWave')
-    wave.location = (-400, -150)
-    wave.wave_type = 'BANDS'
-    wave.inputs['Scale'].default_value = 15.0
-    wave.inputs['Distortion'].default_value = 8.0
-    wave.inputs['Detail'].default_value = 3.0
-    links.new(mapping.outputs['Vector'], wave.inputs['Vector'])
-
-    # Mix for roughness variation (scratched areas are shinier)
-    rough_mix = nodes.new('ShaderNodeMix')
-    rough_mix.location = (-100, 0)
-    rough_mix.data_type = 'FLOAT'
-    rough_mix.inputs['Factor'].default_value = 0.3
-    rough_mix.inputs[2].default_value = 0.45  # Base roughness
-    links.new(wave.outputs['Fac'], rough_mix.inputs[3])
-    links.new(rough_mix.outputs[0], principled.inputs['Roughness'])
-
-    # Bump
-    bump = nodes.new('ShaderNodeBump')
-    bump.location = (100, -200)
-    bump.inputs['Strength'].default_value = 0.15
-    links.new(noise.outputs['Fac'], bump.inputs['Height'])
-    links.new(bump.outputs['Normal'], principled.inputs['Normal'])
-
+    _build_graph(mat, (
+        ('output', 'ShaderNodeOutputMaterial', (600, 0), {}, {}),
+        ('principled', 'ShaderNodeBsdfPrincipled', (300, 0), {}, {
+            'Roughness': 0.45, 'Metallic': 0.9, 'Specular IOR Level': 0.5,
+            'Base Color': (0.18, 0.18, 0.18, 1.0),
+        }),
+        ('mapping', 'ShaderNodeGroup', (-600, 0), {'node_tree': _object_mapping_group((scale, scale, scale))}, {}),
+        # Noise for surface variation
+        ('noise', 'ShaderNodeTexNoise', (-400, 100), {'noise_type': 'FBM'}, {
+            'Scale': 20.0, 'Detail': 4.0,
+        }),
+        # Scratches via wave
+        ('wave', 'ShaderNodeTexWave', (-400, -150), {'wave_type': 'BANDS'}, {
+            'Scale': 15.0, 'Distortion': 8.0, 'Detail': 3.0,
+        }),
+        # Mix for roughness variation (scratched areas are shinier)
+        ('rough_mix', 'ShaderNodeMix', (-100, 0), {'data_type': 'FLOAT'}, {
+            'Factor': 0.3, 2: 0.45,  # Base roughness
+        }),
+        ('bump', 'ShaderNodeBump', (100, -200), {}, {'Strength': 0.15}),
+    ), (
+        ('principled', 'BSDF', 'output', 'Surface'),
+        ('mapping', 'Vector', 'noise', 'Vector'),
+        ('mapping', 'Vector', 'wave', 'Vector'),
+        ('wave', 'Fac', 'rough_mix', 3),
+        ('rough_mix', 0, 'principled', 'Roughness'),
+        ('noise', 'Fac', 'bump', 'Height'),
+        ('bump', 'Normal', 'principled', 'Normal'),
+    ))
     return mat
 
 
+@_cached_factory
 def create_leather(name='Leather', base_color=(0.30, 0.20, 0.12), seed=0):
     """Create leather material with subtle grain."""
     mat = bpy.data.materials.new(name)
-    mat.use_nodes = True
-    nodes = mat.node_tree.nodes
-    links = mat.node_tree.links
-    nodes.clear()
-
-    output = nodes.new('ShaderNodeOutputMaterial')
-    output.location = (600, 0)
-
-    principled = nodes.new('ShaderNodeBsdfPrincipled')
-    principled.location = (300, 0)
-    principled.inputs['Roughness'].default_value = 0.6
-    principled.inputs['Metallic'].default_value = 0.0
-    principled.inputs['Base Color'].default_value = (*base_color, 1.0)
-    links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-
-    tex_coord = nodes.new('ShaderNodeTexCoord')
-    tex_coord.location = (-800, 0)
-    mapping = nodes.new('ShaderNodeMapping')
-    mapping.location = (-600, 0)
-    mapping.inputs['Scale'].default_value = (6.0, 6.0, 6.0)
-    links.new(tex_coord.outputs['Object'], mapping.inputs['Vector'])
+    _build_graph(mat, (
+        ('output', 'ShaderNodeOutputMaterial', (600, 0), {}, {}),
+        ('principled', 'ShaderNodeBsdfPrincipled', (300, 0), {}, {
+            'Roughness': 0.6, 'Metallic': 0.0, 'Base Color': (*base_color, 1.0),
+        }),
+        ('mapping', 'ShaderNodeGroup', (-600, 0), {'node_tree': _object_mapping_group((6.0, 6.0, 6.0))}, {}),
+        # Voronoi for leather grain
+        ('voronoi', 'ShaderNodeTexVoronoi', (-400, 0), {'feature': 'F1'}, {'Scale': 15.0}),
+        # Bump from grain
+        ('bump', 'ShaderNodeBump', (100, -200), {}, {'Strength': 0.1}),
+    ), (
+        ('principled', 'BSDF', 'output', 'Surface'),
+        ('mapping', 'Vector', 'voronoi', 'Vector'),
+        ('voronoi', 'Distance', 'bump', 'Height'),
+        ('bump', 'Normal', 'principled', 'Normal'),
+    ))
+    return mat
 
-    # Voronoi for leather grain
-    voronoi = nodes.new('ShaderNodeTexVoronoi')
-    voronoi.location = (-400, 0)
-    voronoi.inputs['Scale'].default_value = 15.0
-    voronoi.feature = 'F1'
-    links.new(mapping.outputs['Vector'], voronoi.inputs['Vector'])
 
-    # Bump from grain
-    bump = nodes.new('ShaderNodeBump')
-    bump.location = (100, -200)
-    bump.inputs['Strength'].default_value = 0.1
-    links.new(voronoi.outputs['Distance'], bump.inputs['Height'])
-    links.new(bump.outputs['Normal'], principled.inputs['Normal'])
+def get_or_create_simple_pbr(name, base_color, roughness, metallic=0.0, subsurface=0.0, alpha=1.0):
+    """Return a flat Principled BSDF material, reusing an existing one by name."""
+    mat = bpy.data.materials.get(name)
+    if mat is not None:
+        return mat
 
+    mat = bpy.data.materials.new(name)
+    mat.use_nodes = True
+    inputs = mat.node_tree.nodes['Principled BSDF'].inputs
+    inputs['Base Color'].default_value = (*base_color, 1.0)
+    inputs['Roughness'].default_value = roughness
+    inputs['Metallic'].default_value = metallic
+    if subsurface:
+        inputs['Subsurface Weight'].default_value = subsurface
+    if alpha < 1.0:
+        inputs['Alpha'].default_value = alpha
+        if hasattr(mat, 'blend_method'):
+            mat.blend_method = 'CLIP'
     return mat
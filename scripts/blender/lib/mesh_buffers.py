@@ -0,0 +1,268 @@
+"""NumPy vertex/face buffers for building prop meshes without BMesh.
+
+Primitives are emitted as flat arrays (vertex positions, loop vertex
+indices, polygon sizes) and written to a Blender mesh in one pass with
+foreach_set, avoiding a Python round-trip per vertex and face.
+"""
+import math
+from functools import lru_cache
+
+import numpy as np
+
+# Unit box: centered on x/y, base at z=0 (same layout as mesh_ops.create_box)
+UNIT_BOX = np.array([
+    (-0.5, -0.5, 0.0), (0.5, -0.5, 0.0), (0.5, 0.5, 0.0), (-0.5, 0.5, 0.0),
+    (-0.5, -0.5, 1.0), (0.5, -0.5, 1.0), (0.5, 0.5, 1.0), (-0.5, 0.5, 1.0),
+], dtype=np.float32)
+
+BOX_FACES = np.array([
+    (3, 2, 1, 0),  # Bottom
+    (4, 5, 6, 7),  # Top
+    (0, 1, 5, 4),  # Front
+    (2, 3, 7, 6),  # Back
+    (3, 0, 4, 7),  # Left
+    (1, 2, 6, 5),  # Right
+], dtype=np.int32)
+
+BOX_LOOPS = BOX_FACES.ravel()
+BOX_SIZES = np.full(len(BOX_FACES), 4, dtype=np.int32)
+
+
+@lru_cache(maxsize=None)
+def unit_ring(segments):
+    """Return a cached read-only (segments, 2) table of (cos, sin) around a full circle."""
+    angles = np.arange(segments) * (2 * math.pi / segments)
+    ring = np.stack([np.cos(angles), np.sin(angles)], axis=1)
+    ring.flags.writeable = False
+    return ring
+
+
+@lru_cache(maxsize=None)
+def unit_arc(segments):
+    """Return a cached read-only (segments + 1, 2) table of (cos, sin) from 0 to pi."""
+    angles = np.linspace(0, math.pi, segments + 1)
+    arc = np.stack([np.cos(angles), np.sin(angles)], axis=1)
+    arc.flags.writeable = False
+    return arc
+
+
+def box_verts(width, height, depth, x=0, y=0, z=0):
+    """Return the 8 corners of a box (centered on x,y, base at z)."""
+    return UNIT_BOX * np.array((width, depth, height), dtype=np.float32) + \
+        np.array((x, y, z), dtype=np.float32)
+
+
+def cylinder_verts(radius_bottom, radius_top, height, segments, z_offset, x=0, y=0):
+    """Return bottom ring then top ring vertices of a cylinder section."""
+    cos, sin = unit_ring(segments).T
+    verts = np.empty((2 * segments, 3), dtype=np.float32)
+    verts[:segments, 0] = x + radius_bottom * cos
+    verts[:segments, 1] = y + radius_bottom * sin
+    verts[:segments, 2] = z_offset
+    verts[segments:, 0] = x + radius_top * cos
+    verts[segments:, 1] = y + radius_top * sin
+    verts[segments:, 2] = z_offset + height
+    return verts
+
+
+def cylinder_faces(segments):
+    """Return (loops, sizes) for a capped cylinder built by cylinder_verts."""
+    i = np.arange(segments, dtype=np.int32)
+    j = (i + 1) % segments
+    sides = np.stack([i, j, j + segments, i + segments], axis=1).ravel()
+    bottom = i
+    top = i[::-1] + segments
+    loops = np.concatenate([sides, bottom, top])
+    sizes = np.concatenate([
+        np.full(segments, 4, dtype=np.int32),
+        np.array([segments, segments], dtype=np.int32),
+    ])
+    return loops, sizes
+
+
+def grid_plane(size, cuts):
+    """Return (verts, loops, sizes) for a square XY plane split by `cuts` lines per side.
+
+    Matches primitive_plane_add followed by subdivide(number_cuts=cuts):
+    (cuts + 1)^2 quads facing +Z, centered on the origin.
+    """
+    n = cuts + 2  # vertices per side
+    coords = np.linspace(-size / 2, size / 2, n, dtype=np.float32)
+    xs, ys = np.meshgrid(coords, coords)
+    verts = np.stack([xs.ravel(), ys.ravel(), np.zeros(n * n, dtype=np.float32)], axis=1)
+
+    corner = (np.arange(n - 1)[None, :] + n * np.arange(n - 1)[:, None]).ravel().astype(np.int32)
+    loops = np.stack([corner, corner + 1, corner + n + 1, corner + n], axis=1).ravel()
+    sizes = np.full(len(corner), 4, dtype=np.int32)
+    return verts, loops, sizes
+
+
+def ring_offsets(radius, count, z=0):
+    """Return (count, 3) positions evenly spaced on a circle at height z."""
+    offsets = np.empty((count, 3), dtype=np.float32)
+    offsets[:, :2] = radius * unit_ring(count)
+    offsets[:, 2] = z
+    return offsets
+
+
+def grid_offsets(xs, ys, zs):
+    """Return the (N, 3) cartesian product of x, y and z positions."""
+    grid = np.meshgrid(
+        np.atleast_1d(xs), np.atleast_1d(ys), np.atleast_1d(zs), indexing='ij',
+    )
+    return np.stack(grid, axis=-1).reshape(-1, 3).astype(np.float32)
+
+
+def concat_buffers(parts):
+    """Merge (verts, loops, sizes) parts into one, offsetting loop indices."""
+    offsets = np.zeros(len(parts), dtype=np.int32)
+    np.cumsum([len(verts) for verts, _, _ in parts[:-1]], out=offsets[1:])
+    verts = np.concatenate([verts for verts, _, _ in parts])
+    loops = np.concatenate([loops + off for (_, loops, _), off in zip(parts, offsets)])
+    sizes = np.concatenate([sizes for _, _, sizes in parts])
+    return verts, loops, sizes
+
+
+def weld_verts(verts, loops, decimals=5):
+    """Merge coincident vertices, returning (unique_verts, remapped_loops).
+
+    Vertices are merged when their coordinates round to the same value at
+    `decimals` places. This is stricter than the 0.001 remove_doubles it
+    replaced: vertices more than about 1e-5 apart are never merged, and a
+    duplicate whose float noise straddles a rounding boundary stays split.
+    It relies on welded primitive corners being computed to well within
+    1e-5 of each other and not sitting on a 5th-decimal half step.
+    """
+    unique, inverse = np.unique(verts.round(decimals), axis=0, return_inverse=True)
+    return unique.astype(np.float32), inverse.reshape(-1).astype(np.int32)[loops]
+
+
+def pack_face_uvs(verts, loop_verts, loop_starts, loop_totals, normals, margin=0.02):
+    """Return per-loop UVs with every face as its own non-overlapping island.
+
+    Each face is projected onto the plane of its dominant normal axis, and
+    the resulting charts are shelf-packed (tallest first) into the 0-1
+    square at a uniform texel density, so the layout is safe to bake into.
+    """
+    axes = np.abs(normals).argmax(axis=1)
+    # Drop the dominant axis: X -> (y, z), Y -> (x, z), Z -> (x, y)
+    planes = np.array([(1, 2), (0, 2), (0, 1)])[axes]
+    loop_face = np.repeat(np.arange(len(loop_starts)), loop_totals)
+    uv = np.take_along_axis(verts[loop_verts], planes[loop_face], axis=1)
+
+    face_min = np.minimum.reduceat(uv, loop_starts, axis=0)
+    size = np.maximum.reduceat(uv, loop_starts, axis=0) - face_min
+    pad = margin * math.sqrt(max(float((size[:, 0] * size[:, 1]).sum()), 1e-8))
+    padded = size + pad
+
+    row_width = max(math.sqrt(float((padded[:, 0] * padded[:, 1]).sum())), float(padded[:, 0].max()))
+    pos = np.zeros_like(size)
+    x = y = row_height = 0.0
+    widths, heights = padded[:, 0].tolist(), padded[:, 1].tolist()
+    for i in np.argsort(-padded[:, 1], kind='stable').tolist():
+        if x > 0 and x + widths[i] > row_width:
+            y += row_height
+            x = row_height = 0.0
+        pos[i] = (x, y)
+        x += widths[i]
+        row_height = max(row_height, heights[i])
+
+    extent = max(row_width, y + row_height)
+    return ((uv - face_min[loop_face] + pos[loop_face] + pad / 2) / extent).astype(np.float32)
+
+
+def write_mesh(mesh, verts, loops, sizes, material_indices=None):
+    """Populate an empty mesh from vertex, loop-index, and polygon-size arrays."""
+    starts = np.zeros(len(sizes), dtype=np.int32)
+    np.cumsum(sizes[:-1], out=starts[1:])
+
+    mesh.vertices.add(len(verts))
+    mesh.attributes['position'].data.foreach_set('vector', verts.ravel())
+    mesh.loops.add(len(loops))
+    mesh.loops.foreach_set('vertex_index', loops)
+    mesh.polygons.add(len(sizes))
+    mesh.polygons.foreach_set('loop_start', starts)
+    if material_indices is not None:
+        mesh.polygons.foreach_set('material_index', material_indices)
+    mesh.update(calc_edges=True)
+    # Welding can leave duplicate faces where primitives touch
+    mesh.validate()
+
+
+class MeshBuffer:
+    """Accumulates primitives and writes them to a mesh in a single pass.
+
+    Parts are assigned to the material slot in ``material_index`` at the
+    time they are added (slot 0 unless changed).
+    """
+
+    def __init__(self):
+        self._parts = []
+        self._part_materials = []
+        self.material_index = 0
+
+    def add(self, verts, loops, sizes):
+        """Append raw geometry; loop indices are local to verts."""
+        self._parts.append((verts, loops, sizes))
+        self._part_materials.append(self.material_index)
+
+    def add_box(self, width, height, depth, x=0, y=0, z=0):
+        """Add a box (centered on x,y, base at z)."""
+        self.add(box_verts(width, height, depth, x, y, z), BOX_LOOPS, BOX_SIZES)
+
+    def add_cylinder(self, radius_bottom, radius_top, height, segments, z_offset, x=0, y=0):
+        """Add a capped cylinder section starting at z_offset."""
+        loops, sizes = cylinder_faces(segments)
+        verts = cylinder_verts(radius_bottom, radius_top, height, segments, z_offset, x, y)
+        self.add(verts, loops, sizes)
+
+    def _add_stack(self, vert_stack, loops, sizes):
+        """Add a (count, n, 3) stack of copies sharing one face layout."""
+        count, n = vert_stack.shape[:2]
+        shift = np.arange(count, dtype=np.int32)[:, None] * n
+        self.add(
+            vert_stack.reshape(-1, 3),
+            (loops[None, :] + shift).ravel(),
+            np.tile(sizes, count),
+        )
+
+    def add_instances(self, verts, loops, sizes, offsets):
+        """Add one copy of a primitive per row of (x, y, z) offsets."""
+        offsets = np.asarray(offsets, dtype=np.float32).reshape(-1, 3)
+        self._add_stack(verts[None, :, :] + offsets[:, None, :], loops, sizes)
+
+    def add_boxes(self, width, height, depth, offsets):
+        """Add identical boxes, one per (x, y, z) base-center offset."""
+        self.add_instances(box_verts(width, height, depth), BOX_LOOPS, BOX_SIZES, offsets)
+
+    def add_box_grid(self, width, height, depth, xs=0, ys=0, zs=0):
+        """Add identical boxes at every combination of xs, ys and zs."""
+        self.add_boxes(width, height, depth, grid_offsets(xs, ys, zs))
+
+    def add_box_array(self, widths, heights, depths, offsets):
+        """Add boxes of per-box size, one per (x, y, z) base-center offset."""
+        offsets = np.asarray(offsets, dtype=np.float32).reshape(-1, 3)
+        dims = np.empty_like(offsets)
+        dims[:, 0] = widths
+        dims[:, 1] = depths
+        dims[:, 2] = heights
+        self._add_stack(
+            UNIT_BOX[None, :, :] * dims[:, None, :] + offsets[:, None, :],
+            BOX_LOOPS, BOX_SIZES,
+        )
+
+    def add_cylinders(self, radius_bottom, radius_top, height, segments, z_offset, offsets):
+        """Add identical cylinder sections, one per (x, y, z) offset."""
+        loops, sizes = cylinder_faces(segments)
+        verts = cylinder_verts(radius_bottom, radius_top, height, segments, z_offset)
+        self.add_instances(verts, loops, sizes, offsets)
+
+    def to_mesh(self, mesh):
+        """Weld coincident vertices and write all geometry into an empty mesh."""
+        verts, loops, sizes = concat_buffers(self._parts)
+        verts, loops = weld_verts(verts, loops)
+        material_indices = np.repeat(
+            np.array(self._part_materials, dtype=np.int32),
+            [len(part_sizes) for _, _, part_sizes in self._parts],
+        )
+        write_mesh(mesh, verts, loops, sizes, material_indices)
@@ -0,0 +1,95 @@
+"""Disk cache of processed prop meshes (after bevel, shading and UVs).
+
+Prop geometry is deterministic, so the final pre-bake mesh of a prop only
+changes when the code that builds or processes it does. The cache key
+hashes the source of those functions and of the mesh helper modules, so
+any edit to them invalidates the entry automatically. On a hit the mesh
+is rewritten from the stored arrays with foreach_set, skipping the bevel
+modifier and UV unwrapping.
+"""
+import bpy
+import hashlib
+import inspect
+import os
+import numpy as np
+from . import mesh_buffers, mesh_ops
+from .conventions import MESH_CACHE_DIR
+
+# Bump when the stored array layout changes
+CACHE_VERSION = 1
+
+
+def cache_key(functions, extra=()):
+    """Return a key covering the source of `functions` and the mesh helpers.
+
+    Args:
+        functions: Functions whose source determines the mesh (the prop
+            generator and the processing pipeline).
+        extra: Additional hashable settings that affect the result.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr((CACHE_VERSION, bpy.app.version_string, extra)).encode())
+    for fn in functions:
+        h.update(inspect.getsource(fn).encode())
+    for module in (mesh_buffers, mesh_ops):
+        with open(module.__file__, 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def _cache_path(key):
+    return os.path.join(MESH_CACHE_DIR, f'{key}.npz')
+
+
+def load(key, mesh):
+    """Replace mesh geometry with the cached arrays; return False on a miss.
+
+    Materials on the mesh are kept, so the generator's material stays
+    assigned.
+    """
+    if MESH_CACHE_DIR is None or not os.path.exists(_cache_path(key)):
+        return False
+    with np.load(_cache_path(key)) as data:
+        arrays = {name: data[name] for name in data.files}
+
+    mesh.clear_geometry()
+    mesh.vertices.add(len(arrays['co']) // 3)
+    mesh.attributes['position'].data.foreach_set('vector', arrays['co'])
+    mesh.loops.add(len(arrays['vertex_index']))
+    mesh.loops.foreach_set('vertex_index', arrays['vertex_index'])
+    mesh.polygons.add(len(arrays['loop_start']))
+    mesh.polygons.foreach_set('loop_start', arrays['loop_start'])
+    mesh.polygons.foreach_set('material_index', arrays['material_index'])
+    mesh.polygons.foreach_set('use_smooth', arrays['use_smooth'])
+    mesh.update(calc_edges=True)
+
+    uv_layer = mesh.uv_layers.new(name='UVMap')
+    uv_layer.data.foreach_set('uv', arrays['uv'])
+    return True
+
+
+def store(key, mesh):
+    """Save the processed mesh's geometry, shading flags and active UVs."""
+    if MESH_CACHE_DIR is None or mesh.uv_layers.active is None:
+        return
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.attributes['position'].data.foreach_get('vector', co)
+    vertex_index = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get('vertex_index', vertex_index)
+    loop_start = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get('loop_start', loop_start)
+    material_index = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get('material_index', material_index)
+    use_smooth = np.empty(len(mesh.polygons), dtype=bool)
+    mesh.polygons.foreach_get('use_smooth', use_smooth)
+    uv = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+    mesh.uv_layers.active.data.foreach_get('uv', uv)
+
+    os.makedirs(MESH_CACHE_DIR, exist_ok=True)
+    # Write via a temp file so parallel workers never read a partial entry
+    tmp_path = _cache_path(key) + '.tmp.npz'
+    np.savez(
+        tmp_path, co=co, vertex_index=vertex_index, loop_start=loop_start,
+        material_index=material_index, use_smooth=use_smooth, uv=uv,
+    )
+    os.replace(tmp_path, _cache_path(key))
@@ -1,19 +1,37 @@
 """Common mesh operations for the Blender asset pipeline."""
 import bpy
 import bmesh
-import math
+import numpy as np
+from contextlib import contextmanager
+
+from .mesh_buffers import BOX_FACES, box_verts, pack_face_uvs, unit_ring
 
 
 def clean_scene():
-    """Remove all objects, materials, meshes, and images."""
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete()
-    for block in list(bpy.data.materials):
-        bpy.data.materials.remove(block)
-    for block in list(bpy.data.meshes):
-        bpy.data.meshes.remove(block)
-    for block in list(bpy.data.images):
-        bpy.data.images.remove(block)
+    """Remove all objects, materials, meshes, and images.
+
+    Datablocks are removed directly in one batch rather than through
+    select/delete operators, so clearing between props costs only what
+    the previous prop created. Materials with a fake user (shared
+    templates) are kept.
+    """
+    materials = [m for m in bpy.data.materials if not m.use_fake_user]
+    bpy.data.batch_remove([
+        *bpy.data.objects, *bpy.data.meshes, *materials, *bpy.data.images,
+    ])
+
+
+def object_context(obj):
+    """Return a context override making obj the sole active, selected object.
+
+    Operators run under it resolve their target from the override instead
+    of the view layer's selection state, so callers skip the select/active
+    bookkeeping and cannot pick up stray selected objects.
+    """
+    return bpy.context.temp_override(
+        object=obj, active_object=obj,
+        selected_objects=[obj], selected_editable_objects=[obj],
+    )
 
 
 def add_bevel(obj, width=0.02, segments=2, angle_limit=0.7854):
@@ -23,35 +41,77 @@ def add_bevel(obj, width=0.02, segments=2, angle_limit=0.7854):
     bevel.segments = segments
     bevel.limit_method = 'ANGLE'
     bevel.angle_limit = angle_limit
-    bpy.context.view_layer.objects.active = obj
-    bpy.ops.object.modifier_apply(modifier='Bevel')
+    with object_context(obj):
+        bpy.ops.object.modifier_apply(modifier='Bevel')
+
+
+@contextmanager
+def object_bmesh(obj):
+    """Yield a BMesh of obj's mesh and write it back on exit.
+
+    Works on the object-mode mesh with the bmesh API, so callers can chain
+    bmesh.ops without an edit-mode round trip (each mode switch rebuilds
+    the edit mesh).
+    """
+    bm = bmesh.new()
+    try:
+        bm.from_mesh(obj.data)
+        yield bm
+        bm.to_mesh(obj.data)
+    finally:
+        bm.free()
+    obj.data.update()
 
 
 def smooth_shade(obj):
     """Apply smooth shading."""
-    bpy.context.view_layer.objects.active = obj
-    obj.select_set(True)
-    bpy.ops.object.shade_smooth()
+    polygons = obj.data.polygons
+    polygons.foreach_set('use_smooth', np.ones(len(polygons), dtype=bool))
+    obj.data.update()
 
 
 def smart_uv_unwrap(obj, angle_limit=1.15192, island_margin=0.02):
     """UV unwrap using Smart UV Project."""
+    # Edit-mode operators read the edit object from the view layer
     bpy.context.view_layer.objects.active = obj
-    obj.select_set(True)
-    bpy.ops.object.mode_set(mode='EDIT')
-    bpy.ops.mesh.select_all(action='SELECT')
-    bpy.ops.uv.smart_project(angle_limit=angle_limit, island_margin=island_margin)
-    bpy.ops.object.mode_set(mode='OBJECT')
+    with object_context(obj):
+        bpy.ops.object.mode_set(mode='EDIT')
+        bpy.ops.mesh.select_all(action='SELECT')
+        bpy.ops.uv.smart_project(angle_limit=angle_limit, island_margin=island_margin)
+        bpy.ops.object.mode_set(mode='OBJECT')
+
+
+def box_uv_unwrap(obj, island_margin=0.02):
+    """UV unwrap by projecting each face onto its dominant axis plane.
+
+    Reads and writes mesh data directly (no edit-mode or operator calls).
+    Every face becomes its own packed island, which bakes correctly for
+    box/cylinder props without running Smart UV Project.
+    """
+    mesh = obj.data
+    verts = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.attributes['position'].data.foreach_get('vector', verts)
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get('vertex_index', loop_verts)
+    loop_starts = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get('loop_start', loop_starts)
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get('loop_total', loop_totals)
+    normals = np.empty(len(mesh.polygons) * 3, dtype=np.float32)
+    mesh.polygons.foreach_get('normal', normals)
+
+    uvs = pack_face_uvs(
+        verts.reshape(-1, 3), loop_verts, loop_starts, loop_totals,
+        normals.reshape(-1, 3), margin=island_margin,
+    )
+    uv_layer = mesh.uv_layers.active or mesh.uv_layers.new(name='UVMap')
+    uv_layer.data.foreach_set('uv', uvs.ravel())
 
 
 def remove_doubles(obj, threshold=0.001):
     """Merge vertices closer than threshold."""
-    bpy.context.view_layer.objects.active = obj
-    obj.select_set(True)
-    bpy.ops.object.mode_set(mode='EDIT')
-    bpy.ops.mesh.select_all(action='SELECT')
-    bpy.ops.mesh.remove_doubles(threshold=threshold)
-    bpy.ops.object.mode_set(mode='OBJECT')
+    with object_bmesh(obj) as bm:
+        bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=threshold)
 
 
 def join_objects(objects):
@@ -67,68 +127,68 @@ def join_objects(objects):
     return bpy.context.active_object
 
 
+def vertex_coords(mesh):
+    """Return the mesh's vertex positions as an (N, 3) float32 array."""
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', co)
+    return co.reshape(-1, 3)
+
+
+def translate_z_inplace(obj, dz):
+    """Move every vertex of obj along Z by dz in one foreach_get/foreach_set round trip."""
+    mesh = obj.data
+    co = vertex_coords(mesh)
+    co[:, 2] += dz
+    mesh.vertices.foreach_set('co', co.ravel())
+    mesh.update()
+
+
 def set_origin_base_center(obj):
     """Set origin to the bottom center of the bounding box."""
-    bpy.context.view_layer.objects.active = obj
-    obj.select_set(True)
-
     # First set origin to geometry center
-    bpy.ops.object.origin_set(type='ORIGIN_GEOMETRY', center='BOUNDS')
+    with object_context(obj):
+        bpy.ops.object.origin_set(type='ORIGIN_GEOMETRY', center='BOUNDS')
 
     # Then shift so origin is at bottom
-    bbox = obj.bound_box
-    min_z = min(v[2] for v in bbox)
-    # Move all vertices up so the base is at z=0
-    for v in obj.data.vertices:
-        v.co.z -= min_z
+    # Move all vertices up so the base is at z=0 (bound_box is cached, no vertex walk)
+    translate_z_inplace(obj, -np.array(obj.bound_box)[:, 2].min())
     obj.location.z = 0
 
 
-def create_cylinder_section(bm, radius_bottom, radius_top, height, segments, z_offset):
-    """Create a cylinder section in a BMesh."""
-    verts_bottom = []
-    verts_top = []
-    for i in range(segments):
-        angle = 2 * math.pi * i / segments
-        x_b = radius_bottom * math.cos(angle)
-        y_b = radius_bottom * math.sin(angle)
-        verts_bottom.append(bm.verts.new((x_b, y_b, z_offset)))
-        x_t = radius_top * math.cos(angle)
-        y_t = radius_top * math.sin(angle)
-        verts_top.append(bm.verts.new((x_t, y_t, z_offset + height)))
+def create_cylinder_section(bm, radius_bottom, radius_top, height, segments, z_offset,
+                            verts_bottom=None, cap_top=True):
+    """Create a cylinder section in a BMesh.
+
+    Stacked sections can share a seam ring instead of being merged with
+    remove_doubles afterwards: pass the lower section's top ring as
+    `verts_bottom` (its bottom cap is then skipped) and build the lower
+    section with cap_top=False.
+
+    Returns:
+        (verts_bottom, verts_top) rings of BMVerts.
+    """
+    new_vert, new_face = bm.verts.new, bm.faces.new
+    ring = unit_ring(segments).tolist()
+    shared_bottom = verts_bottom is not None
+    if not shared_bottom:
+        verts_bottom = [new_vert((radius_bottom * c, radius_bottom * s, z_offset)) for c, s in ring]
+    verts_top = [new_vert((radius_top * c, radius_top * s, z_offset + height)) for c, s in ring]
 
     for i in range(segments):
         j = (i + 1) % segments
-        bm.faces.new([verts_bottom[i], verts_bottom[j], verts_top[j], verts_top[i]])
+        new_face([verts_bottom[i], verts_bottom[j], verts_top[j], verts_top[i]])
 
-    bm.faces.new(verts_bottom)
-    bm.faces.new(list(reversed(verts_top)))
+    if not shared_bottom:
+        new_face(verts_bottom)
+    if cap_top:
+        new_face(list(reversed(verts_top)))
     return verts_bottom, verts_top
 
 
 def create_box(bm, width, height, depth, x=0, y=0, z=0):
     """Create a box in a BMesh at the given position (centered on x,y, base at z)."""
-    hw, hd = width / 2, depth / 2
-    verts = [
-        bm.verts.new((x - hw, y - hd, z)),
-        bm.verts.new((x + hw, y - hd, z)),
-        bm.verts.new((x + hw, y + hd, z)),
-        bm.verts.new((x - hw, y + hd, z)),
-        bm.verts.new((x - hw, y - hd, z + height)),
-        bm.verts.new((x + hw, y - hd, z + height)),
-        bm.verts.new((x + hw, y + hd, z + height)),
-        bm.verts.new((x - hw, y + hd, z + height)),
-    ]
-    # Bottom
-    bm.faces.new([verts[3], verts[2], verts[1], verts[0]])
-    # Top
-    bm.faces.new([verts[4], verts[5], verts[6], verts[7]])
-    # Front
-    bm.faces.new([verts[0], verts[1], verts[5], verts[4]])
-    # Back
-    bm.faces.new([verts[2], verts[3], verts[7], verts[6]])
-    # Left
-    bm.faces.new([verts[3], verts[0], verts[4], verts[7]])
-    # Right
-    bm.faces.new([verts[1], verts[2], verts[6], verts[5]])
+    new_vert, new_face = bm.verts.new, bm.faces.new
+    verts = [new_vert(co) for co in box_verts(width, height, depth, x, y, z).tolist()]
+    for face in BOX_FACES.tolist():
+        new_face([verts[i] for i in face])
     return verts
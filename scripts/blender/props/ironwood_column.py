@@ -16,6 +16,14 @@ import os
 import sys
 import time
 import math
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.bake import (
+    bake_backend, pass_inputs_only, persistent_data, premultiply_ao, setup_cycles_bake,
+)
+from lib.mesh_ops import object_context
 
 start_time = time.time()
 
@@ -49,47 +57,101 @@ for block in list(bpy.data.materials): bpy.data.materials.remove(block)
 for block in list(bpy.data.meshes): bpy.data.meshes.remove(block)
 for block in list(bpy.data.images): bpy.data.images.remove(block)
 
-# --- Build geometry with BMesh ---
-mesh = bpy.data.meshes.new('column_mesh')
-bm = bmesh.new()
-
-def add_cylinder(bm_obj, radius_bottom, radius_top, height, segments, z_offset):
-    """Add a cylinder section to BMesh at a given z offset."""
-    verts_bottom = []
-    verts_top = []
-    for i in range(segments):
-        angle = 2 * math.pi * i / segments
-        # Bottom ring
-        x_b = radius_bottom * math.cos(angle)
-        y_b = radius_bottom * math.sin(angle)
-        verts_bottom.append(bm_obj.verts.new((x_b, y_b, z_offset)))
-        # Top ring
-        x_t = radius_top * math.cos(angle)
-        y_t = radius_top * math.sin(angle)
-        verts_top.append(bm_obj.verts.new((x_t, y_t, z_offset + height)))
-
-    # Side faces
-    for i in range(segments):
-        j = (i + 1) % segments
-        bm_obj.faces.new([verts_bottom[i], verts_bottom[j], verts_top[j], verts_top[i]])
-
-    # Cap faces
-    bm_obj.faces.new(verts_bottom)
-    bm_obj.faces.new(list(reversed(verts_top)))
-
-    return verts_bottom, verts_top
-
-# Base plinth (slightly wider)
-add_cylinder(bm, BASE_RADIUS_BOTTOM, BASE_RADIUS_TOP, BASE_HEIGHT, SEGMENTS, 0)
-
-# Shaft (main column body)
-add_cylinder(bm, SHAFT_RADIUS_BOTTOM, SHAFT_RADIUS_TOP, COLUMN_HEIGHT, SEGMENTS, BASE_HEIGHT)
+# --- Build geometry ---
+# (radius_bottom, radius_top, height) of each section, bottom to top
+# The shaft is split at mid-height so the UV layout can place its halves side by side
+SHAFT_RADIUS_MID = (SHAFT_RADIUS_BOTTOM + SHAFT_RADIUS_TOP) / 2
+SECTIONS = (
+    (BASE_RADIUS_BOTTOM, BASE_RADIUS_TOP, BASE_HEIGHT),  # Base plinth (slightly wider)
+    (SHAFT_RADIUS_BOTTOM, SHAFT_RADIUS_MID, COLUMN_HEIGHT / 2),  # Shaft (main column body)
+    (SHAFT_RADIUS_MID, SHAFT_RADIUS_TOP, COLUMN_HEIGHT / 2),
+    (CAPITAL_RADIUS_BOTTOM, CAPITAL_RADIUS_TOP, CAPITAL_HEIGHT),  # Capital (flares out at top)
+)
 
-# Capital (flares out at top)
-add_cylinder(bm, CAPITAL_RADIUS_BOTTOM, CAPITAL_RADIUS_TOP, CAPITAL_HEIGHT, SEGMENTS, BASE_HEIGHT + COLUMN_HEIGHT)
+def column_rings(sections):
+    """Return (radius, z) rings bottom to top, sharing a ring where sections meet exactly."""
+    rings = []
+    z = 0.0
+    for radius_bottom, radius_top, height in sections:
+        if not rings or rings[-1] != (radius_bottom, z):
+            rings.append((radius_bottom, z))
+        z += height
+        rings.append((radius_top, z))
+    return rings
+
+def column_geometry(rings, segments):
+    """Return (verts, faces) for a stack of rings joined by quad strips and capped.
+
+    Consecutive rings at the same height (a step between sections) are joined
+    by a flat annulus, so no coincident vertices or hidden caps are produced.
+    """
+    angles = np.arange(segments) * (2 * math.pi / segments)
+    ring = np.stack([np.cos(angles), np.sin(angles)], axis=1)
+    radii, heights = np.array(rings).T
+
+    verts = np.empty((len(rings), segments, 3))
+    verts[..., :2] = radii[:, None, None] * ring
+    verts[..., 2] = heights[:, None]
+
+    i = np.arange(segments)
+    j = (i + 1) % segments
+    base = segments * np.arange(len(rings) - 1)[:, None]
+    strips = np.stack([base + i, base + j, base + segments + j, base + segments + i], axis=-1)
+
+    faces = strips.reshape(-1, 4).tolist()
+    faces.append(i[::-1].tolist())  # Bottom cap, facing down
+    faces.append((i + segments * (len(rings) - 1)).tolist())  # Top cap, facing up
+    return verts.reshape(-1, 3).tolist(), faces
+
+def column_uvs(rings, segments, pad=0.05):
+    """Return (loops, 2) UVs for column_geometry's faces, in its loop order.
+
+    Side strips are unrolled analytically: u follows the angle and v the
+    length along the profile. The strips are laid out in two side-by-side
+    halves, split at the ring nearest the middle of the profile, so texels
+    stay roughly square on the tall shaft. The end caps are projected
+    top-down into discs beside them.
+    """
+    radii, heights = np.array(rings).T
+    profile = np.concatenate([[0.0], np.cumsum(np.hypot(np.diff(radii), np.diff(heights)))])
+    split = 1 + int(np.abs(profile[1:-1] - profile[-1] / 2).argmin())
+    width = 2 * math.pi * radii.mean()
+
+    # Side strips: loops (k, i), (k, j), (k + 1, j), (k + 1, i) per face
+    strip = np.arange(len(rings) - 1)
+    half = (strip >= split).astype(float)
+    x0 = half * (width + pad)
+    y0 = profile[:-1] - half * profile[split]
+    y1 = profile[1:] - half * profile[split]
+    u = np.arange(segments + 1) * (width / segments)
+    u_i, u_j = u[:-1], u[1:]
+    side_u = x0[:, None, None] + np.stack([u_i, u_j, u_j, u_i], axis=-1)
+    side_v = np.stack([
+        np.broadcast_to(y0[:, None], (len(strip), segments)),
+        np.broadcast_to(y0[:, None], (len(strip), segments)),
+        np.broadcast_to(y1[:, None], (len(strip), segments)),
+        np.broadcast_to(y1[:, None], (len(strip), segments)),
+    ], axis=-1)
+    sides = np.stack([side_u, side_v], axis=-1).reshape(-1, 2)
+
+    # Caps: discs of their true size, bottom one mirrored to be seen from below
+    angles = np.arange(segments) * (2 * math.pi / segments)
+    ring = np.stack([np.cos(angles), np.sin(angles)], axis=1)
+    caps_x = 2 * (width + pad) + max(radii[0], radii[-1])
+    bottom = (caps_x, radii[0]) + radii[0] * ring[::-1] * (1, -1)
+    top = (caps_x, 2 * radii[0] + pad + radii[-1]) + radii[-1] * ring
+
+    uvs = np.concatenate([sides, bottom, top])
+    extent = max(caps_x + max(radii[0], radii[-1]), profile[split], profile[-1] - profile[split],
+                 2 * (radii[0] + radii[-1]) + pad)
+    return ((uvs + pad / 2) / (extent + pad)).astype(np.float32)
 
-bm.to_mesh(mesh)
-bm.free()
+mesh = bpy.data.meshes.new('column_mesh')
+rings = column_rings(SECTIONS)
+column_verts, column_faces = column_geometry(rings, SEGMENTS)
+mesh.from_pydata(column_verts, [], column_faces)
+# UVs exist before the bevel so the modifier interpolates them onto the new faces
+mesh.uv_layers.new(name='UVMap').data.foreach_set('uv', column_uvs(rings, SEGMENTS).ravel())
 
 # Create object
 obj = bpy.data.objects.new('ironwood_column', mesh)
@@ -98,27 +160,17 @@ bpy.context.view_layer.objects.active = obj
 obj.select_set(True)
 
 # --- Add bevel modifier for smooth edges ---
-bpy.ops.object.mode_set(mode='EDIT')
-bpy.ops.mesh.select_all(action='SELECT')
-# Merge vertices that are very close (where sections meet)
-bpy.ops.mesh.remove_doubles(threshold=0.001)
-bpy.ops.object.mode_set(mode='OBJECT')
-
 bevel = obj.modifiers.new('Bevel', 'BEVEL')
 bevel.width = 0.02
 bevel.segments = 2
 bevel.limit_method = 'ANGLE'
 bevel.angle_limit = 0.7854  # 45 degrees
-bpy.ops.object.modifier_apply(modifier='Bevel')
+with object_context(obj):
+    bpy.ops.object.modifier_apply(modifier='Bevel')
 
-# --- Smooth shading ---
-bpy.ops.object.shade_smooth()
-
-# --- UV unwrap ---
-bpy.ops.object.mode_set(mode='EDIT')
-bpy.ops.mesh.select_all(action='SELECT')
-bpy.ops.uv.smart_project(angle_limit=1.15192, island_margin=0.02)
-bpy.ops.object.mode_set(mode='OBJECT')
+# --- Smooth shading (mesh data, no operator) ---
+mesh.polygons.foreach_set('use_smooth', np.ones(len(mesh.polygons), dtype=bool))
+mesh.update()
 
 # --- Create ironwood material ---
 mat = bpy.data.materials.new('IronwoodMaterial')
@@ -223,51 +275,61 @@ obj.data.materials.append(mat)
 
 # --- Set up Cycles for baking ---
 scene = bpy.context.scene
-scene.render.engine = 'CYCLES'
-scene.cycles.device = 'CPU'
-
-bpy.context.view_layer.objects.active = obj
-obj.select_set(True)
+setup_cycles_bake()
+if scene.cycles.device == 'GPU':
+    print(f"[ironwood-column] Baking on GPU ({bake_backend()})")
 
 # --- Bake PBR passes ---
 print("[ironwood-column] Baking PBR textures...")
 
 bake_images = {}
 
+# Temp bake target node, shared by all passes (only its image changes)
+bake_node = nodes.new('ShaderNodeTexImage')
+bake_node.location = (800, 0)
+nodes.active = bake_node
+
 def bake_pass(pass_type, samples=64):
-    """Bake a single PBR pass."""
+    """Bake a single PBR pass into a new image."""
     img = bpy.data.images.new(f"bake_{pass_type.lower()}", TEX_SIZE, TEX_SIZE)
     if pass_type == 'DIFFUSE':
         img.colorspace_settings.name = 'sRGB'
     else:
         img.colorspace_settings.name = 'Non-Color'
-
-    # Create temp image texture node and make it active
-    img_node = nodes.new('ShaderNodeTexImage')
-    img_node.image = img
-    img_node.location = (800, 0)
-    nodes.active = img_node
+    bake_node.image = img
 
     scene.cycles.samples = samples
 
-    if pass_type == 'DIFFUSE':
-        bpy.ops.object.bake(type='DIFFUSE', pass_filter={'COLOR'})
-    elif pass_type == 'NORMAL':
-        bpy.ops.object.bake(type='NORMAL')
-    elif pass_type == 'ROUGHNESS':
-        bpy.ops.object.bake(type='ROUGHNESS')
-    elif pass_type == 'AO':
-        bpy.ops.object.bake(type='AO')
-
-    nodes.remove(img_node)
+    # Unlinked BSDF inputs are compiled out of the pass's shader
+    with pass_inputs_only(mat, pass_type), object_context(obj):
+        if pass_type == 'DIFFUSE':
+            bpy.ops.object.bake(type='DIFFUSE', pass_filter={'COLOR'})
+        else:
+            bpy.ops.object.bake(type=pass_type)
+
     bake_images[pass_type] = img
     print(f"[ironwood-column] Baked {pass_type}")
     return img
 
-bake_pass('DIFFUSE', samples=1)
-bake_pass('NORMAL', samples=1)
-bake_pass('ROUGHNESS', samples=1)
-bake_pass('AO', samples=64)
+# Keep the synced scene and BVH alive between passes instead of rebuilding them per bake
+with persistent_data(scene):
+    bake_pass('DIFFUSE', samples=1)
+    bake_pass('NORMAL', samples=1)
+    bake_pass('ROUGHNESS', samples=1)
+    bake_pass('AO', samples=64)
+nodes.remove(bake_node)
+
+# --- Pick embedded image formats (export_image_format='AUTO' follows file_format) ---
+# JPEG's chroma subsampling and DCT ringing corrupt tangent-space vectors, so
+# the normal map stays lossless at full resolution (see the budget check at
+# export). Roughness is grey (no chroma to subsample), so JPEG is safe there.
+bake_images['NORMAL'].file_format = 'PNG'
+for pass_type in ('DIFFUSE', 'ROUGHNESS'):
+    bake_images[pass_type].file_format = 'JPEG'
+
+# --- Premultiply AO into diffuse (one texture fewer in the GLB) ---
+premultiply_ao(bake_images['DIFFUSE'], bake_images['AO'])
+bpy.data.images.remove(bake_images.pop('AO'))
 
 # --- Replace procedural material with baked images for GLB export ---
 nodes.clear()
@@ -280,25 +342,11 @@ principled.inputs['Roughness'].default_value = 0.65
 principled.inputs['Metallic'].default_value = 0.0
 links.new(principled.outputs['BSDF'], output.inputs['Surface'])
 
-# Diffuse
+# Diffuse (AO premultiplied)
 diff_node = nodes.new('ShaderNodeTexImage')
 diff_node.location = (-300, 200)
 diff_node.image = bake_images['DIFFUSE']
-
-# AO multiply into diffuse
-ao_node = nodes.new('ShaderNodeTexImage')
-ao_node.location = (-500, 100)
-ao_node.image = bake_images['AO']
-ao_node.image.colorspace_settings.name = 'Non-Color'
-
-ao_mix = nodes.new('ShaderNodeMix')
-ao_mix.location = (-100, 200)
-ao_mix.data_type = 'RGBA'
-ao_mix.blend_type = 'MULTIPLY'
-ao_mix.inputs['Factor'].default_value = 1.0
-links.new(diff_node.outputs['Color'], ao_mix.inputs[6])
-links.new(ao_node.outputs['Color'], ao_mix.inputs[7])
-links.new(ao_mix.outputs[2], principled.inputs['Base Color'])
+links.new(diff_node.outputs['Color'], principled.inputs['Base Color'])
 
 # Normal map
 norm_node = nodes.new('ShaderNodeTexImage')
@@ -320,11 +368,19 @@ rough_node.image.colorspace_settings.name = 'Non-Color'
 links.new(rough_node.outputs['Color'], principled.inputs['Roughness'])
 
 # --- Triangulate mesh (required for tangent export) ---
-tri_mod = obj.modifiers.new('Triangulate', 'TRIANGULATE')
-bpy.ops.object.modifier_apply(modifier='Triangulate')
+# Directly on the mesh data: no modifier stack evaluation or depsgraph update
+bm = bmesh.new()
+try:
+    bm.from_mesh(mesh)
+    bmesh.ops.triangulate(bm, faces=bm.faces, quad_method='SHORT_EDGE', ngon_method='BEAUTY')
+    bm.to_mesh(mesh)
+finally:
+    bm.free()
+mesh.update()
 
 # --- Apply transforms ---
-bpy.ops.object.transform_apply(location=False, rotation=True, scale=True)
+with object_context(obj):
+    bpy.ops.object.transform_apply(location=False, rotation=True, scale=True)
 
 # --- Ensure origin at base center ---
 # The geometry was built with base at z=0, so origin should already be at base center.
@@ -332,22 +388,35 @@ bpy.ops.object.transform_apply(location=False, rotation=True, scale=True)
 obj.location = (0, 0, 0)
 
 # --- Export GLB ---
+def export_glb():
+    """Export the column and return the GLB size in KB."""
+    bpy.ops.export_scene.gltf(
+        filepath=OUTPUT_PATH,
+        export_format='GLB',
+        use_selection=True,
+        export_apply=True,
+        export_tangents=True,
+        export_yup=True,
+        export_image_format='AUTO',
+        export_image_quality=85,
+    )
+    return os.path.getsize(OUTPUT_PATH) / 1024
+
 print(f"[ironwood-column] Exporting GLB...")
-bpy.ops.export_scene.gltf(
-    filepath=OUTPUT_PATH,
-    export_format='GLB',
-    use_selection=True,
-    export_apply=True,
-    export_tangents=True,
-    export_yup=True,
-    export_image_format='JPEG',
-    export_image_quality=85,
-)
+file_size_kb = export_glb()
+
+# Budget decision: the lossless normal map is the largest embedded image, so
+# it is the one traded for size, and only when the full-resolution GLB does
+# not fit MAX_GLB_KB
+if file_size_kb > MAX_GLB_KB:
+    print(f"[ironwood-column] {file_size_kb:.1f} KB exceeds the {MAX_GLB_KB} KB budget; "
+          f"re-exporting with a {TEX_SIZE // 2}px normal map")
+    bake_images['NORMAL'].scale(TEX_SIZE // 2, TEX_SIZE // 2)
+    file_size_kb = export_glb()
 
 # --- Report ---
-file_size_kb = os.path.getsize(OUTPUT_PATH) / 1024
-tri_count = sum(len(p.vertices) - 2 for p in obj.data.polygons)
-total_height = max(v.co.z for v in obj.data.vertices) - min(v.co.z for v in obj.data.vertices)
+tri_count = len(obj.data.polygons)  # Triangulated above
+total_height = np.ptp(np.array(obj.bound_box)[:, 2])
 elapsed = time.time() - start_time
 
 print(f"[ironwood-column] GLB size: {file_size_kb:.1f} KB (budget: {MAX_GLB_KB} KB)")
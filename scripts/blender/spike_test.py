@@ -6,16 +6,47 @@ Validates the full Blender → GLB → Three.js pipeline.
 
 Usage:
   blender --background --factory-startup --python scripts/blender/spike_test.py
+  blender --background --factory-startup --python scripts/blender/spike_test.py -- --parallel
+
+--parallel bakes each pass in its own background Blender (started with
+--pass <TYPE>, which bakes and saves that one texture, then exits) and
+exports from the saved PNGs.
+
+--direct-glb writes the GLB straight from the mesh arrays and baked PNGs
+instead of running the glTF exporter add-on.
+
+--factory-startup is the only startup trimming that matters here: it
+skips user preferences and their add-ons, leaving the bundled defaults
+(Cycles and the glTF exporter included), which load before this script
+runs. --disable-autoexec only affects scripts inside .blend files, and
+the splash screen is never drawn in --background.
+
+The run is skipped when the GLB was already built by this exact script
+(and lib.bake), Blender version and TEX_SIZE; pass --force to rebuild
+anyway.
 """
 import bpy
+import hashlib
+import json
 import os
+import struct
+import subprocess
 import sys
 import time
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import lib.bake
+from lib.bake import bake_backend, denoise_ao, premultiply_ao, setup_cycles_bake
 
 start_time = time.time()
 
 # --- Configuration ---
 TEX_SIZE = 512
+# Three.js derives a per-pixel tangent frame when a GLB has no tangents, so
+# MikkTSpace export is only worth its cost for a consumer that needs it
+EXPORT_TANGENTS = False
 OUTPUT_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'public', 'assets', 'models', 'props', 'test')
 OUTPUT_PATH = os.path.join(OUTPUT_DIR, 'spike-cube.glb')
 
@@ -24,40 +55,147 @@ OUTPUT_DIR = os.path.abspath(OUTPUT_DIR)
 OUTPUT_PATH = os.path.abspath(OUTPUT_PATH)
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
+# Script arguments follow '--' on the Blender command line
+ARGS = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+PARALLEL = '--parallel' in ARGS
+ONLY_PASS = ARGS[ARGS.index('--pass') + 1] if '--pass' in ARGS else None
+DIRECT_GLB = '--direct-glb' in ARGS
+
 print(f"[spike] Output: {OUTPUT_PATH}")
 
-# --- Clean scene ---
-bpy.ops.object.select_all(action='SELECT')
-bpy.ops.object.delete()
+# Key of everything that determines the output, stored beside the GLB
+HASH_PATH = OUTPUT_PATH + '.hash'
+_key = hashlib.sha256(bpy.app.version_string.encode() + str((TEX_SIZE, DIRECT_GLB)).encode())
+for source in (__file__, lib.bake.__file__):
+    with open(source, 'rb') as f:
+        _key.update(f.read())
+BUILD_KEY = _key.hexdigest()
+
+if ONLY_PASS is None and '--force' not in ARGS and os.path.exists(OUTPUT_PATH):
+    try:
+        with open(HASH_PATH) as f:
+            up_to_date = f.read().strip() == BUILD_KEY
+    except OSError:
+        up_to_date = False
+    if up_to_date:
+        print("[spike] GLB is up to date, skipping (pass --force to rebuild)")
+        sys.exit(0)
 
-# Remove all materials, meshes, images from file
-for block in bpy.data.materials:
-    bpy.data.materials.remove(block)
-for block in bpy.data.meshes:
-    bpy.data.meshes.remove(block)
-for block in bpy.data.images:
-    bpy.data.images.remove(block)
+# --- Clean scene ---
+# Remove all objects, materials, meshes, images from file in one batch
+bpy.data.batch_remove([
+    *bpy.data.objects, *bpy.data.materials, *bpy.data.meshes, *bpy.data.images,
+])
 
 # --- Create beveled cube ---
-bpy.ops.mesh.primitive_cube_add(size=1.0, location=(0, 0, 0.5))
-obj = bpy.context.active_object
-obj.name = 'spike_cube'
-
-# Add bevel modifier for smooth edges
-bevel = obj.modifiers.new('Bevel', 'BEVEL')
-bevel.width = 0.03
-bevel.segments = 2
-bevel.limit_method = 'ANGLE'
-bevel.angle_limit = 1.0472  # 60 degrees
+BEVEL_WIDTH = 0.03
+BEVEL_SEGMENTS = 2
+BEVEL_ANGLE = 1.0472  # 60 degrees
+
+# The bevelled cube never changes for a given Blender, so its mesh is kept
+# on disk after the first run (set MESH_CACHE_DIR=off to disable)
+_mesh_cache_env = os.environ.get('MESH_CACHE_DIR', os.path.join('~', '.cache', '2dhd_meshes'))
+MESH_CACHE_PATH = None if _mesh_cache_env.lower() in ('', 'off', '0') else os.path.join(
+    os.path.expanduser(_mesh_cache_env),
+    f'spike-cube_{bpy.app.version_string}_{BEVEL_WIDTH}_{BEVEL_SEGMENTS}_{BEVEL_ANGLE}.npz',
+)
 
-# Apply modifier
-bpy.ops.object.modifier_apply(modifier='Bevel')
+def build_beveled_cube():
+    """Build the cube with the bevel modifier and store its mesh in the cache."""
+    bpy.ops.mesh.primitive_cube_add(size=1.0, location=(0, 0, 0.5))
+    obj = bpy.context.active_object
+
+    # Add bevel modifier for smooth edges
+    bevel = obj.modifiers.new('Bevel', 'BEVEL')
+    bevel.width = BEVEL_WIDTH
+    bevel.segments = BEVEL_SEGMENTS
+    bevel.limit_method = 'ANGLE'
+    bevel.angle_limit = BEVEL_ANGLE
+
+    # Apply modifier
+    bpy.ops.object.modifier_apply(modifier='Bevel')
+
+    if MESH_CACHE_PATH:
+        mesh = obj.data
+        co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get('co', co)
+        vertex_index = np.empty(len(mesh.loops), dtype=np.int32)
+        mesh.loops.foreach_get('vertex_index', vertex_index)
+        loop_total = np.empty(len(mesh.polygons), dtype=np.int32)
+        mesh.polygons.foreach_get('loop_total', loop_total)
+        os.makedirs(os.path.dirname(MESH_CACHE_PATH), exist_ok=True)
+        # Write via a temp file so parallel workers never read a partial entry
+        tmp_path = MESH_CACHE_PATH + '.tmp.npz'
+        np.savez(tmp_path, co=co, vertex_index=vertex_index, loop_total=loop_total)
+        os.replace(tmp_path, MESH_CACHE_PATH)
+    return obj
+
+def load_beveled_cube():
+    """Create the cube from the cached mesh arrays (no operators or bevel)."""
+    with np.load(MESH_CACHE_PATH) as data:
+        co, vertex_index, loop_total = data['co'], data['vertex_index'], data['loop_total']
+    faces = np.split(vertex_index, np.cumsum(loop_total)[:-1])
+
+    mesh = bpy.data.meshes.new('Cube')
+    mesh.from_pydata(co.reshape(-1, 3).tolist(), [], [f.tolist() for f in faces])
+    mesh.update()
+    obj = bpy.data.objects.new('Cube', mesh)
+    obj.location = (0, 0, 0.5)
+    bpy.context.collection.objects.link(obj)
+    return obj
+
+if MESH_CACHE_PATH and os.path.exists(MESH_CACHE_PATH):
+    obj = load_beveled_cube()
+else:
+    obj = build_beveled_cube()
+obj.name = 'spike_cube'
 
 # --- UV unwrap ---
-bpy.ops.object.mode_set(mode='EDIT')
-bpy.ops.mesh.select_all(action='SELECT')
-bpy.ops.uv.smart_project(angle_limit=1.15192, island_margin=0.02)
-bpy.ops.object.mode_set(mode='OBJECT')
+# Drop-axis pairs for projecting along X, Y and Z
+PROJECTION_AXES = np.array(((1, 2), (0, 2), (0, 1)))
+
+def box_project_uvs(mesh, margin=0.02):
+    """Box-project UVs into a 3x2 grid, one island per face direction.
+
+    Each face goes to the island of its dominant normal axis and sign. On a
+    convex mesh the faces of one island cannot overlap once projected, so
+    the beveled cube unwraps analytically, without edit mode or a packer.
+    """
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', co)
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get('vertex_index', loop_verts)
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get('loop_total', loop_totals)
+    normals = np.empty(len(mesh.polygons) * 3, dtype=np.float32)
+    mesh.polygons.foreach_get('normal', normals)
+    normals = normals.reshape(-1, 3)
+
+    # Island 0-5: +X, -X, +Y, -Y, +Z, -Z (polygon loops are contiguous)
+    axis = np.abs(normals).argmax(axis=1)
+    negative = normals[np.arange(len(axis)), axis] < 0
+    loop_axis = np.repeat(axis, loop_totals)
+    loop_island = np.repeat(2 * axis + negative, loop_totals)
+
+    pts = co.reshape(-1, 3)[loop_verts]
+    rows = np.arange(len(pts))[:, None]
+    uv = pts[rows, PROJECTION_AXES[loop_axis]]
+
+    # Normalize islands to their own bounds at one shared scale (uniform
+    # texel density), then place them in the grid's cells
+    lo = np.full((6, 2), np.inf, dtype=np.float32)
+    hi = np.full((6, 2), -np.inf, dtype=np.float32)
+    np.minimum.at(lo, loop_island, uv)
+    np.maximum.at(hi, loop_island, uv)
+    extent = (hi - lo)[np.isfinite(lo[:, 0])].max()  # Skip empty islands
+    scale = (1 / 3 - 2 * margin) / extent
+    cells = np.stack([np.arange(6) % 3 / 3, np.arange(6) // 3 / 2], axis=1)
+
+    uv = (uv - lo[loop_island]) * scale + cells[loop_island] + margin
+    uv_layer = mesh.uv_layers.active or mesh.uv_layers.new(name='UVMap')
+    uv_layer.data.foreach_set('uv', uv.astype(np.float32).ravel())
+
+box_project_uvs(obj.data)
 
 # --- Create procedural stone material ---
 mat = bpy.data.materials.new('StoneMaterial')
@@ -141,59 +279,175 @@ obj.data.materials.append(mat)
 
 # --- Set up Cycles for baking ---
 scene = bpy.context.scene
-scene.render.engine = 'CYCLES'
-scene.cycles.device = 'CPU'
-scene.cycles.samples = 64
+setup_cycles_bake()
+if scene.cycles.device == 'GPU':
+    print(f"[spike] Baking on GPU ({bake_backend()})")
+
+# A 512px bake is small enough to shade as one tile across all threads
+scene.render.threads_mode = 'AUTO'
+scene.cycles.use_auto_tile = False
+scene.cycles.tile_size = TEX_SIZE
 
 # Make object active and selected
 bpy.context.view_layer.objects.active = obj
 obj.select_set(True)
 
-# --- Bake helper function ---
-def bake_pass(pass_type, filename, samples=None):
-    """Bake a single PBR pass to an image."""
-    img = bpy.data.images.new(f"bake_{pass_type}", TEX_SIZE, TEX_SIZE)
-    img.colorspace_settings.name = 'sRGB' if pass_type == 'DIFFUSE' else 'Non-Color'
-
-    # Create image texture node and make it active
-    img_node = nodes.new('ShaderNodeTexImage')
-    img_node.image = img
-    img_node.location = (600, 0)
-    nodes.active = img_node  # CRITICAL: bake target must be active/selected
+# (pass type, filename, samples) of each bake. NORMAL and ROUGHNESS are
+# deterministic, and the COLOR-filtered DIFFUSE pass traces no light paths
+# (one sample reads the shader's base color exactly), so AO is the one pass
+# that needs a real sample count. Its remaining noise is blurred out after
+# the bake.
+BAKE_PASSES = (
+    ('DIFFUSE', 'spike-cube_diffuse.png', 1),
+    ('NORMAL', 'spike-cube_normal.png', 1),
+    ('ROUGHNESS', 'spike-cube_roughness.png', 1),
+    ('AO', 'spike-cube_ao.png', 16),
+)
+if ONLY_PASS not in (None, *(p[0] for p in BAKE_PASSES)):
+    print(f"ERROR: Unknown pass {ONLY_PASS!r}")
+    sys.exit(1)
 
-    if samples:
-        scene.cycles.samples = samples
+# Temp bake target node, shared by all passes (only its image changes).
+# It goes away with the procedural nodes when the material is rebuilt.
+bake_node = nodes.new('ShaderNodeTexImage')
+bake_node.location = (600, 0)
 
-    # Configure bake settings
+# --- Bake helper function ---
+def bake_pass(pass_type, img, samples):
+    """Bake a single PBR pass into img."""
+    bake_node.image = img
+    nodes.active = bake_node  # CRITICAL: bake target must be active/selected
+    scene.cycles.samples = samples
     if pass_type == 'DIFFUSE':
         bpy.ops.object.bake(type='DIFFUSE', pass_filter={'COLOR'})
-    elif pass_type == 'NORMAL':
-        scene.cycles.samples = 1
-        bpy.ops.object.bake(type='NORMAL')
-    elif pass_type == 'ROUGHNESS':
-        scene.cycles.samples = 1
-        bpy.ops.object.bake(type='ROUGHNESS')
-    elif pass_type == 'AO':
-        scene.cycles.samples = 64
-        bpy.ops.object.bake(type='AO')
-
-    # Save image
-    img.filepath_raw = os.path.join(OUTPUT_DIR, filename)
-    img.file_format = 'PNG'
-    img.save()
-    print(f"[spike] Baked {pass_type}: {filename}")
-
-    # Remove the temp image node
-    nodes.remove(img_node)
-
-    return img
+    else:
+        bpy.ops.object.bake(type=pass_type)
+
+def cache_height():
+    """Bake the FBM height field to an image and drive the Bump node from it.
+
+    Bump evaluates its height input several times per shading point, and the
+    NORMAL and AO passes shade every texel (AO once per sample). Baking the
+    8-octave noise once turns all of that into texture lookups. The base
+    color path is left procedural: the 1-sample DIFFUSE pass evaluates it
+    only once anyway.
+    """
+    img = bpy.data.images.new('bake_height', TEX_SIZE, TEX_SIZE, float_buffer=True, is_data=True)
+
+    emission = nodes.new('ShaderNodeEmission')
+    links.new(noise_fbm.outputs['Fac'], emission.inputs['Color'])
+    links.new(emission.outputs['Emission'], output.inputs['Surface'])
+    bake_pass('EMIT', img, 1)
+    nodes.remove(emission)
+    links.new(principled.outputs['BSDF'], output.inputs['Surface'])
+
+    height_node = nodes.new('ShaderNodeTexImage')
+    height_node.location = (-400, -400)
+    height_node.image = img
+    height_node.interpolation = 'Cubic'  # Smooth derivatives for Bump
+    links.new(height_node.outputs['Color'], bump.inputs['Height'])
+
+def save_png(img, grayscale=False):
+    """Write a baked image to its filepath_raw as an RGB (or grayscale) PNG.
+
+    Uses Pillow when it is importable, with fast (level 1) compression;
+    otherwise falls back to Blender's own image writer. The bakes are
+    opaque, so the alpha channel is dropped; grayscale keeps only red,
+    for single-value passes that bake the same value into R, G and B.
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        img.save()
+        return
+
+    pixels = np.empty(TEX_SIZE * TEX_SIZE * 4, dtype=np.float32)
+    img.pixels.foreach_get(pixels)
+    # Blender stores rows bottom-up
+    rgb = pixels.reshape(TEX_SIZE, TEX_SIZE, 4)[::-1, :, :3]
+    if grayscale:
+        rgb = rgb[:, :, 0]
+    data = (rgb.clip(0.0, 1.0) * 255 + 0.5).astype(np.uint8)
+    Image.fromarray(data, 'L' if grayscale else 'RGB').save(img.filepath_raw, 'PNG', compress_level=1)
+
+def bake_in_workers():
+    """Bake each pass in its own background Blender; load the saved PNGs.
+
+    The passes write independent images, so they run side by side, with
+    the CPU threads split evenly between the workers.
+    """
+    # Drop PNGs from earlier runs so a worker that writes nothing cannot
+    # pass off a stale image as this run's bake
+    for _, filename, _ in BAKE_PASSES:
+        path = os.path.join(OUTPUT_DIR, filename)
+        if os.path.exists(path):
+            os.remove(path)
+
+    threads = max(1, (os.cpu_count() or 1) // len(BAKE_PASSES))
+    procs = [
+        subprocess.Popen([
+            bpy.app.binary_path, '--background', '--factory-startup',
+            '--threads', str(threads), '--python-exit-code', '1',
+            '--python', os.path.abspath(__file__), '--', '--pass', pass_type,
+        ])
+        for pass_type, _, _ in BAKE_PASSES
+    ]
+    if any([proc.wait() for proc in procs]):
+        print("ERROR: A bake worker failed")
+        sys.exit(1)
+    missing = [filename for _, filename, _ in BAKE_PASSES
+               if not os.path.exists(os.path.join(OUTPUT_DIR, filename))]
+    if missing:
+        print(f"ERROR: Bake workers did not write {', '.join(missing)}")
+        sys.exit(1)
+
+    images = {}
+    for pass_type, filename, _ in BAKE_PASSES:
+        img = bpy.data.images.load(os.path.join(OUTPUT_DIR, filename))
+        if pass_type != 'DIFFUSE':
+            img.colorspace_settings.name = 'Non-Color'
+        images[pass_type] = img
+    return images
 
 # --- Bake all PBR passes ---
 print("[spike] Baking PBR textures...")
-img_diffuse = bake_pass('DIFFUSE', 'spike-cube_diffuse.png')
-img_normal = bake_pass('NORMAL', 'spike-cube_normal.png', samples=1)
-img_roughness = bake_pass('ROUGHNESS', 'spike-cube_roughness.png', samples=1)
-img_ao = bake_pass('AO', 'spike-cube_ao.png', samples=64)
+if PARALLEL:
+    bake_images = bake_in_workers()
+else:
+    # Only the passes that read the bumped normal use the cached height
+    if ONLY_PASS in (None, 'NORMAL', 'AO'):
+        cache_height()
+    bake_images = {}
+    passes = [p for p in BAKE_PASSES if ONLY_PASS in (None, p[0])]
+    for pass_type, filename, _ in passes:
+        # 8-bit targets; everything but DIFFUSE is non-color data
+        img = bpy.data.images.new(f"bake_{pass_type}", TEX_SIZE, TEX_SIZE,
+                                  float_buffer=False, is_data=pass_type != 'DIFFUSE')
+        img.filepath_raw = os.path.join(OUTPUT_DIR, filename)
+        img.file_format = 'PNG'
+        bake_images[pass_type] = img
+
+    for pass_type, filename, samples in passes:
+        img = bake_images[pass_type]
+        bake_pass(pass_type, img, samples)
+        if pass_type == 'AO':
+            denoise_ao(img)
+        # The parent saves diffuse once AO is multiplied in
+        if ONLY_PASS or pass_type != 'DIFFUSE':
+            save_png(img, grayscale=pass_type in ('ROUGHNESS', 'AO'))
+        print(f"[spike] Baked {pass_type}: {filename}")
+
+# A --pass worker only saves its texture; the parent exports
+if ONLY_PASS:
+    sys.exit(0)
+
+img_diffuse = bake_images['DIFFUSE']
+img_normal = bake_images['NORMAL']
+img_roughness = bake_images['ROUGHNESS']
+
+# --- Premultiply AO into diffuse (one texture fewer in the GLB) ---
+premultiply_ao(img_diffuse, bake_images['AO'])
+save_png(img_diffuse)
 
 # --- Replace procedural material with baked textures for export ---
 # Clear all nodes and rebuild with image textures
@@ -209,7 +463,7 @@ principled.inputs['Specular IOR Level'].default_value = 0.3
 principled.inputs['Metallic'].default_value = 0.0
 links.new(principled.outputs['BSDF'], output.inputs['Surface'])
 
-# Diffuse texture
+# Diffuse texture (AO premultiplied)
 diffuse_node = nodes.new('ShaderNodeTexImage')
 diffuse_node.location = (-300, 200)
 diffuse_node.image = img_diffuse
@@ -234,49 +488,168 @@ rough_tex.image = img_roughness
 rough_tex.image.colorspace_settings.name = 'Non-Color'
 links.new(rough_tex.outputs['Color'], principled.inputs['Roughness'])
 
-# AO - multiply into diffuse
-ao_tex = nodes.new('ShaderNodeTexImage')
-ao_tex.location = (-500, 100)
-ao_tex.image = img_ao
-ao_tex.image.colorspace_settings.name = 'Non-Color'
-
-ao_mix = nodes.new('ShaderNodeMix')
-ao_mix.location = (-100, 200)
-ao_mix.data_type = 'RGBA'
-ao_mix.blend_type = 'MULTIPLY'
-ao_mix.inputs['Factor'].default_value = 1.0
-links.new(diffuse_node.outputs['Color'], ao_mix.inputs[6])
-links.new(ao_tex.outputs['Color'], ao_mix.inputs[7])
-links.new(ao_mix.outputs[2], principled.inputs['Base Color'])
-
 # --- Apply transforms before export ---
-bpy.ops.object.transform_apply(location=False, rotation=True, scale=True)
+# Bake rotation and scale into the vertices (data API, no operator)
+obj.data.transform(obj.matrix_basis.to_3x3().to_4x4())
+obj.rotation_euler = (0, 0, 0)
+obj.scale = (1, 1, 1)
 
 # --- Set origin to base center ---
-# Move origin to bottom center of bounding box
-bpy.ops.object.origin_set(type='ORIGIN_GEOMETRY', center='BOUNDS')
-# Now move origin down to base
-bbox = obj.bound_box
-min_z = min(v[2] for v in bbox)
-obj.location.z -= min_z * obj.scale.z
+# Shift the vertices so the origin sits at the bottom center of their
+# bounds, and keep the object standing on z=0
+mesh = obj.data
+co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+mesh.vertices.foreach_get('co', co)
+co = co.reshape(-1, 3)
+lo, hi = co.min(axis=0), co.max(axis=0)
+base = np.array(((lo[0] + hi[0]) / 2, (lo[1] + hi[1]) / 2, lo[2]), dtype=np.float32)
+mesh.vertices.foreach_set('co', (co - base).ravel())
+mesh.update()
+obj.location.x += float(base[0])
+obj.location.y += float(base[1])
+obj.location.z = 0
+
+# Count triangles from the mesh still in memory, before export
+loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+mesh.polygons.foreach_get('loop_total', loop_totals)
+tri_count = int((loop_totals - 2).sum())
 
 # --- Export GLB ---
-print(f"[spike] Exporting GLB to {OUTPUT_PATH}")
-bpy.ops.export_scene.gltf(
-    filepath=OUTPUT_PATH,
-    export_format='GLB',
-    use_selection=True,
-    export_apply=True,
-    export_tangents=True,
-    export_yup=True,
-)
+def glb_bytes(positions, normals, uvs, indices, translation, textures):
+    """Pack one textured triangle mesh into a binary glTF 2.0 file.
+
+    Vertex arrays are glTF-space (Y-up) float32 and `textures` maps a
+    material slot (baseColor, metallicRoughness, normal) to PNG bytes.
+    """
+    chunks, views, accessors = [], [], []
+
+    def add_view(data, target=None):
+        offset = sum(len(c) for c in chunks)
+        chunks.append(data + b'\0' * (-len(data) % 4))
+        views.append({'buffer': 0, 'byteOffset': offset, 'byteLength': len(data)})
+        if target:
+            views[-1]['target'] = target
+        return len(views) - 1
+
+    def add_accessor(array, kind, component, target, bounds=False):
+        accessors.append({
+            'bufferView': add_view(array.tobytes(), target),
+            'componentType': component, 'count': len(array), 'type': kind,
+        })
+        if bounds:
+            accessors[-1]['min'] = array.min(axis=0).tolist()
+            accessors[-1]['max'] = array.max(axis=0).tolist()
+        return len(accessors) - 1
+
+    index_dtype, index_component = (np.uint16, 5123) if len(positions) < 65536 else (np.uint32, 5125)
+    attributes = {
+        'POSITION': add_accessor(positions, 'VEC3', 5126, 34962, bounds=True),
+        'NORMAL': add_accessor(normals, 'VEC3', 5126, 34962),
+        'TEXCOORD_0': add_accessor(uvs, 'VEC2', 5126, 34962),
+    }
+    index_accessor = add_accessor(indices.astype(index_dtype), 'SCALAR', index_component, 34963)
+
+    slots = list(textures)
+    images = [{'bufferView': add_view(textures[slot]), 'mimeType': 'image/png'} for slot in slots]
+    material = {
+        'name': 'StoneMaterial',
+        'pbrMetallicRoughness': {'metallicFactor': 0.0},
+    }
+    for i, slot in enumerate(slots):
+        if slot == 'normal':
+            material['normalTexture'] = {'index': i}
+        else:
+            material['pbrMetallicRoughness'][f'{slot}Texture'] = {'index': i}
+
+    binary = b''.join(chunks)
+    gltf = {
+        'asset': {'version': '2.0', 'generator': 'spike_test.py'},
+        'scene': 0,
+        'scenes': [{'nodes': [0]}],
+        'nodes': [{'name': 'spike_cube', 'mesh': 0, 'translation': translation}],
+        'meshes': [{'primitives': [{
+            'attributes': attributes, 'indices': index_accessor, 'material': 0,
+        }]}],
+        'materials': [material],
+        'textures': [{'sampler': 0, 'source': i} for i in range(len(images))],
+        'samplers': [{'magFilter': 9729, 'minFilter': 9987, 'wrapS': 10497, 'wrapT': 10497}],
+        'images': images,
+        'accessors': accessors,
+        'bufferViews': views,
+        'buffers': [{'byteLength': len(binary)}],
+    }
+    json_chunk = json.dumps(gltf, separators=(',', ':')).encode()
+    json_chunk += b' ' * (-len(json_chunk) % 4)
+    return b''.join([
+        struct.pack('<4sII', b'glTF', 2, 28 + len(json_chunk) + len(binary)),
+        struct.pack('<I4s', len(json_chunk), b'JSON'), json_chunk,
+        struct.pack('<I4s', len(binary), b'BIN\0'), binary,
+    ])
+
+def write_direct_glb(path):
+    """Write the cube and its baked PNGs as a GLB without the glTF add-on.
+
+    Every face corner becomes its own vertex (UVs and flat normals are
+    per corner) and polygons are fanned into triangles.
+    """
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', co)
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get('vertex_index', loop_verts)
+    loop_starts = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get('loop_start', loop_starts)
+    normals = np.empty(len(mesh.loops) * 3, dtype=np.float32)
+    if hasattr(mesh, 'corner_normals'):
+        mesh.corner_normals.foreach_get('vector', normals)
+    else:  # Blender 4.0: split normals are computed on request
+        mesh.calc_normals_split()
+        mesh.loops.foreach_get('normal', normals)
+    uvs = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+    mesh.uv_layers.active.data.foreach_get('uv', uvs)
+
+    # Blender Z-up to glTF Y-up: (x, y, z) -> (x, z, -y); glTF V runs downwards
+    y_up = np.array(((1, 0, 0), (0, 0, -1), (0, 1, 0)), dtype=np.float32)
+    positions = co.reshape(-1, 3)[loop_verts] @ y_up
+    normals = normals.reshape(-1, 3) @ y_up
+    uvs = uvs.reshape(-1, 2)
+    uvs[:, 1] = 1 - uvs[:, 1]
+
+    # Fan triangulation: corners (s, s + k, s + k + 1) for k in 1..n-2
+    fans = loop_totals - 2
+    fan_starts = np.repeat(loop_starts, fans)
+    fan_k = np.arange(len(fan_starts)) - np.repeat(np.cumsum(fans) - fans, fans) + 1
+    indices = np.stack([fan_starts, fan_starts + fan_k, fan_starts + fan_k + 1], axis=1).ravel()
+
+    textures = {}
+    for slot, img in (('baseColor', img_diffuse), ('metallicRoughness', img_roughness), ('normal', img_normal)):
+        with open(img.filepath_raw, 'rb') as f:
+            textures[slot] = f.read()
+
+    loc = obj.location
+    data = glb_bytes(positions, normals, uvs, indices, [loc.x, loc.z, -loc.y], textures)
+    with open(path, 'wb') as f:
+        f.write(data)
 
-# Check file size
+print(f"[spike] Exporting GLB to {OUTPUT_PATH}")
+if DIRECT_GLB:
+    write_direct_glb(OUTPUT_PATH)
+else:
+    bpy.ops.export_scene.gltf(
+        filepath=OUTPUT_PATH,
+        export_format='GLB',
+        use_selection=True,
+        export_apply=True,
+        export_tangents=EXPORT_TANGENTS,
+        export_yup=True,
+    )
+
+with open(HASH_PATH, 'w') as f:
+    f.write(BUILD_KEY + '\n')
+
+# Report file size and tri count (a stat call and a print: nothing left to
+# take off the main thread)
 file_size = os.path.getsize(OUTPUT_PATH)
 print(f"[spike] GLB size: {file_size / 1024:.1f} KB")
-
-# Report tri count
-tri_count = sum(len(p.vertices) - 2 for p in obj.data.polygons)
 print(f"[spike] Triangle count: {tri_count}")
 
 elapsed = time.time() - start_time